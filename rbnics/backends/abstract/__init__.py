@@ -8,6 +8,7 @@ from rbnics.backends.abstract.abs import abs
 from rbnics.backends.abstract.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.abstract.assign import assign
 from rbnics.backends.abstract.basis_functions_matrix import BasisFunctionsMatrix
+from rbnics.backends.abstract.content_hash import content_hash
 from rbnics.backends.abstract.copy import copy
 from rbnics.backends.abstract.eigen_solver import EigenSolver
 from rbnics.backends.abstract.evaluate import evaluate
@@ -48,6 +49,7 @@ __all__ = [
     "AffineExpansionStorage",
     "assign",
     "BasisFunctionsMatrix",
+    "content_hash",
     "copy",
     "EigenSolver",
     "evaluate",
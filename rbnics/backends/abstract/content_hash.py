@@ -0,0 +1,14 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import abstract_backend
+
+
+# Compute a hash of the content of a function space, form, boundary condition or function, which does not
+# depend on python object identifiers and thus can be compared across runs and across problem instances
+@abstract_backend
+def content_hash(arg):
+    pass
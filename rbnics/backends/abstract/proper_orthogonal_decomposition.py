@@ -18,6 +18,11 @@ class ProperOrthogonalDecomposition(object, metaclass=ABCMeta):
     def clear(self):
         pass
 
+    # Set parameters of the POD algorithm
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
     # Store a snapshot in the snapshot matrix
     @abstractmethod
     def store_snapshot(self, snapshot, component=None, weight=None):
@@ -5,7 +5,10 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import abs, cumsum as compute_retained_energy, isclose, sum as compute_total_energy
+from numpy import (abs, asarray, cumsum as compute_retained_energy, diag, eye, hstack, isclose,
+                   sum as compute_total_energy, trace, vstack, zeros)
+from numpy.linalg import eigh, qr, svd
+from numpy.random import default_rng
 from rbnics.utils.io import ExportableList
 
 
@@ -26,45 +29,223 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             # Declare a list to store eigenvalues
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            # Declare parameters of the POD algorithm:
+            # * "method" is either "eigensolver", to compute all eigenvalues of the correlation matrix,
+            #   "randomized", to compute only the leading ones by a randomized range finder, or "incremental",
+            #   to update a truncated basis every time a snapshot is stored, without keeping all snapshots
+            # * "correlation" is either "assembled", to assemble the correlation matrix when applying the POD,
+            #   or "streaming", to update it every time a snapshot is stored
+            # * "oversampling", "power iterations" and "seed" are only used by the randomized method
+            # * "rank" is the maximum number of modes retained by the incremental method (None for no limit)
+            self.parameters = {
+                "method": "eigensolver",
+                "correlation": "assembled",
+                "oversampling": 10,
+                "power iterations": 1,
+                "seed": None,
+                "rank": None
+            }
+            # Correlation matrix, stored as a dense array, in case of streaming correlation
+            self._correlation = None
+            # Gram matrix of the stored snapshots, coefficients of the current modes with respect to the
+            # stored snapshots, singular values and total energy, in case of incremental method
+            self._incremental_gram = None
+            self._incremental_coefficients = None
+            self._incremental_singular_values = None
+            self._incremental_total_energy = 0.
+
+        def set_parameters(self, parameters):
+            self.parameters.update(parameters)
+            assert self.parameters["method"] in ("eigensolver", "randomized", "incremental")
+            assert self.parameters["correlation"] in ("assembled", "streaming")
+            assert not (self.parameters["method"] == "incremental" and self.parameters["correlation"] == "streaming")
+            assert self.parameters["oversampling"] >= 0
+            assert self.parameters["power iterations"] >= 0
+            assert self.parameters["rank"] is None or self.parameters["rank"] > 0
 
         def clear(self):
             self.snapshots_matrix.clear()
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            self._correlation = None
+            self._incremental_gram = None
+            self._incremental_coefficients = None
+            self._incremental_singular_values = None
+            self._incremental_total_energy = 0.
 
         # No implementation is provided for store_snapshot, because
         # it has different interface for the standard POD and
-        # the tensor one.
+        # the tensor one. Implementations should however call
+        # _postprocess_stored_snapshots after storing the snapshot.
+
+        def _postprocess_stored_snapshots(self):
+            if self.parameters["method"] == "incremental":
+                self._update_incremental_basis()
+            elif self.parameters["correlation"] == "streaming":
+                self._update_streaming_correlation()
+
+        def _update_streaming_correlation(self):
+            if self.parameters["correlation"] != "streaming":
+                return
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+
+            n_old = self._correlation.shape[0] if self._correlation is not None else 0
+            n = len(snapshots_matrix)
+            if n == n_old:
+                return
+            correlation = zeros((n, n))
+            if n_old > 0:
+                correlation[:n_old, :n_old] = self._correlation
+            for j in range(n_old, n):
+                # Only compute the columns associated to new snapshots, and the corresponding rows by symmetry
+                if inner_product is not None:
+                    correlation_j = asarray(transpose(snapshots_matrix) * inner_product * snapshots_matrix[j])
+                else:
+                    correlation_j = asarray(transpose(snapshots_matrix) * snapshots_matrix[j])
+                correlation[:, j] = correlation_j
+                correlation[j, :] = correlation_j
+            self._correlation = correlation
+
+        # Update the truncated basis with the snapshots stored since the previous update, by rank one updates
+        # of its singular value decomposition, see Brand, Linear Algebra Appl. 415(1), 2006. Modes are stored
+        # as linear combinations of the snapshots matrix, which is periodically compressed so that it only
+        # contains the current modes, and thus never stores more than twice the number of retained modes.
+        def _update_incremental_basis(self):
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+
+            if self._incremental_gram is None:
+                self._incremental_gram = zeros((0, 0))
+                self._incremental_coefficients = zeros((0, 0))
+                self._incremental_singular_values = zeros(0)
+            n_old = self._incremental_gram.shape[0]
+            n = len(snapshots_matrix)
+            if n == n_old:
+                return
+            gram = zeros((n, n))
+            gram[:n_old, :n_old] = self._incremental_gram
+            coefficients = self._incremental_coefficients
+            singular_values = self._incremental_singular_values
+            for j in range(n_old, n):
+                if inner_product is not None:
+                    gram_j = asarray(transpose(snapshots_matrix) * inner_product * snapshots_matrix[j])
+                else:
+                    gram_j = asarray(transpose(snapshots_matrix) * snapshots_matrix[j])
+                gram[:j + 1, j] = gram_j[:j + 1]
+                gram[j, :j + 1] = gram_j[:j + 1]
+                self._incremental_total_energy += abs(gram_j[j])
+                # Project the new snapshot onto the current modes, and compute the norm of the remainder
+                r = len(singular_values)
+                projection = coefficients.T @ gram_j[:j]
+                remainder_norm = sqrt(max(gram_j[j] - projection @ projection, 0.))
+                coefficients = vstack((coefficients, zeros((1, r))))
+                if remainder_norm > 1.e-10 * sqrt(abs(gram_j[j])):
+                    remainder = - coefficients @ projection
+                    remainder[j] += 1.
+                    remainder /= remainder_norm
+                    K = zeros((r + 1, r + 1))
+                    K[:r, :r] = diag(singular_values)
+                    K[:r, r] = projection
+                    K[r, r] = remainder_norm
+                    coefficients = hstack((coefficients, remainder[:, None]))
+                elif r > 0:
+                    K = zeros((r, r + 1))
+                    K[:r, :r] = diag(singular_values)
+                    K[:r, r] = projection
+                else:
+                    continue  # trivial case, the current snapshot and all previous ones are zero
+                (K_U, singular_values, _) = svd(K, full_matrices=False)
+                coefficients = coefficients @ K_U
+                # Truncate
+                rank = len(singular_values)
+                if self.parameters["rank"] is not None:
+                    rank = min(rank, self.parameters["rank"])
+                while rank > 0 and singular_values[rank - 1] <= 1.e-14 * singular_values[0]:
+                    rank -= 1
+                coefficients = coefficients[:, :rank]
+                singular_values = singular_values[:rank]
+            self._incremental_gram = gram
+            self._incremental_coefficients = coefficients
+            self._incremental_singular_values = singular_values
+            # Compress the snapshots matrix if it contains too many snapshots not required to represent the modes
+            rank = len(singular_values)
+            if rank == 0:  # trivial case, all snapshots are zero
+                self.snapshots_matrix.clear()
+                self._incremental_gram = zeros((0, 0))
+                self._incremental_coefficients = zeros((0, 0))
+            elif n > 2 * rank:
+                coefficients_online = online_backend.OnlineMatrix(n, rank)
+                coefficients_online[:, :] = coefficients
+                self.snapshots_matrix = self.snapshots_matrix * coefficients_online
+                if inner_product is not None:
+                    self._incremental_gram = asarray(
+                        transpose(self.snapshots_matrix) * inner_product * self.snapshots_matrix)
+                else:
+                    self._incremental_gram = asarray(transpose(self.snapshots_matrix) * self.snapshots_matrix)
+                self._incremental_coefficients = eye(rank)
 
         def apply(self, Nmax, tol):
+            if self.parameters["method"] == "incremental":
+                self._update_incremental_basis()
+
             inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
             transpose = backend.transpose
 
-            if inner_product is not None:
+            if self.parameters["correlation"] == "streaming":
+                self._update_streaming_correlation()
+                Neigs = len(self.snapshots_matrix)
+                correlation = online_backend.OnlineMatrix(Neigs, Neigs)
+                correlation[:, :] = self._correlation
+            elif self.parameters["method"] in ("randomized", "incremental"):
+                correlation = None  # the correlation matrix is never assembled
+            elif inner_product is not None:
                 correlation = transpose(snapshots_matrix) * inner_product * snapshots_matrix
             else:
                 correlation = transpose(snapshots_matrix) * snapshots_matrix
 
             basis_functions = BasisContainerType(self.space, *self.args)
 
-            eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
-            parameters = {
-                "problem_type": "hermitian",
-                "spectrum": "largest real"
-            }
-            eigensolver.set_parameters(parameters)
-            eigensolver.solve()
-
-            Neigs = len(self.snapshots_matrix)
-            Nmax = min(Nmax, Neigs)
             assert len(self.eigenvalues) == 0
-            for i in range(Neigs):
-                (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
-                assert isclose(eig_i_complex, 0.)
-                self.eigenvalues.append(eig_i_real)
+            if self.parameters["method"] in ("randomized", "incremental"):
+                if self.parameters["method"] == "randomized":
+                    (eigenvalues, eigenvectors_array, total_energy) = self._randomized_eigendecomposition(
+                        Nmax, correlation)
+                else:
+                    eigenvalues = [float(s**2) for s in self._incremental_singular_values]
+                    eigenvectors_array = self._incremental_coefficients
+                    total_energy = self._incremental_total_energy
+                Neigs = len(eigenvalues)
+                self.eigenvalues.extend(eigenvalues)
 
-            total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
+                def get_eigenvector(N):
+                    eigvector = online_backend.OnlineVector(len(self.snapshots_matrix))
+                    eigvector[:] = eigenvectors_array[:, N]
+                    return online_backend.OnlineFunction(eigvector)
+            else:
+                eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
+                parameters = {
+                    "problem_type": "hermitian",
+                    "spectrum": "largest real"
+                }
+                eigensolver.set_parameters(parameters)
+                eigensolver.solve()
+
+                Neigs = len(self.snapshots_matrix)
+                for i in range(Neigs):
+                    (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
+                    assert isclose(eig_i_complex, 0.)
+                    self.eigenvalues.append(eig_i_real)
+                total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
+
+                def get_eigenvector(N):
+                    (eigvector, _) = eigensolver.get_eigenvector(N)
+                    return eigvector
+
+            Nmax = min(Nmax, Neigs)
             retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
             assert len(self.retained_energy) == 0
             if total_energy > 0.:
@@ -74,8 +255,9 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
                 self.retained_energy.extend([1. for _ in range(Neigs)])  # trivial case, all snapshots are zero
 
             eigenvectors = list()
-            for N in range(Nmax):
-                (eigvector, _) = eigensolver.get_eigenvector(N)
+            N = 0  # Nmax may be zero, e.g. if the randomized or incremental methods returned no eigenvalues
+            while N < Nmax:
+                eigvector = get_eigenvector(N)
                 eigenvectors.append(eigvector)
                 b = self.snapshots_matrix * eigvector
                 if inner_product is not None:
@@ -85,15 +267,64 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
                 if norm_b != 0.:
                     b /= norm_b
                 basis_functions.enrich(b)
-                if self.retained_energy[N] > 1. - tol:
+                N += 1
+                if self.retained_energy[N - 1] > 1. - tol:
                     break
-            N += 1
 
             return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
 
+        # Compute the leading eigenvalues and eigenvectors of the correlation matrix by a randomized range finder,
+        # see Halko, Martinsson and Tropp, SIAM Review 53(2), 2011. If the correlation matrix has not been assembled,
+        # its action is computed through the snapshots matrix, so that only products with Nmax + oversampling
+        # linear combinations of snapshots are required. Also returns the total energy, i.e. the trace of the
+        # correlation matrix, so that retained energy can be computed without computing all eigenvalues.
+        def _randomized_eigendecomposition(self, Nmax, correlation=None):
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+            n = len(snapshots_matrix)
+            if n == 0:
+                return (list(), zeros((0, 0)), 0.)  # trivial case, no snapshots have been stored
+            k = min(Nmax + self.parameters["oversampling"], n)
+
+            if correlation is not None:
+                correlation = asarray(correlation)
+
+                def correlation_mul(Q):
+                    return correlation @ Q
+
+                total_energy = trace(correlation)
+            else:
+                def correlation_mul(Q):
+                    Q_online = online_backend.OnlineMatrix(n, Q.shape[1])
+                    Q_online[:, :] = Q
+                    snapshots_matrix_times_Q = snapshots_matrix * Q_online
+                    if inner_product is not None:
+                        return asarray(transpose(snapshots_matrix) * inner_product * snapshots_matrix_times_Q)
+                    else:
+                        return asarray(transpose(snapshots_matrix) * snapshots_matrix_times_Q)
+
+                total_energy = 0.
+                for snapshot in snapshots_matrix:
+                    if inner_product is not None:
+                        total_energy += transpose(snapshot) * inner_product * snapshot
+                    else:
+                        total_energy += transpose(snapshot) * snapshot
+
+            random_generator = default_rng(self.parameters["seed"])
+            Y = correlation_mul(random_generator.standard_normal((n, k)))
+            for _ in range(self.parameters["power iterations"]):
+                (Q, _) = qr(Y)
+                Y = correlation_mul(Q)
+            (Q, _) = qr(Y)
+            B = Q.T @ correlation_mul(Q)
+            (eigs, eigv) = eigh(0.5 * (B + B.T))
+            idx = eigs.argsort()[::-1]  # sort by decreasing value
+            return ([float(e) for e in eigs[idx]], Q @ eigv[:, idx], float(abs(total_energy)))
+
         def print_eigenvalues(self, N=None):
             if N is None:
-                N = len(self.snapshots_matrix)
+                N = len(self.eigenvalues)
             for i in range(N):
                 print("lambda_" + str(i) + " = " + str(self.eigenvalues[i]))
 
@@ -0,0 +1,108 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import hashlib
+from numpy import array
+from ufl import Form
+from dolfin import Constant, DirichletBC, Expression, FunctionSpace, Mesh
+from rbnics.backends.dolfin.function import Function
+from rbnics.backends.dolfin.wrapping import is_problem_solution, is_problem_solution_dot, is_problem_solution_type
+from rbnics.utils.cache import Cache
+from rbnics.utils.decorators import backend_for, list_of, overload
+
+
+# Compute a hash of the content of a function space, form, boundary condition or function, which does not
+# depend on python object identifiers and thus can be compared across runs and across problem instances
+@backend_for("dolfin", inputs=((Constant, Expression, Form, FunctionSpace, Function.Type(), list_of(DirichletBC)), ))
+def content_hash(arg):
+    return _content_hash(arg)
+
+
+@overload
+def _content_hash(mesh: Mesh):
+    try:
+        return _mesh_content_hash_cache[mesh.id()]
+    except KeyError:
+        mesh_hash = _parallel_hash(mesh.mpi_comm(), mesh.coordinates(), mesh.cells())
+        _mesh_content_hash_cache[mesh.id()] = mesh_hash
+        return mesh_hash
+
+
+_mesh_content_hash_cache = Cache()
+
+
+@overload
+def _content_hash(V: FunctionSpace):
+    return _hash(_content_hash(V.mesh()), repr(V.ufl_element()), str(V.dim()))
+
+
+@overload
+def _content_hash(function: Function.Type()):
+    return _hash(
+        _content_hash(function.function_space()),
+        _parallel_hash(function.function_space().mesh().mpi_comm(), function.vector().get_local()))
+
+
+@overload
+def _content_hash(constant: Constant):
+    return _hash(str(constant.values()))
+
+
+@overload
+def _content_hash(expression: Expression):
+    # Parametrized expressions change their parameters with mu: only account for their code and for
+    # non parametrized parameters
+    parameters = sorted((key, str(value)) for (key, value) in expression._parameters.items()
+                        if not key.startswith("mu_"))
+    return _hash(str(expression._cppcode), str(parameters))
+
+
+@overload
+def _content_hash(form: Form):
+    # The form signature is independent of object identifiers, and accounts for the form structure, measures
+    # and elements, but not for the mesh and for coefficient values
+    hashes = [form.signature()]
+    for domain in form.ufl_domains():
+        hashes.append(_content_hash(domain.ufl_cargo()))
+    for integral in form.integrals():
+        subdomain_data = integral.subdomain_data()
+        if subdomain_data is not None and hasattr(subdomain_data, "array"):
+            hashes.append(_parallel_hash(subdomain_data.mesh().mpi_comm(), subdomain_data.array()))
+    for coefficient in form.coefficients():
+        if isinstance(coefficient, (Constant, Expression)):
+            hashes.append(_content_hash(coefficient))
+        elif is_problem_solution_type(coefficient):
+            if is_problem_solution(coefficient) or is_problem_solution_dot(coefficient):
+                # Values of problem solutions change from one solve to the other, and their function space
+                # is already accounted for in the form signature
+                pass
+            else:
+                hashes.append(_content_hash(coefficient))
+        else:
+            hashes.append(type(coefficient).__name__)
+    return _hash(*hashes)
+
+
+@overload
+def _content_hash(bcs: list_of(DirichletBC)):
+    hashes = list()
+    for bc in bcs:
+        boundary_values = bc.get_boundary_values()
+        boundary_dofs = array(sorted(boundary_values.keys()), dtype="int64")
+        hashes.append(_parallel_hash(
+            bc.function_space().mesh().mpi_comm(), boundary_dofs, array([boundary_values[d] for d in boundary_dofs])))
+    return _hash(*hashes)
+
+
+def _hash(*strings):
+    return hashlib.sha1("".join(strings).encode("utf-8")).hexdigest()
+
+
+def _parallel_hash(mpi_comm, *arrays):
+    local_hash = hashlib.sha1()
+    for a in arrays:
+        local_hash.update(a.tobytes())
+    return _hash(*mpi_comm.allgather(local_hash.hexdigest()))
@@ -11,7 +11,7 @@ from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicHigh
 from rbnics.backends.dolfin.tensor_snapshots_list import TensorSnapshotsList
 from rbnics.backends.dolfin.tensor_basis_list import TensorBasisList
 from rbnics.backends.dolfin.wrapping import get_mpi_comm
-from rbnics.backends.online import OnlineEigenSolver
+from rbnics.backends.online import OnlineEigenSolver, OnlineFunction, OnlineMatrix, OnlineVector
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 
@@ -23,7 +23,8 @@ def transpose(arg):
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver)
+online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver, OnlineFunction=OnlineFunction,
+                               OnlineMatrix=OnlineMatrix, OnlineVector=OnlineVector)
 online_wrapping = ModuleWrapper()
 HighOrderProperOrthogonalDecomposition_Base = BasicHighOrderProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractHighOrderProperOrthogonalDecomposition,
@@ -37,3 +38,4 @@ class HighOrderProperOrthogonalDecomposition(HighOrderProperOrthogonalDecomposit
 
     def store_snapshot(self, snapshot):
         self.snapshots_matrix.enrich(snapshot)
+        self._postprocess_stored_snapshots()
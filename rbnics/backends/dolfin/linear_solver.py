@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from collections import namedtuple
+from weakref import WeakKeyDictionary
 from ufl import Form
 from dolfin import assemble, DirichletBC, PETScLUSolver
 from rbnics.backends.abstract import LinearSolver as AbstractLinearSolver, LinearProblemWrapper
@@ -13,6 +15,7 @@ from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTensorFactory
 from rbnics.backends.dolfin.vector import Vector
 from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
+from rbnics.backends.dolfin.wrapping.get_petsc_object_state import get_petsc_object_state
 from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
 
 
@@ -27,6 +30,8 @@ class LinearSolver(AbstractLinearSolver):
                dict_of(str, ProductOutputDirichletBC), None))
     def __init__(self, lhs, solution, rhs, bcs=None):
         self.solution = solution
+        self._original_lhs = lhs
+        self._bcs = bcs
         self._init_lhs(lhs, bcs)
         self._init_rhs(rhs, bcs)
         self._apply_bcs(bcs)
@@ -104,7 +109,42 @@ class LinearSolver(AbstractLinearSolver):
         self._linear_solver = parameters.get("linear_solver", "default")
 
     def solve(self):
-        solver = PETScLUSolver(self._linear_solver)
-        solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        solver = self._get_factorized_solver()
+        if solver is None:
+            solver = PETScLUSolver(self._linear_solver)
+            solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        else:
+            solver.solve(self.solution.vector(), self.rhs)
         if self.monitor is not None:
             self.monitor(self.solution)
+
+    def _get_factorized_solver(self):
+        # Factorizations are only stored when the lhs is provided as an already assembled matrix, since this
+        # is the case in which the same lhs is typically used for several solves (e.g. the inner product
+        # matrix used for Riesz representations at every greedy iteration)
+        lhs = self._original_lhs
+        if not isinstance(lhs, Matrix.Type()):
+            return None
+        state = get_petsc_object_state(lhs)
+        if state is None:
+            return None
+        try:
+            factorizations = _factorizations.setdefault(lhs, dict())
+        except TypeError:  # lhs does not support weak references
+            return None
+        key = (id(self._bcs), self._linear_solver)
+        factorization = factorizations.get(key)
+        if factorization is None or factorization.bcs is not self._bcs or factorization.state != state:
+            # Setting the operator once allows PETSc to compute the factorization at the first solve,
+            # and to reuse it for all subsequent solves
+            solver = PETScLUSolver(self._linear_solver)
+            solver.set_operator(self.lhs)
+            factorization = _Factorization(self._bcs, state, solver)
+            factorizations[key] = factorization
+        return factorization.solver
+
+
+# Storage of the factorized solvers, associated to each lhs matrix: stored factorizations are discarded
+# as soon as the corresponding matrix is deleted, and are recomputed if the matrix is changed
+_factorizations = WeakKeyDictionary()
+_Factorization = namedtuple("_Factorization", ["bcs", "state", "solver"])
@@ -4,7 +4,15 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from collections import namedtuple
+from weakref import ref, WeakKeyDictionary
+from mpi4py.MPI import IN_PLACE, SUM
+from numpy import asarray, asfortranarray, concatenate, zeros
+from petsc4py import PETSc
 from dolfin import Function, FunctionSpace
+from rbnics.backends.dolfin.wrapping.functions_list_mul import functions_to_local_array, local_array_to_function
+from rbnics.backends.dolfin.wrapping.get_petsc_object_state import get_petsc_object_state
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 
 
 def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matrix, BasisFunctionsMatrixType):
@@ -13,35 +21,150 @@ def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matr
 
     output = BasisFunctionsMatrixType(space)
     assert isinstance(online_matrix.M, dict)
-    j = 0
-    for col_component_name in basis_functions_matrix._components_name:
-        for _ in range(online_matrix.M[col_component_name]):
-            assert len(online_matrix[:, j]) == sum(
-                len(functions_list) for functions_list in basis_functions_matrix._components)
-            output_j = Function(space)
-            i = 0
-            for row_component_name in basis_functions_matrix._components_name:
-                for fun_i in basis_functions_matrix._components[row_component_name]:
-                    output_j.vector().add_local(fun_i.vector().get_local() * online_matrix[i, j])
-                    i += 1
-            output_j.vector().apply("add")
-            output.enrich(output_j)
-            j += 1
-    return output
+    functions = _functions(basis_functions_matrix)
+    if len(functions) == 0:
+        for col_component_name in basis_functions_matrix._components_name:
+            for _ in range(online_matrix.M[col_component_name]):
+                output.enrich(Function(space))
+        return output
+    else:
+        online_matrix = asarray(online_matrix, dtype=float)
+        assert online_matrix.shape[0] == len(functions)
+        local_array = functions_to_local_array(functions)
+        for output_j_local in online_matrix.T.dot(local_array):
+            output.enrich(local_array_to_function(space, output_j_local))
+        return output
 
 
 def basis_functions_matrix_mul_online_vector(basis_functions_matrix, online_vector):
     space = basis_functions_matrix.space
     assert isinstance(space, FunctionSpace)
 
-    output = Function(space)
     if sum(basis_functions_matrix._component_name_to_basis_component_length.values()) == 0:
-        return output
+        return Function(space)
     else:
-        i = 0
-        for component_name in basis_functions_matrix._components_name:
-            for fun_i in basis_functions_matrix._components[component_name]:
-                output.vector().add_local(fun_i.vector().get_local() * online_vector[i])
-                i += 1
-        output.vector().apply("add")
+        functions = _functions(basis_functions_matrix)
+        online_vector = asarray(online_vector, dtype=float)[:len(functions)]
+        local_array = functions_to_local_array(functions)
+        return local_array_to_function(space, online_vector.dot(local_array))
+
+
+def _functions(basis_functions_matrix):
+    return [fun for component_name in basis_functions_matrix._components_name
+            for fun in basis_functions_matrix._components[component_name]]
+
+
+def basis_functions_matrix_transpose_mul_vector(basis_functions_matrix, vector):
+    # Compute Z^T v as a single product between the (N x n_local_dofs) array of the local values of the basis
+    # functions and the local values of v, followed by a single reduction over processes
+    functions = _functions(basis_functions_matrix)
+    output = zeros(len(functions))
+    if len(functions) > 0:
+        local_array = functions_to_local_array(functions)
+        output[:] = local_array.dot(vector.get_local())
+        mpi_comm = to_petsc4py(vector).comm.tompi4py()
+        mpi_comm.Allreduce(IN_PLACE, output, op=SUM)
+    return output
+
+
+def basis_functions_matrix_transpose_mul_matrix_mul_basis_functions_matrix(
+        basis_functions_matrix_i, matrix, basis_functions_matrix_j):
+    # Compute Z_i^T A Z_j with sparse-dense matrix products (rather than with one matrix-vector product for
+    # each basis function) and a single reduction over processes. The result is stored, so that when basis
+    # functions are added to Z_i or Z_j (as during a greedy or POD enrichment) only the rows and columns
+    # corresponding to the new basis functions are computed
+    functions_i = _functions(basis_functions_matrix_i)
+    functions_j = _functions(basis_functions_matrix_j)
+    output = zeros((len(functions_i), len(functions_j)))
+    if output.size == 0:
         return output
+    # Get previous result, if the matrix has not changed and basis functions have only been added
+    cached_projection = _get_cached_projection(basis_functions_matrix_i, matrix, basis_functions_matrix_j)
+    if cached_projection is not None and all(
+            _starts_with(functions, cached_functions) for (functions, cached_functions) in zip(
+                (functions_i, functions_j), (cached_projection.functions_i, cached_projection.functions_j))):
+        (N_i, N_j) = cached_projection.output.shape
+        output[:N_i, :N_j] = cached_projection.output
+    else:
+        (N_i, N_j) = (0, 0)
+    # Compute the local contributions of new columns and new rows, and reduce them together
+    local_array_i = functions_to_local_array(functions_i)
+    local_array_j = functions_to_local_array(functions_j)
+    new_columns = zeros((len(functions_i), len(functions_j) - N_j))
+    if N_j < len(functions_j):
+        new_columns[:] = local_array_i.dot(_matrix_mul_local_array(matrix, local_array_j[N_j:]).T)
+    new_rows = zeros((len(functions_i) - N_i, N_j))
+    if N_i < len(functions_i) and N_j > 0:
+        new_rows[:] = _matrix_mul_local_array(matrix, local_array_i[N_i:], transpose=True).dot(
+            local_array_j[:N_j].T)
+    new_values = concatenate((new_columns.ravel(), new_rows.ravel()))
+    mpi_comm = to_petsc4py(matrix).comm.tompi4py()
+    mpi_comm.Allreduce(IN_PLACE, new_values, op=SUM)
+    output[:, N_j:] = new_values[:new_columns.size].reshape(new_columns.shape)
+    output[N_i:, :N_j] = new_values[new_columns.size:].reshape(new_rows.shape)
+    # Store the result for later updates
+    _set_cached_projection(basis_functions_matrix_i, matrix, basis_functions_matrix_j, functions_i, functions_j,
+                           output)
+    return output
+
+
+def _matrix_mul_local_array(matrix, local_array, transpose=False):
+    # Compute A Z (or A^T Z) with a single sparse-dense matrix product, where Z is provided (and returned)
+    # as the (k x n_local_dofs) array of the local values of k functions
+    mat = to_petsc4py(matrix)
+    (k, n_local) = local_array.shape
+    dense = PETSc.Mat().createDense(((n_local, PETSc.DETERMINE), (PETSc.DECIDE, k)),
+                                    array=asfortranarray(local_array.T), comm=mat.comm)
+    dense.assemble()
+    if transpose:
+        product = mat.transposeMatMult(dense)
+    else:
+        product = mat.matMult(dense)
+    output = product.getDenseArray().T.copy()
+    product.destroy()
+    dense.destroy()
+    return output
+
+
+def _starts_with(functions, cached_functions):
+    return len(cached_functions) <= len(functions) and all(
+        fun is cached_fun for (fun, cached_fun) in zip(functions, cached_functions))
+
+
+# Previous results of Z_i^T A Z_j. Results are stored for each Z_j and removed as soon as Z_j is deleted,
+# while references to A and Z_i are weak, so that matrices (e.g. assembled during an EIM or DEIM
+# evaluation) are not kept alive by this storage
+_ProjectionCacheEntry = namedtuple(
+    "_ProjectionCacheEntry", ("basis_functions_matrix_i", "matrix", "state", "functions_i", "functions_j", "output"))
+_projections = WeakKeyDictionary()  # from Z_j to dict from (id(Z_i), id(A)) to _ProjectionCacheEntry
+
+
+def _get_cached_projection(basis_functions_matrix_i, matrix, basis_functions_matrix_j):
+    state = get_petsc_object_state(matrix)
+    if state is None or basis_functions_matrix_j not in _projections:
+        return None
+    projections_j = _projections[basis_functions_matrix_j]
+    # Remove results associated to deleted matrices or basis functions matrices
+    for (key, entry) in list(projections_j.items()):
+        if entry.basis_functions_matrix_i() is None or entry.matrix() is None:
+            del projections_j[key]
+    entry = projections_j.get((id(basis_functions_matrix_i), id(matrix)))
+    if (entry is None or entry.basis_functions_matrix_i() is not basis_functions_matrix_i
+            or entry.matrix() is not matrix or entry.state != state):
+        return None
+    return entry
+
+
+def _set_cached_projection(basis_functions_matrix_i, matrix, basis_functions_matrix_j, functions_i, functions_j,
+                           output):
+    state = get_petsc_object_state(matrix)
+    if state is None:
+        return
+    try:
+        matrix_ref = ref(matrix)
+    except TypeError:  # matrix does not support weak references
+        return
+    if basis_functions_matrix_j not in _projections:
+        _projections[basis_functions_matrix_j] = dict()
+    _projections[basis_functions_matrix_j][id(basis_functions_matrix_i), id(matrix)] = _ProjectionCacheEntry(
+        ref(basis_functions_matrix_i), matrix_ref, state, tuple(functions_i), tuple(functions_j), output.copy())
@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from mpi4py.MPI import MAX
+from mpi4py.MPI import IN_PLACE, SUM
+from numpy import zeros
 from rbnics.backends.online import OnlineVector
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 
@@ -12,19 +13,17 @@ from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 def evaluate_and_vectorize_sparse_matrix_at_dofs(sparse_matrix, dofs_list):
     mat = to_petsc4py(sparse_matrix)
     row_start, row_end = mat.getOwnershipRange()
-    out_size = len(dofs_list)
-    out = OnlineVector(out_size)
-    mpi_comm = mat.comm.tompi4py()
+    # Each row is owned by exactly one process: fill in the locally owned values, and then sum the
+    # contributions of all processes with a single collective communication
+    values = zeros(len(dofs_list))
     for (index, dofs) in enumerate(dofs_list):
         assert len(dofs) == 2
         i = dofs[0]
-        out_index = None
-        mat_ij_processor = -1
         if i >= row_start and i < row_end:
             j = dofs[1]
-            out_index = mat.getValue(i, j)
-            mat_ij_processor = mpi_comm.rank
-        mat_ij_processor = mpi_comm.allreduce(mat_ij_processor, op=MAX)
-        assert mat_ij_processor >= 0
-        out[index] = mpi_comm.bcast(out_index, root=mat_ij_processor)
+            values[index] = mat.getValue(i, j)
+    mpi_comm = mat.comm.tompi4py()
+    mpi_comm.Allreduce(IN_PLACE, values, op=SUM)
+    out = OnlineVector(len(dofs_list))
+    out[:] = values
     return out
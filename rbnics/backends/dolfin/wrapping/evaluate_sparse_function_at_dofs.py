@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from mpi4py.MPI import MAX
+from mpi4py.MPI import IN_PLACE, SUM
+from numpy import array, zeros
 from petsc4py import PETSc
 from dolfin import Function
 from rbnics.backends.dolfin.wrapping.evaluate_sparse_vector_at_dofs import evaluate_sparse_vector_at_dofs
@@ -26,26 +27,21 @@ def evaluate_sparse_function_at_dofs(input_function, dofs_list, output_V=None, r
 def _evaluate_sparse_function_at_dofs(vec, dofs_list, out, reduced_dofs_list):
     vec_row_start, vec_row_end = vec.getOwnershipRange()
     out_row_start, out_row_end = out.getOwnershipRange()
+    dofs = array(list(dofs_list), dtype=PETSc.IntType)
+    reduced_dofs = array(list(reduced_dofs_list), dtype=PETSc.IntType)
+    assert len(dofs) == len(reduced_dofs)
+    # Each DOF is owned by exactly one process: fill in the locally owned values, and then sum the
+    # contributions of all processes with a single collective communication, rather than communicating
+    # with the owner of each DOF separately
+    values = zeros(len(dofs))
+    vec_owned = (dofs >= vec_row_start) & (dofs < vec_row_end)
+    if vec_owned.any():
+        values[vec_owned] = vec.getValues(dofs[vec_owned])
     mpi_comm = vec.comm.tompi4py()
-    for (i, reduced_i) in zip(dofs_list, reduced_dofs_list):
-        out_index = None
-        vec_i_processor = -1
-        if i >= vec_row_start and i < vec_row_end:
-            out_index = vec.getValue(i)
-            vec_i_processor = mpi_comm.rank
-        vec_i_processor = mpi_comm.allreduce(vec_i_processor, op=MAX)
-        assert vec_i_processor >= 0
-        out_reduced_i_processor = -1
-        if reduced_i >= out_row_start and reduced_i < out_row_end:
-            out_reduced_i_processor = mpi_comm.rank
-        out_reduced_i_processor = mpi_comm.allreduce(vec_i_processor, op=MAX)
-        assert out_reduced_i_processor >= 0
-        if vec_i_processor != out_reduced_i_processor:
-            if mpi_comm.rank == vec_i_processor:
-                mpi_comm.send(out_index, dest=out_reduced_i_processor)
-            if mpi_comm.rank == out_reduced_i_processor:
-                out_index = mpi_comm.recv(source=vec_i_processor)
-        if mpi_comm.rank == out_reduced_i_processor:
-            out.setValues(reduced_i, out_index, addv=PETSc.InsertMode.INSERT)
+    mpi_comm.Allreduce(IN_PLACE, values, op=SUM)
+    # Every process then inserts the values of the reduced DOFs it owns
+    out_owned = (reduced_dofs >= out_row_start) & (reduced_dofs < out_row_end)
+    if out_owned.any():
+        out.setValues(reduced_dofs[out_owned], values[out_owned], addv=PETSc.InsertMode.INSERT)
     out.assemble()
     out.ghostUpdate()
@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from weakref import ref, WeakKeyDictionary
+from numpy import array, asarray, empty, zeros
 from dolfin import Function, FunctionSpace
 
 
@@ -13,25 +15,103 @@ def functions_list_mul_online_matrix(functions_list, online_matrix, FunctionsLis
 
     output = FunctionsListType(space)
     assert isinstance(online_matrix.M, int)
-    for j in range(online_matrix.M):
-        assert len(online_matrix[:, j]) == len(functions_list)
-        output_j = Function(space)
-        for (i, fun_i) in enumerate(functions_list):
-            output_j.vector().add_local(fun_i.vector().get_local() * online_matrix[i, j])
-        output_j.vector().apply("add")
-        output.enrich(output_j)
-    return output
+    if len(functions_list) == 0:
+        for _ in range(online_matrix.M):
+            output.enrich(Function(space))
+        return output
+    else:
+        online_matrix = asarray(online_matrix, dtype=float)
+        assert online_matrix.shape[0] == len(functions_list)
+        for output_j_local in functions_linear_combinations(list(functions_list), online_matrix):
+            output.enrich(local_array_to_function(space, output_j_local))
+        return output
 
 
 def functions_list_mul_online_vector(functions_list, online_vector):
     space = functions_list.space
     assert isinstance(space, FunctionSpace)
 
-    output = Function(space)
     if len(functions_list) == 0:
-        return output
+        return Function(space)
     else:
-        for (i, fun_i) in enumerate(functions_list):
-            output.vector().add_local(fun_i.vector().get_local() * online_vector[i])
-        output.vector().apply("add")
-        return output
+        online_vector = asarray(online_vector, dtype=float)[:len(functions_list)]
+        return local_array_to_function(
+            space, functions_linear_combinations(list(functions_list), online_vector.reshape(-1, 1))[0])
+
+
+# Functions lists (e.g. snapshots) are usually multiplied only once, so their local values are not stored:
+# linear combinations are computed block by block, with one matrix-matrix product per block of functions,
+# so that a copy of the local values of all functions is never required
+_block_size = 64
+
+
+def functions_linear_combinations(functions, coefficients):
+    # Return the (M x n_local_dofs) array of the local values of the M linear combinations of the functions with
+    # coefficients provided by the columns of the (len(functions) x M) array coefficients
+    output = zeros((coefficients.shape[1], functions[0].vector().get_local().size))
+    for block_start in range(0, len(functions), _block_size):
+        block_functions = functions[block_start:block_start + _block_size]
+        block_local_array = array([fun.vector().get_local() for fun in block_functions], dtype=float)
+        output += coefficients[block_start:block_start + len(block_functions)].T.dot(block_local_array)
+    return output
+
+
+# Local values of basis functions, as a contiguous (N x n_local_dofs) array, so that linear combinations are
+# computed with a single matrix-vector (or matrix-matrix) product rather than with a loop over the functions.
+# Arrays are stored for the first function of a basis, rather than for each basis functions matrix, so that the
+# slices [:n] of a basis (which are distinct objects, but contain the same functions) share views of the first n
+# rows of the same array. The array grows as functions are added to the basis, and is deleted with its first
+# function. Only weak references to functions are stored, since functions are never modified in place after
+# they have been added to a basis
+_local_arrays = WeakKeyDictionary()  # from first function to _LocalArray
+
+
+class _LocalArray(object):
+    def __init__(self, n_local_dofs):
+        self.functions = list()  # weak references to functions
+        self.storage = empty((0, n_local_dofs))  # its first len(self.functions) rows contain the local values
+
+    def extend(self, functions):
+        N = len(self.functions)
+        if N + len(functions) > self.storage.shape[0]:
+            # Allocate new storage, rather than resizing the current one, which may still be in use
+            storage = empty((max(2 * self.storage.shape[0], N + len(functions)), self.storage.shape[1]))
+            storage[:N] = self.storage[:N]
+            self.storage = storage
+        for (i, fun) in enumerate(functions):
+            self.storage[N + i] = fun.vector().get_local()
+            self.functions.append(ref(fun))
+
+    def truncate(self, N):
+        # Allocate new storage, rather than overwriting rows of the current one, which may still be in use
+        self.storage = self.storage[:N].copy()
+        del self.functions[N:]
+
+
+def functions_to_local_array(functions):
+    assert len(functions) > 0
+    try:
+        local_array = _local_arrays.get(functions[0])
+    except TypeError:  # functions do not support weak references
+        return array([fun.vector().get_local() for fun in functions], dtype=float)
+    if local_array is None:
+        local_array = _LocalArray(functions[0].vector().get_local().size)
+        _local_arrays[functions[0]] = local_array
+    # Count the leading functions which are already stored, and update the rows of the remaining ones
+    N = 0
+    for (stored_fun, fun) in zip(local_array.functions, functions):
+        if stored_fun() is not fun:
+            break
+        N += 1
+    if N < len(functions):
+        if N < len(local_array.functions):
+            local_array.truncate(N)
+        local_array.extend(functions[N:])
+    return local_array.storage[:len(functions)]
+
+
+def local_array_to_function(space, local_array):
+    output = Function(space)
+    output.vector().set_local(local_array)
+    output.vector().apply("insert")
+    return output
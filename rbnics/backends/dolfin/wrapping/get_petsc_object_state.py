@@ -0,0 +1,16 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+
+
+def get_petsc_object_state(tensor):
+    # The PETSc object state is increased every time the tensor is changed (e.g. assembled again), and is
+    # used to check that a stored result is still valid
+    try:
+        return to_petsc4py(tensor).stateGet()
+    except AttributeError:  # not available in older petsc4py versions: never reuse results
+        return None
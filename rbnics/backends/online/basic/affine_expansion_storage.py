@@ -5,15 +5,17 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from copy import copy as shallow_copy
 from numbers import Number
-from numpy import empty as AffineExpansionStorageContent_Base, nditer as AffineExpansionStorageContent_Iterator
+from numpy import (array, asarray, empty as AffineExpansionStorageContent_Base,
+                   nditer as AffineExpansionStorageContent_Iterator)
 from rbnics.backends.abstract import (AffineExpansionStorage as AbstractAffineExpansionStorage,
                                       BasisFunctionsMatrix as AbstractBasisFunctionsMatrix,
                                       FunctionsList as AbstractFunctionsList)
 from rbnics.backends.online.basic.wrapping import slice_to_array
 from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import overload, tuple_of
-from rbnics.utils.io import (ComponentNameToBasisComponentIndexDict, Folders, OnlineSizeDict,
+from rbnics.utils.io import (ComponentNameToBasisComponentIndexDict, Folders, NumpyIO as ContentIO, OnlineSizeDict,
                              TextIO as ContentItemShapeIO, TextIO as ContentItemTypeIO, TextIO as DictIO,
                              TextIO as ScalarContentIO)
 
@@ -27,6 +29,7 @@ def AffineExpansionStorage(backend, wrapping):
             self._smallest_key = None
             self._previous_key = None
             self._largest_key = None
+            self._content_as_array = None  # will be filled in in __array__, if required
             # Auxiliary storage for __getitem__ slicing
             self._component_name_to_basis_component_index = None  # will be filled in in __setitem__, if required
             self._component_name_to_basis_component_length = None  # will be filled in in __setitem__, if required
@@ -105,30 +108,26 @@ def AffineExpansionStorage(backend, wrapping):
             ContentItemTypeIO.save_file("empty", full_directory, "content_item_type")
             ContentItemShapeIO.save_file(None, full_directory, "content_item_shape")
 
-        @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+        @overload((backend.Matrix.Type(), backend.Vector.Type(), Number), AffineExpansionStorageContent_Iterator,
+                  Folders.Folder)
         def _save_content(self, item, it, full_directory):
+            # Save all items in a single contiguous array, so that it can be memory mapped when loading
+            content = list()
             while not it.finished:
-                wrapping.tensor_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
-
-        @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                wrapping.tensor_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
+                content.append(array(self._content[it.multi_index], dtype=float))
                 it.iternext()
+            ContentIO.save_file(array(content).reshape(self._content.shape + content[0].shape), full_directory,
+                                "content")
 
         @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
+            # Save all items in a single contiguous array, so that it can be memory mapped when loading
+            content = list()
             while not it.finished:
-                wrapping.function_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
-
-        @overload(Number, AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                ScalarContentIO.save_file(
-                    self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
+                content.append(array(self._content[it.multi_index].vector(), dtype=float))
                 it.iternext()
+            ContentIO.save_file(array(content).reshape(self._content.shape + content[0].shape), full_directory,
+                                "content")
 
         @overload(AbstractFunctionsList, AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
@@ -181,6 +180,8 @@ def AffineExpansionStorage(backend, wrapping):
             reference_item = self._load_content_item_type_shape(full_directory)
             # Initialize iterator
             it = AffineExpansionStorageContent_Iterator(self._content, flags=["c_index", "multi_index", "refs_ok"])
+            # Reset stacked content (which may be set again while loading content)
+            self._content_as_array = None
             # Load content
             self._load_content(reference_item, it, full_directory)
             # Load dicts
@@ -227,31 +228,64 @@ def AffineExpansionStorage(backend, wrapping):
 
         @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
-            while not it.finished:
-                self._content[it.multi_index] = wrapping.tensor_copy(item)
-                wrapping.tensor_load(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            if ContentIO.exists_file(full_directory, "content"):
+                # Items are read-only views of the memory mapped array, so that slicing them does not copy
+                content = ContentIO.load_file(full_directory, "content", mmap_mode="r")
+                self._content_as_array = content  # the memory mapped array is already packed
+                while not it.finished:
+                    self._content[it.multi_index] = backend.Matrix.Type()(item.M, item.N, content[it.multi_index])
+                    it.iternext()
+            else:  # storage saved with one file per item
+                while not it.finished:
+                    self._content[it.multi_index] = wrapping.tensor_copy(item)
+                    wrapping.tensor_load(
+                        self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
+                    it.iternext()
 
         @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
-            while not it.finished:
-                self._content[it.multi_index] = wrapping.tensor_copy(item)
-                wrapping.tensor_load(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            if ContentIO.exists_file(full_directory, "content"):
+                # Items are read-only views of the memory mapped array, so that slicing them does not copy
+                content = ContentIO.load_file(full_directory, "content", mmap_mode="r")
+                self._content_as_array = content  # the memory mapped array is already packed
+                while not it.finished:
+                    self._content[it.multi_index] = backend.Vector.Type()(item.N, content[it.multi_index])
+                    it.iternext()
+            else:  # storage saved with one file per item
+                while not it.finished:
+                    self._content[it.multi_index] = wrapping.tensor_copy(item)
+                    wrapping.tensor_load(
+                        self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
+                    it.iternext()
 
         @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
-            while not it.finished:
-                self._content[it.multi_index] = wrapping.function_copy(item)
-                wrapping.function_load(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            if ContentIO.exists_file(full_directory, "content"):
+                # Items are read-only views of the memory mapped array, so that slicing them does not copy
+                content = ContentIO.load_file(full_directory, "content", mmap_mode="r")
+                while not it.finished:
+                    self._content[it.multi_index] = backend.Function(
+                        backend.Vector.Type()(item.N, content[it.multi_index]))
+                    it.iternext()
+            else:  # storage saved with one file per item
+                while not it.finished:
+                    self._content[it.multi_index] = wrapping.function_copy(item)
+                    wrapping.function_load(
+                        self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
+                    it.iternext()
 
         @overload(Number, AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
-            while not it.finished:
-                self._content[it.multi_index] = ScalarContentIO.load_file(
-                    full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            if ContentIO.exists_file(full_directory, "content"):
+                content = ContentIO.load_file(full_directory, "content")
+                while not it.finished:
+                    self._content[it.multi_index] = float(content[it.multi_index])
+                    it.iternext()
+            else:  # storage saved with one file per item
+                while not it.finished:
+                    self._content[it.multi_index] = ScalarContentIO.load_file(
+                        full_directory, "content_item_" + str(it.index))
+                    it.iternext()
 
         @overload(AbstractFunctionsList, AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
@@ -340,11 +374,31 @@ def AffineExpansionStorage(backend, wrapping):
             if slices not in self._precomputed_slices:
                 output = _AffineExpansionStorage.__new__(type(self), *self._content.shape)
                 output.__init__(*self._content.shape)
-                while not it.finished:
-                    # Slice content and assign
-                    output[it.multi_index] = self._do_slicing(self._content[it.multi_index], key)
-                    # Increment
-                    it.iternext()
+                packed_content = self._packed_content()
+                if packed_content is not None and packed_content.ndim > self.order():
+                    # Slice the packed content once: items of the output are read-only views of the sliced
+                    # packed content, which is in turn a view (for contiguous slices) of the packed content
+                    if isinstance(key, slice):
+                        slices_tuple = (slices, )
+                    else:
+                        slices_tuple = slices
+                    packed_key = wrapping.Slicer(*slices_tuple)
+                    if not isinstance(packed_key, tuple):
+                        packed_key = (packed_key, )
+                    while not it.finished:
+                        # Slice a copy of the item which wraps the (read-only) packed content, and assign
+                        item = shallow_copy(self._content[it.multi_index])
+                        item.content = packed_content[it.multi_index]
+                        output[it.multi_index] = self._do_slicing(item, key)
+                        # Increment
+                        it.iternext()
+                    output._content_as_array = packed_content[(slice(None), ) * self.order() + packed_key]
+                else:
+                    while not it.finished:
+                        # Slice content and assign
+                        output[it.multi_index] = self._do_slicing(self._content[it.multi_index], key)
+                        # Increment
+                        it.iternext()
                 self._precomputed_slices[slices] = output
             return self._precomputed_slices[slices]
 
@@ -375,6 +429,7 @@ def AffineExpansionStorage(backend, wrapping):
             self._update_previous_key(key)
             # Store item
             self._content[key] = item
+            self._content_as_array = None
             # Reset attributes related to basis functions matrix if the size has changed
             if key == self._smallest_key:
                 # this assumes that __getitem__ is not random acces but called for increasing key
@@ -448,6 +503,44 @@ def AffineExpansionStorage(backend, wrapping):
         def _update_previous_key(self, current_key):
             self._update_previous_key(*current_key)
 
+        def __array__(self, dtype=None):
+            """
+            return the content stacked in a single dense (read-only) array, of shape (Q x ...) for storages with
+            one index and (Q1 x Q2 x ...) for storages with two indices. The array is computed only once, and reset
+            when the storage is modified
+            """
+            if self._content_as_array is None:
+                content = list()
+                it = AffineExpansionStorageContent_Iterator(
+                    self._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
+                while not it.finished:
+                    item = self._content[it.multi_index]
+                    assert isinstance(item, (backend.Matrix.Type(), backend.Vector.Type(), backend.Function.Type(),
+                                             Number))
+                    if isinstance(item, backend.Function.Type()):
+                        item = item.vector()
+                    content.append(asarray(item, dtype=float))
+                    it.iternext()
+                assert len(content) > 0
+                self._content_as_array = array(content).reshape(self._content.shape + content[0].shape)
+                self._content_as_array.flags.writeable = False
+            return asarray(self._content_as_array, dtype=dtype)
+
+        def _packed_content(self):
+            """
+            return the content stacked in a single dense (read-only) array, as in __array__, if the packed
+            representation is enabled in the configuration and items are matrices, vectors or scalars.
+            Otherwise, return None
+            """
+            from rbnics.utils.config import config  # cannot import at global scope
+            if not config.get("reduced problems", "packed operators") or self._content.size == 0:
+                return None
+            if self._content_as_array is None:
+                for key in (self._smallest_key, self._largest_key):
+                    if not isinstance(self._content[key], (backend.Matrix.Type(), backend.Vector.Type(), Number)):
+                        return None
+            return self.__array__()
+
         def __iter__(self):
             return AffineExpansionStorageContent_Iterator(self._content, flags=["refs_ok"], op_flags=["readonly"])
 
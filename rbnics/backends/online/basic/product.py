@@ -6,6 +6,7 @@
 
 from itertools import product as cartesian_product
 from numbers import Number
+from numpy import tensordot
 from rbnics.backends.abstract import ParametrizedTensorFactory as AbstractParametrizedTensorFactory
 from rbnics.backends.basic.wrapping import DelayedTranspose
 from rbnics.utils.decorators import overload, ThetaType
@@ -26,11 +27,16 @@ def product(backend, wrapping):
                     backend.Matrix.Type(), backend.Vector.Type(), backend.Function.Type(), Number))
                 assert thetas2 is None
                 assert len(thetas) == len(operators)
-                for (index, (theta, operator)) in enumerate(zip(thetas, operators)):
-                    if index == 0:
-                        output = theta * operator
-                    elif theta != 0.:
-                        output += theta * operator
+                packed_operators = operators._packed_content()
+                if packed_operators is not None:
+                    # contract the (Q x ...) packed content with thetas, without temporaries for each term
+                    output = _wrap_packed_output(first_operator, tensordot(thetas, packed_operators, axes=1))
+                else:
+                    for (index, (theta, operator)) in enumerate(zip(thetas, operators)):
+                        if index == 0:
+                            output = theta * operator
+                        elif theta != 0.:
+                            output += theta * operator
             elif order == 2:
                 # matrix storage of affine expansion online data structures (e.g. error estimation ff/af/aa products)
                 first_operator = operators[0, 0]
@@ -39,11 +45,17 @@ def product(backend, wrapping):
                 # no checks here on the first dimension of operators should be equal to len(thetas), and
                 # similarly that the second dimension should be equal to len(thetas2), because the
                 # current operator interface does not provide a 2D len method
-                for (i, j) in cartesian_product(range(len(thetas)), range(len(thetas2))):
-                    if i == 0 and j == 0:
-                        output = thetas[0] * operators[0, 0] * thetas2[0]
-                    elif thetas[i] != 0. and thetas2[j] != 0.:
-                        output += thetas[i] * operators[i, j] * thetas2[j]
+                packed_operators = operators._packed_content()
+                if packed_operators is not None:
+                    # contract the (Q1 x Q2 x ...) packed content with thetas2 first, and then with thetas
+                    output = _wrap_packed_output(first_operator, tensordot(
+                        thetas, tensordot(thetas2, packed_operators, axes=([0], [1])), axes=1))
+                else:
+                    for (i, j) in cartesian_product(range(len(thetas)), range(len(thetas2))):
+                        if i == 0 and j == 0:
+                            output = thetas[0] * operators[0, 0] * thetas2[0]
+                        elif thetas[i] != 0. and thetas2[j] != 0.:
+                            output += thetas[i] * operators[i, j] * thetas2[j]
             else:
                 raise ValueError("product(): invalid operands.")
             # Return
@@ -99,6 +111,19 @@ def product(backend, wrapping):
             else:
                 raise ValueError("Invalid type")
 
+    # Auxiliary function to wrap the result of the contraction of packed content in the type of its items
+    def _wrap_packed_output(first_operator, output_content):
+        if isinstance(first_operator, Number):
+            return float(output_content)
+        elif isinstance(first_operator, backend.Matrix.Type()):
+            output = backend.Matrix.Type()(first_operator.M, first_operator.N, output_content)
+        elif isinstance(first_operator, backend.Vector.Type()):
+            output = backend.Vector.Type()(first_operator.N, output_content)
+        else:
+            raise TypeError("Invalid item type in packed content")
+        first_operator._arithmetic_operations_preserve_attributes(output, other_order=0)
+        return output
+
     # Auxiliary class to signal to the sum() function that it is dealing with an output of the product() method
     class ProductOutput(object):
         def __init__(self, sum_product_return_value):
@@ -9,15 +9,19 @@ from rbnics.backends.abstract import (
     HighOrderProperOrthogonalDecomposition as AbstractHighOrderProperOrthogonalDecomposition)
 from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicHighOrderProperOrthogonalDecomposition
 from rbnics.backends.online.numpy.eigen_solver import EigenSolver
+from rbnics.backends.online.numpy.function import Function
+from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.tensor_snapshots_list import TensorSnapshotsList
 from rbnics.backends.online.numpy.tensor_basis_list import TensorBasisList
 from rbnics.backends.online.numpy.transpose import transpose
+from rbnics.backends.online.numpy.vector import Vector
 from rbnics.backends.online.numpy.wrapping import get_mpi_comm
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver)
+online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver, OnlineFunction=Function, OnlineMatrix=Matrix,
+                               OnlineVector=Vector)
 online_wrapping = ModuleWrapper()
 HighOrderProperOrthogonalDecomposition_Base = BasicHighOrderProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractHighOrderProperOrthogonalDecomposition,
@@ -31,3 +35,4 @@ class HighOrderProperOrthogonalDecomposition(HighOrderProperOrthogonalDecomposit
 
     def store_snapshot(self, snapshot):
         self.snapshots_matrix.enrich(snapshot)
+        self._postprocess_stored_snapshots()
@@ -4,13 +4,16 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy.linalg import solve
+from hashlib import sha1
+from numpy import all as array_all, any as array_any, array_equal, asarray, diagonal, isfinite
+from scipy.linalg import cho_factor, cho_solve, LinAlgError, lu_factor, lu_solve
 from rbnics.backends.abstract import LinearProblemWrapper
 from rbnics.backends.online.basic import LinearSolver as BasicLinearSolver
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.transpose import DelayedTransposeWithArithmetic
 from rbnics.backends.online.numpy.vector import Vector
+from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import BackendFor, DictOfThetaType, ModuleWrapper, ThetaType
 
 backend = ModuleWrapper(Function, Matrix, Vector)
@@ -23,11 +26,64 @@ LinearSolver_Base = BasicLinearSolver(backend, wrapping)
                              (Vector.Type(), DelayedTransposeWithArithmetic, None),
                              ThetaType + DictOfThetaType + (None,)))
 class LinearSolver(LinearSolver_Base):
+    # Factorizations of parameter independent operators are stored in a cache shared by all solvers, since a new
+    # solver is created for each solve. The cache is created on first solve, so that changes to the configuration
+    # after import are taken into account
+    _factorization_cache = None
+
+    # Operators are assumed to be parameter dependent and not symmetric, unless otherwise stated by set_parameters
+    _parameter_independent = False
+    _symmetric = False
+
     def set_parameters(self, parameters):
-        assert len(parameters) == 0, "NumPy linear solver does not accept parameters yet"
+        for (key, value) in parameters.items():
+            if key == "parameter_independent":
+                self._parameter_independent = value
+            elif key == "symmetric":
+                self._symmetric = value
+            else:
+                raise ValueError("Invalid paramater passed to NumPy linear solver.")
 
     def solve(self):
-        solution = solve(self.lhs, self.rhs)
+        lhs = asarray(self.lhs)
+        if self._parameter_independent:
+            factorization = self._cached_factorize(lhs)
+        else:
+            factorization = self._factorize(lhs)
+        if factorization[0] == "cholesky":
+            solution = cho_solve(factorization[1], asarray(self.rhs), check_finite=False)
+        else:
+            solution = lu_solve(factorization[1], asarray(self.rhs), check_finite=False)
         self.solution.vector()[:] = solution
         if self.monitor is not None:
             self.monitor(self.solution)
+
+    def _cached_factorize(self, lhs):
+        # Reuse the factorization of a parameter independent matrix with the same dimension and content,
+        # if available, e.g. for inner product matrices in projections
+        if LinearSolver._factorization_cache is None:
+            LinearSolver._factorization_cache = Cache(
+                "factorizations",
+                key_generator=lambda shape, digest: (shape, digest)
+            )
+        key = (lhs.shape, sha1(lhs.tobytes()).hexdigest())
+        try:
+            return LinearSolver._factorization_cache[key]
+        except KeyError:
+            factorization = self._factorize(lhs)
+            LinearSolver._factorization_cache[key] = factorization
+            return factorization
+
+    def _factorize(self, lhs):
+        # Use a Cholesky factorization for symmetric positive definite matrices, as in coercive compliant
+        # problems, and fall back to a LU factorization otherwise. Since cho_factor only reads one triangle
+        # of the matrix, symmetry is required to be either stated by the caller or exact
+        if self._symmetric or array_equal(lhs, lhs.T):
+            try:
+                return ("cholesky", cho_factor(lhs, check_finite=False))
+            except LinAlgError:  # matrix is not positive definite
+                pass
+        lu = lu_factor(lhs, check_finite=False)
+        if not array_all(isfinite(lu[0])) or array_any(diagonal(lu[0]) == 0.):
+            raise LinAlgError("Singular matrix")
+        return ("lu", lu)
@@ -4,7 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import zeros
+from numpy import may_share_memory, zeros
 from rbnics.backends.online.basic import Matrix as BasicMatrix
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.vector import Vector
@@ -26,7 +26,12 @@ class _Matrix_Type(_Matrix_Type_Base):
         if all([isinstance(key_i, int) for key_i in key]):
             return float(_Matrix_Type_Base.__getitem__(self, key))  # convert from numpy numbers wrappers
         else:
-            return _Matrix_Type_Base.__getitem__(self, key)
+            output = _Matrix_Type_Base.__getitem__(self, key)
+            # Slices of read-only (e.g. memory mapped) content are returned as views, while slices of
+            # writable content are copied so that the original matrix is not changed through the slice
+            if self.content.flags.writeable and may_share_memory(output.content, self.content):
+                output.content = output.content.copy()
+            return output
 
     def __mul__(self, other):
         if isinstance(other, Vector.Type()):
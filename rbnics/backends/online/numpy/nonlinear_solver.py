@@ -5,8 +5,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from mpi4py.MPI import COMM_WORLD
-from numpy import dot
-from numpy.linalg import solve
+from numpy import asarray, dot, outer
+from numpy.linalg import inv
+from scipy.linalg import lu_factor, lu_solve
 from scipy.optimize.nonlin import Jacobian, nonlin_solve
 from rbnics.backends.abstract import NonlinearSolver as AbstractNonlinearSolver, NonlinearProblemWrapper
 from rbnics.backends.online.basic.nonlinear_solver import _NonlinearProblem as _BasicNonlinearProblem
@@ -29,8 +30,10 @@ class NonlinearSolver(AbstractNonlinearSolver):
         self.monitor = problem_wrapper.monitor
         # Additional storage which will be setup by set_parameters
         self._absolute_tolerance = None
+        self._jacobian_update = "newton"
         self._line_search = True
         self._maximum_iterations = None
+        self._maximum_jacobian_reuses = None
         self._monitor = None
         self._relative_tolerance = None
         self._report = False
@@ -40,10 +43,15 @@ class NonlinearSolver(AbstractNonlinearSolver):
         for (key, value) in parameters.items():
             if key == "absolute_tolerance":
                 self._absolute_tolerance = value
+            elif key == "jacobian_update":
+                assert value in ("newton", "modified newton", "broyden")
+                self._jacobian_update = value
             elif key == "line_search":
                 self._line_search = value
             elif key == "maximum_iterations":
                 self._maximum_iterations = value
+            elif key == "maximum_jacobian_reuses":
+                self._maximum_jacobian_reuses = value
             elif key == "relative_tolerance":
                 self._relative_tolerance = value
             elif key == "report":
@@ -61,7 +69,7 @@ class NonlinearSolver(AbstractNonlinearSolver):
     def solve(self):
         residual = self.problem.residual_vector_eval
         initial_guess_vector = self.problem.solution.vector()
-        jacobian = _Jacobian(self.problem.jacobian_matrix_eval)
+        jacobian = _Jacobian(self.problem.jacobian_matrix_eval, self._jacobian_update, self._maximum_jacobian_reuses)
         try:
             solution_vector, info = nonlin_solve(
                 residual, initial_guess_vector, jacobian=jacobian, verbose=self._report,
@@ -71,9 +79,12 @@ class NonlinearSolver(AbstractNonlinearSolver):
                 full_output=True, raise_exception=False)
             if self._report:
                 if info["success"]:
-                    print("scipy solver converged in " + str(info["nit"]) + " iterations.")
+                    outcome = "converged"
                 else:
-                    print("scipy solver diverged in " + str(info["nit"]) + " iterations.")
+                    outcome = "diverged"
+                print("scipy solver " + outcome + " in " + str(info["nit"]) + " iterations, with "
+                      + str(jacobian.assemblies) + " jacobian assemblies and " + str(jacobian.factorizations)
+                      + " factorizations.")
             self.problem.solution.vector()[:] = solution_vector
         except ArithmeticError as error:
             if self._report:
@@ -105,30 +116,88 @@ class _NonlinearProblem(_NonlinearProblem_Base):
         return jacobian_matrix
 
 
-# Adapted from scipy/optimize/nonlin.py, asjacobian method
+# Adapted from scipy/optimize/nonlin.py, asjacobian method.
+# The jacobian matrix and its factorization are evaluated lazily, and are then reused until the next update
+# of the iterate. The jacobian update can be:
+# * "newton": the jacobian is assembled again at each iterate;
+# * "modified newton": the jacobian is kept frozen for maximum_reuses iterates (or for all of them, if None);
+# * "broyden": the jacobian and its inverse undergo a (good) Broyden rank-one update at each iterate, and are
+#   assembled again after maximum_reuses updates (or never, if None).
 class _Jacobian(Jacobian):
-    def __init__(self, jacobian_eval):
+    def __init__(self, jacobian_eval, jacobian_update="newton", maximum_reuses=None):
+        assert jacobian_update in ("newton", "modified newton", "broyden")
         self.jacobian_eval = jacobian_eval
+        self.jacobian_update = jacobian_update
+        self.maximum_reuses = maximum_reuses
+        self.assemblies = 0
+        self.factorizations = 0
+        self._reset()
 
     def setup(self, x, F, func):
         Jacobian.setup(self, x, F, func)
         self.x = x
+        self.F = F
+        self._reset()
 
     def update(self, x, F):
+        if (self.jacobian_update != "newton" and self._J is not None
+                and (self.maximum_reuses is None or self._reuses < self.maximum_reuses)):
+            if self.jacobian_update == "broyden":
+                self._broyden_update(x - self.x, F - self.F)
+            self._reuses += 1
+        else:
+            self._reset()
         self.x = x
+        self.F = F
 
     def solve(self, v, tol=0):
-        J = self.jacobian_eval(self.x)
-        return solve(J, v)
+        self._factorize()
+        if self.jacobian_update == "broyden":
+            return dot(self._J_inv, v)
+        else:
+            return lu_solve(self._J_lu, v)
 
     def matvec(self, v):
-        J = self.jacobian_eval(self.x)
-        return dot(J, v)
+        return dot(self._assemble(), v)
 
     def rsolve(self, v, tol=0):
-        J = self.jacobian_eval(self.x)
-        return solve(J.T, v)
+        self._factorize()
+        if self.jacobian_update == "broyden":
+            return dot(self._J_inv.T, v)
+        else:
+            return lu_solve(self._J_lu, v, trans=1)
 
     def rmatvec(self, v):
-        J = self.jacobian_eval(self.x)
-        return dot(J.T, v)
+        return dot(self._assemble().T, v)
+
+    def _reset(self):
+        self._J = None
+        self._J_lu = None
+        self._J_inv = None
+        self._reuses = 0
+
+    def _assemble(self):
+        if self._J is None:
+            self._J = asarray(self.jacobian_eval(self.x), dtype=float)
+            self.assemblies += 1
+        return self._J
+
+    def _factorize(self):
+        if self.jacobian_update == "broyden":
+            if self._J_inv is None:
+                self._J_inv = inv(self._assemble())
+                self.factorizations += 1
+        else:
+            if self._J_lu is None:
+                self._J_lu = lu_factor(self._assemble())
+                self.factorizations += 1
+
+    def _broyden_update(self, dx, dF):
+        dx_norm_squared = dot(dx, dx)
+        if dx_norm_squared == 0.:
+            return
+        self._J = self._J + outer(dF - dot(self._J, dx), dx) / dx_norm_squared
+        if self._J_inv is not None:
+            # Sherman-Morrison formula
+            J_inv_dF = dot(self._J_inv, dF)
+            self._J_inv = self._J_inv + outer(dx - J_inv_dF, dot(dx, self._J_inv)) / dot(dx, J_inv_dF)
@@ -8,16 +8,19 @@ from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
 from rbnics.backends.abstract import ProperOrthogonalDecomposition as AbstractProperOrthogonalDecomposition
 from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicProperOrthogonalDecomposition
 from rbnics.backends.online.numpy.eigen_solver import EigenSolver
+from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.functions_list import FunctionsList
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.snapshots_matrix import SnapshotsMatrix
 from rbnics.backends.online.numpy.transpose import transpose
+from rbnics.backends.online.numpy.vector import Vector
 from rbnics.backends.online.numpy.wrapping import get_mpi_comm
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver)
+online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver, OnlineFunction=Function, OnlineMatrix=Matrix,
+                               OnlineVector=Vector)
 online_wrapping = ModuleWrapper()
 ProperOrthogonalDecomposition_Base = BasicProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractProperOrthogonalDecomposition, SnapshotsMatrix,
@@ -31,3 +34,4 @@ class ProperOrthogonalDecomposition(ProperOrthogonalDecomposition_Base):
 
     def store_snapshot(self, snapshot, component=None, weight=None):
         self.snapshots_matrix.enrich(snapshot, component, weight)
+        self._postprocess_stored_snapshots()
@@ -4,7 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import zeros
+from numpy import may_share_memory, zeros
 from rbnics.backends.online.basic import Vector as BasicVector
 from rbnics.backends.online.numpy.wrapping import Slicer
 from rbnics.utils.decorators import backend_for, ModuleWrapper, OnlineSizeType
@@ -24,7 +24,12 @@ class _Vector_Type(_Vector_Type_Base):
         if isinstance(key, int):
             return float(_Vector_Type_Base.__getitem__(self, key))  # convert from numpy numbers wrappers
         else:
-            return _Vector_Type_Base.__getitem__(self, key)
+            output = _Vector_Type_Base.__getitem__(self, key)
+            # Slices of read-only (e.g. memory mapped) content are returned as views, while slices of
+            # writable content are copied so that the original vector is not changed through the slice
+            if self.content.flags.writeable and may_share_memory(output.content, self.content):
+                output.content = output.content.copy()
+            return output
 
     def __iter__(self):
         return map(float, self.content.flat)
@@ -4,7 +4,6 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import ix_ as Slicer
 from rbnics.backends.online.numpy.wrapping.basis_functions_matrix_mul import (
     basis_functions_matrix_mul_online_matrix, basis_functions_matrix_mul_online_vector)
 from rbnics.backends.online.numpy.wrapping.function_load import function_load
@@ -16,6 +15,7 @@ from rbnics.backends.online.numpy.wrapping.get_mpi_comm import get_mpi_comm
 from rbnics.backends.online.numpy.wrapping.gram_schmidt_projection_step import gram_schmidt_projection_step
 from rbnics.backends.online.numpy.wrapping.matrix_mul import (
     matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix)
+from rbnics.backends.online.numpy.wrapping.slicer import Slicer
 from rbnics.backends.online.numpy.wrapping.tensor_load import tensor_load
 from rbnics.backends.online.numpy.wrapping.tensor_save import tensor_save
 from rbnics.backends.online.numpy.wrapping.vector_mul import vector_mul_vector
@@ -0,0 +1,23 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import asarray, diff, ix_, issubdtype, integer
+
+
+def Slicer(*args):
+    # Contiguous ranges of indices (e.g. as in matrix[:N, :N]) are converted to basic slicing, which is faster
+    # than advanced indexing and returns views rather than copies
+    slices = list()
+    for arg in args:
+        arg = asarray(arg)
+        if arg.ndim == 1 and arg.size > 0 and issubdtype(arg.dtype, integer) and (diff(arg) == 1).all():
+            slices.append(slice(int(arg[0]), int(arg[-1]) + 1))
+        else:
+            return ix_(*args)
+    if len(slices) == 1:
+        return slices[0]
+    else:
+        return tuple(slices)
@@ -12,6 +12,7 @@ from rbnics.eim.problems.eim_approximation import EIMApproximation as DEIMApprox
 from rbnics.eim.problems.time_dependent_eim_approximation import (
     TimeDependentEIMApproximation as TimeDependentDEIMApproximation)
 from rbnics.eim.utils.decorators import DefineSymbolicParameters
+from rbnics.problems.base import ParametrizedProblem
 from rbnics.utils.decorators import overload, PreserveClassName, ProblemDecoratorFor, tuple_of
 from rbnics.utils.test import PatchInstanceMethod
 
@@ -215,6 +216,11 @@ def DEIMDecoratedProblem(
                     deim_thetas.append(original_thetas[q])
                 return tuple(deim_thetas)
 
+            def compute_theta_batch(self, term, mus):
+                # Thetas computed with DEIM are not available to vectorized implementations provided by the user,
+                # so evaluate them for each parameter
+                return ParametrizedProblem.compute_theta_batch(self, term, mus)
+
             def _cache_key_from_kwargs(self, **kwargs):
                 cache_key = ParametrizedDifferentialProblem_DerivedClass._cache_key_from_kwargs(self, **kwargs)
                 # Change cache key depending on current stage
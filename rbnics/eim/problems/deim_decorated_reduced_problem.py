@@ -146,6 +146,11 @@ def DEIMDecoratedReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             self._update_N_DEIM(**kwargs)
             ParametrizedReducedDifferentialProblem_DerivedClass._solve(self, N, **kwargs)
 
+        def compute_theta(self, term):
+            # Thetas computed with DEIM depend on the current DEIM approximation (and possibly on the solution),
+            # rather than only on the current parameter, so they are not stored in the theta cache
+            return self.truth_problem.compute_theta(term)
+
         def _update_N_DEIM(self, **kwargs):
             self.truth_problem._update_N_DEIM(**kwargs)
 
@@ -73,7 +73,8 @@ class EIMApproximation(ParametrizedProblem):
             key_generator=_snapshot_cache_key_generator,
             import_=_snapshot_cache_import,
             export=_snapshot_cache_export,
-            filename_generator=_snapshot_cache_filename_generator
+            filename_generator=_snapshot_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     # Initialize data structures required for the online phase
@@ -102,7 +103,7 @@ class EIMApproximation(ParametrizedProblem):
         return self.mu
 
     def _cache_file(self):
-        return hashlib.sha1(str(self._cache_key()).encode("utf-8")).hexdigest()
+        return hashlib.sha1((self.parametrized_expression.name() + str(self._cache_key())).encode("utf-8")).hexdigest()
 
     # Perform an online solve.
     def solve(self, N=None):
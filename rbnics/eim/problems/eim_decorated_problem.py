@@ -12,6 +12,7 @@ from rbnics.eim.backends import OfflineOnlineBackend
 from rbnics.eim.problems.eim_approximation import EIMApproximation
 from rbnics.eim.problems.time_dependent_eim_approximation import TimeDependentEIMApproximation
 from rbnics.eim.utils.decorators import DefineSymbolicParameters
+from rbnics.problems.base import ParametrizedProblem
 from rbnics.eim.utils.io import AffineExpansionSeparatedFormsStorage
 from rbnics.utils.decorators import overload, PreserveClassName, ProblemDecoratorFor, tuple_of
 from rbnics.utils.test import PatchInstanceMethod
@@ -237,6 +238,11 @@ def EIMDecoratedProblem(
                         eim_thetas.append(original_theta)
                 return tuple(eim_thetas)
 
+            def compute_theta_batch(self, term, mus):
+                # Thetas computed with EIM are not available to vectorized implementations provided by the user,
+                # so evaluate them for each parameter
+                return ParametrizedProblem.compute_theta_batch(self, term, mus)
+
             def _cache_key_from_kwargs(self, **kwargs):
                 cache_key = ParametrizedDifferentialProblem_DerivedClass._cache_key_from_kwargs(self, **kwargs)
                 # Change cache key depending on current stage
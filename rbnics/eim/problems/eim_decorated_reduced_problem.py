@@ -146,6 +146,27 @@ def EIMDecoratedReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCla
             self._update_N_EIM(**kwargs)
             ParametrizedReducedDifferentialProblem_DerivedClass._solve(self, N, **kwargs)
 
+        def _solve_many(self, mus, N, **kwargs):
+            self._update_N_EIM(**kwargs)
+            return ParametrizedReducedDifferentialProblem_DerivedClass._solve_many(self, mus, N, **kwargs)
+
+        def _solve_all_sizes(self, N, **kwargs):
+            self._update_N_EIM(**kwargs)
+            return ParametrizedReducedDifferentialProblem_DerivedClass._solve_all_sizes(self, N, **kwargs)
+
+        def _estimate_error_batch(self, mus, N=None, **kwargs):
+            self._update_N_EIM(**kwargs)
+            return ParametrizedReducedDifferentialProblem_DerivedClass._estimate_error_batch(self, mus, N, **kwargs)
+
+        def _estimate_error_all_sizes(self, N=None, **kwargs):
+            self._update_N_EIM(**kwargs)
+            return ParametrizedReducedDifferentialProblem_DerivedClass._estimate_error_all_sizes(self, N, **kwargs)
+
+        def compute_theta(self, term):
+            # Thetas computed with EIM depend on the current EIM approximation (and possibly on the solution),
+            # rather than only on the current parameter, so they are not stored in the theta cache
+            return self.truth_problem.compute_theta(term)
+
         def _update_N_EIM(self, **kwargs):
             self.truth_problem._update_N_EIM(**kwargs)
 
@@ -75,7 +75,8 @@ class TimeDependentEIMApproximation(EIMApproximation):
             key_generator=_snapshot_cache_key_generator,
             import_=_snapshot_cache_import,
             export=_snapshot_cache_export,
-            filename_generator=_snapshot_cache_filename_generator
+            filename_generator=_snapshot_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     # Set initial time
@@ -319,7 +319,7 @@ class EIMApproximationReductionMethod(ReductionMethod):
         error_analysis_table.add_column("error", group_name="eim", operations=("mean", "max"))
         error_analysis_table.add_column("relative_error", group_name="eim", operations=("mean", "max"))
 
-        for (mu_index, mu) in enumerate(self.testing_set):
+        def error_analysis_row(mu_index, mu):
             print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
 
             self.EIM_approximation.set_mu(mu)
@@ -334,6 +334,8 @@ class EIMApproximationReductionMethod(ReductionMethod):
                 error_analysis_table["error", n, mu_index] = abs(error)
                 error_analysis_table["relative_error", n, mu_index] = abs(relative_error)
 
+        self._error_analysis_rows(error_analysis_table, error_analysis_row, filename)
+
         # Print
         print("")
         print(error_analysis_table)
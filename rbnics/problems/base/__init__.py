@@ -27,6 +27,7 @@ from rbnics.problems.base.parametrized_problem import ParametrizedProblem
 from rbnics.problems.base.parametrized_reduced_differential_problem import ParametrizedReducedDifferentialProblem
 from rbnics.problems.base.pod_galerkin_reduced_problem import PODGalerkinReducedProblem
 from rbnics.problems.base.rb_reduced_problem import RBReducedProblem
+from rbnics.problems.base.reduced_problem_server import ReducedProblemServer
 from rbnics.problems.base.time_dependent_pod_galerkin_reduced_problem import TimeDependentPODGalerkinReducedProblem
 from rbnics.problems.base.time_dependent_problem import TimeDependentProblem
 from rbnics.problems.base.time_dependent_rb_reduced_problem import TimeDependentRBReducedProblem
@@ -54,6 +55,7 @@ __all__ = [
     "ParametrizedReducedDifferentialProblem",
     "PODGalerkinReducedProblem",
     "RBReducedProblem",
+    "ReducedProblemServer",
     "TimeDependentPODGalerkinReducedProblem",
     "TimeDependentProblem",
     "TimeDependentRBReducedProblem",
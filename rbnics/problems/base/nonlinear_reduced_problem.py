@@ -29,5 +29,16 @@ def NonlinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass)
                 solver.set_parameters(problem._nonlinear_solver_parameters)
                 solver.solve()
 
+        # Batched solves of the reduced problem, carried out on stacked dense arrays, are only available
+        # for linear problems
+        def _solve_many(self, mus, N, **kwargs):
+            return NotImplemented
+
+        def _solve_batch(self, N, *args, **kwargs):
+            return NotImplemented
+
+        def _solve_all_sizes(self, N, **kwargs):
+            return NotImplemented
+
     # return value (a class) for the decorator
     return NonlinearReducedProblem_Class
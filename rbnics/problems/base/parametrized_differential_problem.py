@@ -7,9 +7,11 @@
 from abc import ABCMeta, abstractmethod
 import os
 import hashlib
+import inspect
 from numbers import Number
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
-from rbnics.backends import AffineExpansionStorage, assign, copy, export, Function, import_, product, sum
+from rbnics.backends import (AffineExpansionStorage, assign, content_hash, copy, export, Function, import_, product,
+                             sum)
 from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import (StoreMapFromProblemNameToProblem, StoreMapFromProblemToTrainingStatus,
                                      StoreMapFromSolutionToProblem)
@@ -64,7 +66,14 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         self._solution = Function(self.V)
         self._output = 0.
         # I/O
-        self.folder["cache"] = os.path.join(self.folder_prefix, "cache")
+        from rbnics.utils.config import config  # cannot import at global scope
+        if config.get("problems", "cache folder") != "":
+            # Cache files are addressed by the content of the problem definition, and can thus be shared
+            # among different problems and different runs
+            self.folder["cache"] = config.get("problems", "cache folder")
+        else:
+            self.folder["cache"] = os.path.join(self.folder_prefix, "cache")
+        self._definition_hash = None
 
         def _solution_cache_key_generator(*args, **kwargs):
             assert len(args) == 1
@@ -89,7 +98,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_solution_cache_key_generator,
             import_=_solution_cache_import,
             export=_solution_cache_export,
-            filename_generator=_solution_cache_filename_generator
+            filename_generator=_solution_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _output_cache_key_generator(*args, **kwargs):
@@ -116,7 +126,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_output_cache_key_generator,
             import_=_output_cache_import,
             export=_output_cache_export,
-            filename_generator=_output_cache_filename_generator
+            filename_generator=_output_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     def name(self):
@@ -129,6 +140,7 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         self._init_operators()
         self._init_inner_products()
         self._init_dirichlet_bc()
+        self._init_definition_hash()
 
     def _init_operators(self):
         """
@@ -388,7 +400,64 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         return (self.mu, tuple(sorted(kwargs.items())))
 
     def _cache_file_from_kwargs(self, **kwargs):
-        return hashlib.sha1(str(self._cache_key_from_kwargs(**kwargs)).encode("utf-8")).hexdigest()
+        return hashlib.sha1(
+            (self._cache_definition_hash() + str(self._cache_key_from_kwargs(**kwargs))).encode("utf-8")).hexdigest()
+
+    def _init_definition_hash(self):
+        """
+        Compute the hash of the problem definition which addresses cache files. Since forms and boundary conditions
+        may depend on the parameter, the hash is computed only once, at the lower bounds of the parameter range,
+        and before operators are replaced by their offline or online approximations. Internal method.
+        """
+        if self._definition_hash is None:  # init was not called already
+            mu = self.mu
+            self.set_mu(tuple([r[0] for r in self.mu_range]))
+            try:
+                self._definition_hash = hashlib.sha1("".join(self._definition_hashes()).encode("utf-8")).hexdigest()
+            finally:
+                self.set_mu(mu)
+
+    def _definition_hashes(self):
+        """
+        Return hashes of the problem definition, i.e. of the function space (and its mesh), of the forms and
+        boundary conditions of each term, and of the source code of compute_theta, so that cache files are
+        not reused after any of them has been changed. Internal method.
+        """
+        hashes = [content_hash(self.V)]
+        for term in self.terms:
+            try:
+                forms = self.assemble_operator(term)
+            except ValueError:  # possibily raised e.g. because output computation is optional
+                pass
+            else:
+                hashes.append(term)
+                hashes.extend(content_hash(form) for form in forms)
+        if len(self.components) > 1:
+            dirichlet_bc_terms = ["dirichlet_bc_" + component for component in self.components]
+        else:
+            dirichlet_bc_terms = ["dirichlet_bc"]
+        for term in dirichlet_bc_terms:
+            try:
+                bcs = self.assemble_operator(term)
+            except ValueError:  # there were no Dirichlet BCs
+                pass
+            else:
+                hashes.append(term)
+                hashes.extend(content_hash(bc) for bc in bcs)
+        for class_ in type(self).__mro__:
+            if "compute_theta" in vars(class_):
+                try:
+                    hashes.append(inspect.getsource(vars(class_)["compute_theta"]))
+                except (OSError, TypeError):  # source code is not available
+                    hashes.append(class_.__qualname__)
+        return hashes
+
+    def _cache_definition_hash(self):
+        """
+        Return the hash of the problem definition computed by init. Internal method.
+        """
+        assert self._definition_hash is not None, "init() must be called before cache files are accessed"
+        return self._definition_hash
 
     def export_solution(self, folder=None, filename=None, solution=None, component=None, suffix=None):
         """
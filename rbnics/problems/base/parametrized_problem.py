@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import array
 from rbnics.utils.io import Folders
 
 
@@ -47,3 +48,21 @@ class ParametrizedProblem(object):
         """
         assert len(mu) == len(self.mu_range), "mu and mu_range must have the same length"
         self.mu = mu
+
+    def compute_theta_batch(self, term, mus):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for several parameters.
+        The default implementation calls compute_theta for each parameter. Problems may override this method
+        with a vectorized evaluation, e.g. by converting mus to an array with numpy.array(mus).
+
+        :param term: the forms of the class of the problem.
+        :param mus: list of parameters.
+        :return: computed thetas, as a (len(mus) x Q) array.
+        """
+        mu = self.mu
+        thetas = list()
+        for mu_i in mus:
+            self.set_mu(tuple(mu_i))
+            thetas.append(self.compute_theta(term))
+        self.set_mu(mu)
+        return array(thetas, dtype=float)
@@ -7,7 +7,9 @@
 from abc import ABCMeta, abstractmethod
 import os
 from math import sqrt
-from numpy import isclose
+from numpy import allclose, array, asarray, identity, isclose, newaxis, tile, zeros
+from numpy.linalg import cholesky, LinAlgError, solve as array_solve
+from scipy.linalg import solve_triangular
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
 from rbnics.backends import assign, BasisFunctionsMatrix, copy, product, sum, transpose
 from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
@@ -67,6 +69,16 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         # Solution: OnlineFunction
         self._solution = None
         self._output = 0.
+        # Truth solve pinned for the current parameter (e.g. during error analysis), so that the truth solution
+        # is computed once and reused for every reduced dimension: cache key of the truth solve, if any
+        self._pinned_truth_solve = None
+        # Squared norms and projections onto the reduced basis of the pinned truth solution: from inner product
+        # to tuple, and Gram matrices of the reduced basis: from inner product to tuple
+        self._pinned_truth_norms = None
+        self._pinned_basis_functions_gram = dict()
+        # Errors (relative to the truth solution) below the square root of this tolerance are computed by a
+        # full order reconstruction even if the truth solution is pinned, to avoid cancellation
+        self._pinned_truth_norm_tolerance = 1.e-8
 
         # I/O
         def _solution_cache_key_generator(*args, **kwargs):
@@ -89,6 +101,21 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             key_generator=_output_cache_key_generator
         )
 
+        # Thetas are memoized only if the problem opts in, because this requires that they only depend on the
+        # current parameter (and time), rather than on any other state of the truth problem (e.g. a flag changed
+        # while solving the reduced problem)
+        self.cache_thetas = False
+
+        def _theta_cache_key_generator(*args, **kwargs):
+            assert len(args) == 2
+            assert args[0] == self.mu
+            return self._theta_cache_key(args[1])
+
+        self._theta_cache = Cache(
+            "thetas",
+            key_generator=_theta_cache_key_generator
+        )
+
         # $$ OFFLINE DATA STRUCTURES $$ #
         # High fidelity problem
         self.truth_problem = truth_problem
@@ -341,6 +368,122 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             delattr(self, "_is_solving")
         return self._solution
 
+    def solve_many(self, mus, N=None, **kwargs):
+        """
+        Perform an online solve for all parameters in mus. Reduced operators are kept in memory, and reduced
+        problems are solved as a batch if supported by the problem, or one parameter at a time otherwise.
+
+        :param mus : parameters for which the reduced problem should be solved
+        :type mus : iterable of tuples
+        :param N : Dimension of the reduced problem
+        :type N : integer
+        :return: reduced solutions, stored as a (len(mus) x N) array
+        """
+        mu = self.mu
+        N_with_bc, kwargs_with_bc = self._online_size_from_kwargs(N, **kwargs)
+        N_with_bc += self.N_bc
+        solutions = self._solve_many(mus, N_with_bc, **kwargs_with_bc)
+        if solutions is NotImplemented:
+            solutions = list()
+            for mu_i in mus:
+                self.set_mu(mu_i)
+                solutions.append(asarray(self.solve(N, **kwargs).vector(), dtype=float).reshape(-1))
+            solutions = array(solutions, dtype=float).reshape(len(solutions), -1)
+        self.set_mu(mu)
+        return solutions
+
+    def _solve_many(self, mus, N, **kwargs):
+        """
+        Perform an online solve for all parameters in mus as a batch. Returns NotImplemented if batched solves
+        are not supported by the problem. Internal method.
+        """
+        return NotImplemented
+
+    def solve_all_sizes(self, N=None, **kwargs):
+        """
+        Perform an online solve at the current parameter for every dimension n = 1, ..., N of the reduced problem.
+        If supported by the problem, all reduced problems are solved at once starting from the reduced system
+        of largest dimension, otherwise they are solved one dimension at a time. Reduced solutions are stored
+        in the solution cache, so that a following call to solve(n) does not solve the reduced problem again.
+
+        :param N : Largest dimension of the reduced problem
+        :type N : integer
+        :return: reduced solutions, stored as a list of length N
+        """
+        N, kwargs = self._online_size_from_kwargs(N, **kwargs)
+        if isinstance(N, dict):
+            all_N = range(1, min(N.values()) + 1)
+            solutions = NotImplemented
+        else:
+            all_N = range(1, N + 1)
+            if N == 0:  # trivial case
+                return list()
+            assert not hasattr(self, "_is_solving")
+            self._is_solving = True
+            solutions = self._solve_all_sizes(N + self.N_bc, **kwargs)
+            delattr(self, "_is_solving")
+        if solutions is NotImplemented:
+            return [copy(self.solve(n, **kwargs)) for n in all_N]
+        else:
+            all_solutions = list()
+            for (n, solution_n) in zip(all_N, solutions):
+                n += self.N_bc
+                solution = OnlineFunction(n)
+                solution.vector()[:] = solution_n[:n]
+                self._solution_cache[self.mu, n, kwargs] = copy(solution)
+                all_solutions.append(solution)
+            self._latest_solve_kwargs = kwargs
+            self._solution = copy(all_solutions[-1])
+            return all_solutions
+
+    def _solve_all_sizes(self, N, **kwargs):
+        """
+        Perform an online solve at the current parameter for every dimension of the reduced problem up to N
+        at once. Returns the reduced solutions as a (N - N_bc x N) array, padded with zeros, or NotImplemented
+        if this is not supported by the problem. Internal method.
+        """
+        return NotImplemented
+
+    def _is_solve_overridden(self, stacked_solver_name):
+        """
+        Check if _solve has been overridden (e.g. by a decorator customizing the online solve) in a class derived
+        from the one which provides the stacked solver stacked_solver_name. Stacked solvers do not call _solve,
+        hence they should not be used in such case. Internal method.
+        """
+        for class_ in type(self).__mro__:
+            if stacked_solver_name in class_.__dict__:
+                return False
+            elif "_solve" in class_.__dict__:
+                return True
+        return False
+
+    def _solve_leading_principal_subsystems(self, lhs, rhs, all_N):
+        """
+        Solve the leading principal subsystems lhs[:n, :n] x = rhs[:n] of a dense reduced system, for every n
+        in all_N. If lhs is symmetric positive definite its Cholesky factor provides the factorization of every
+        leading principal submatrix, so that a single factorization is carried out; otherwise, subsystems are
+        padded with the identity to a common dimension and solved as a batch. Returns the solutions as a
+        (len(all_N) x N) array, padded with zeros. Internal method.
+        """
+        N = lhs.shape[0]
+        if allclose(lhs, lhs.T):
+            try:
+                L = cholesky(lhs)
+            except LinAlgError:  # lhs is not positive definite
+                pass
+            else:
+                L_inv_rhs = solve_triangular(L, rhs, lower=True)
+                solutions = zeros((len(all_N), N))
+                for (i, n) in enumerate(all_N):
+                    solutions[i, :n] = solve_triangular(L[:n, :n], L_inv_rhs[:n], lower=True, trans="T")
+                return solutions
+        padded_lhs = tile(identity(N), (len(all_N), 1, 1))
+        padded_rhs = zeros((len(all_N), N))
+        for (i, n) in enumerate(all_N):
+            padded_lhs[i, :n, :n] = lhs[:n, :n]
+            padded_rhs[i, :n] = rhs[:n]
+        return array_solve(padded_lhs, padded_rhs[..., newaxis])[..., 0]
+
     class ProblemSolver(object, metaclass=ABCMeta):
         def __init__(self, problem, N, **kwargs):
             self.problem = problem
@@ -376,6 +519,43 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         problem_solver = self.ProblemSolver(self, N, **kwargs)
         problem_solver.solve()
 
+    def _bc_eval_batch(self, mus, N):
+        """
+        Evaluate the Dirichlet boundary conditions values for all parameters in mus. Internal method.
+        """
+        bcs = list()
+        for mu in mus:
+            self.set_mu(mu)
+            bcs_mu = self.ProblemSolver(self, N).bc_eval()
+            if bcs_mu is None:  # no non-homogeneous boundary conditions, regardless of the parameter
+                return [None] * len(mus)
+            bcs.append(bcs_mu)
+        return bcs
+
+    def _apply_bcs_batch(self, lhs, rhs, N, bcs):
+        """
+        Apply Dirichlet boundary conditions to a stack of reduced systems, stored as (n_mu x N x N) and
+        (n_mu x N) arrays. Internal method.
+        """
+        assert len(bcs) == lhs.shape[0]
+        if bcs[0] is None:
+            return
+        elif isinstance(bcs[0], dict):
+            rows = list()
+            base_index = 0
+            for (component, N_component) in N.items():
+                if component in bcs[0]:
+                    rows.extend(range(base_index, base_index + len(bcs[0][component])))
+                base_index += N_component
+            values = array([[bc_i for component in N if component in bcs_mu for bc_i in bcs_mu[component]]
+                            for bcs_mu in bcs])
+        else:
+            rows = list(range(len(bcs[0])))
+            values = array(bcs)
+        lhs[:, rows, :] = 0.
+        lhs[:, rows, rows] = 1.
+        rhs[:, rows] = values
+
     def project(self, snapshot, N=None, on_dirichlet_bc=True, **kwargs):
         N, kwargs = self._online_size_from_kwargs(N, **kwargs)
         N += self.N_bc
@@ -398,7 +578,11 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             solver = OnlineLinearSolver(inner_product_N, projected_snapshot_N,
                                         transpose(basis_functions) * inner_product * snapshot,
                                         self._combined_and_homogenized_dirichlet_bc)
-        solver.set_parameters(self._linear_solver_parameters)
+        # The inner product matrix is parameter independent, and symmetric unless Dirichlet rows are replaced
+        solver_parameters = dict(self._linear_solver_parameters)
+        solver_parameters["parameter_independent"] = True
+        solver_parameters["symmetric"] = on_dirichlet_bc
+        solver.set_parameters(solver_parameters)
         solver.solve()
         return projected_snapshot_N
 
@@ -420,6 +604,21 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             self._output_cache[self.mu, N, kwargs] = self._output
         return self._output
 
+    def compute_output_all_sizes(self, N=None, **kwargs):
+        """
+        Perform an online evaluation of the output at the current parameter for every dimension n = 1, ..., N
+        of the reduced problem, solving all reduced problems at once by means of solve_all_sizes().
+
+        :return: reduced outputs, stored as a list of length N
+        """
+        all_N = range(1, len(self.solve_all_sizes(N, **kwargs)) + 1)
+        _, kwargs = self._online_size_from_kwargs(N, **kwargs)
+        outputs = list()
+        for n in all_N:
+            self.solve(n, **kwargs)  # reduced solution is read from the cache
+            outputs.append(self.compute_output())
+        return outputs
+
     def _compute_output(self, N):
         """
         Perform an online evaluation of the output.
@@ -478,13 +677,70 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             self.projection_inner_product = self.assemble_operator("projection_inner_product", current_stage)
         self._combined_projection_inner_product = self._combine_all_projection_inner_products()
 
+    def pin_truth_solution(self, **kwargs):
+        """
+        Solve the truth problem for the current parameter, and reuse its solution and output in the computation
+        of errors until unpin_truth_solution() is called. Errors in the inner products of the truth problem
+        are then evaluated from the projection of the truth solution onto the reduced basis, rather than from
+        a full order reconstruction of the reduced solution.
+        """
+        self.truth_problem.solve(**kwargs)
+        self.truth_problem.compute_output()
+        self._pinned_truth_solve = self.truth_problem._cache_key_from_kwargs(**kwargs)
+        self._pinned_truth_norms = dict()
+
+    def unpin_truth_solution(self):
+        """
+        Stop reusing the truth solution pinned by pin_truth_solution().
+        """
+        self._pinned_truth_solve = None
+        self._pinned_truth_norms = None
+        self._pinned_basis_functions_gram.clear()
+
+    def _is_truth_solution_pinned(self, **kwargs):
+        return (self._pinned_truth_solve is not None
+                and self._pinned_truth_solve == self.truth_problem._cache_key_from_kwargs(**kwargs))
+
+    def _get_pinned_truth_norm(self, inner_product, **kwargs):
+        """
+        Return the squared norm of the pinned truth solution, its projection onto the reduced basis and the Gram
+        matrix of the reduced basis in the provided inner product, or None if the truth solution is not pinned
+        or the inner product is not one of the (parameter independent) inner products of the truth problem.
+        Internal method.
+        """
+        if self._pinned_truth_norms is None or not self._is_truth_solution_pinned(**kwargs):
+            return None
+        if isinstance(self.truth_problem.inner_product, dict):
+            truth_inner_products = [
+                inner_product_component[0] for inner_product_component in self.truth_problem.inner_product.values()]
+        else:
+            truth_inner_products = [self.truth_problem.inner_product[0]]
+        if not any(inner_product is truth_inner_product for truth_inner_product in truth_inner_products):
+            return None
+        # Gram matrix of the reduced basis, which is computed once for all parameters
+        basis_functions_length = tuple(self.basis_functions._component_name_to_basis_component_length.items())
+        if (id(inner_product) not in self._pinned_basis_functions_gram
+                or self._pinned_basis_functions_gram[id(inner_product)][0] != basis_functions_length):
+            self._pinned_basis_functions_gram[id(inner_product)] = (
+                basis_functions_length, transpose(self.basis_functions) * inner_product * self.basis_functions)
+        basis_functions_gram = self._pinned_basis_functions_gram[id(inner_product)][1]
+        # Squared norm and projection of the truth solution, which are computed once for the current parameter
+        if id(inner_product) not in self._pinned_truth_norms:
+            truth_solution = self.truth_problem._solution
+            self._pinned_truth_norms[id(inner_product)] = (
+                transpose(truth_solution) * inner_product * truth_solution,
+                transpose(self.basis_functions) * inner_product * truth_solution)
+        (truth_solution_norm_squared, truth_solution_projection) = self._pinned_truth_norms[id(inner_product)]
+        return (truth_solution_norm_squared, truth_solution_projection, basis_functions_gram)
+
     def compute_error(self, **kwargs):
         """
         Returns the function _compute_error() evaluated for the desired parameter.
 
         :return: error between online and offline solutions.
         """
-        self.truth_problem.solve(**kwargs)
+        if not self._is_truth_solution_pinned(**kwargs):
+            self.truth_problem.solve(**kwargs)
         return self._compute_error(**kwargs)
 
     def _compute_error(self, **kwargs):
@@ -498,11 +754,29 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         # Compute the error on the solution
         if len(components) > 0:
             N = self._solution.N
-            reduced_solution = self.basis_functions[:N] * self._solution
-            truth_solution = self.truth_problem._solution
-            error_function = truth_solution - reduced_solution
+            error_function = None
             for component in components:
-                error_norm_squared_component = transpose(error_function) * inner_product[component] * error_function
+                # Expand the squared norm of the error in terms of the projection of the pinned truth solution,
+                # unless the error is so small compared to the truth solution that the expansion would be
+                # affected by cancellation
+                error_norm_squared_component = None
+                pinned_truth_norm = self._get_pinned_truth_norm(inner_product[component], **kwargs)
+                if pinned_truth_norm is not None:
+                    (truth_solution_norm_squared, truth_solution_projection, basis_functions_gram) = pinned_truth_norm
+                    error_norm_squared_component = (
+                        truth_solution_norm_squared
+                        - 2. * (transpose(self._solution) * truth_solution_projection[:N])
+                        + transpose(self._solution) * basis_functions_gram[:N, :N] * self._solution)
+                    if error_norm_squared_component < self._pinned_truth_norm_tolerance * truth_solution_norm_squared:
+                        error_norm_squared_component = None
+                # Otherwise, compute the error from the full order reconstruction of the reduced solution
+                if error_norm_squared_component is None:
+                    if error_function is None:
+                        reduced_solution = self.basis_functions[:N] * self._solution
+                        truth_solution = self.truth_problem._solution
+                        error_function = truth_solution - reduced_solution
+                    error_norm_squared_component = (
+                        transpose(error_function) * inner_product[component] * error_function)
                 assert error_norm_squared_component >= 0. or isclose(error_norm_squared_component, 0.)
                 error[component] = sqrt(abs(error_norm_squared_component))
         # Simplify trivial case
@@ -537,8 +811,12 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         if len(components) > 0:
             truth_solution = self.truth_problem._solution
             for component in components:
-                truth_solution_norm_squared_component = (
-                    transpose(truth_solution) * inner_product[component] * truth_solution)
+                pinned_truth_norm = self._get_pinned_truth_norm(inner_product[component], **kwargs)
+                if pinned_truth_norm is not None:
+                    truth_solution_norm_squared_component = pinned_truth_norm[0]
+                else:
+                    truth_solution_norm_squared_component = (
+                        transpose(truth_solution) * inner_product[component] * truth_solution)
                 assert truth_solution_norm_squared_component >= 0. or isclose(truth_solution_norm_squared_component, 0.)
                 if truth_solution_norm_squared_component != 0.:
                     relative_error[component] = (
@@ -589,8 +867,9 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
 
         :return: output error.
         """
-        self.truth_problem.solve(**kwargs)
-        self.truth_problem.compute_output()
+        if not self._is_truth_solution_pinned(**kwargs):
+            self.truth_problem.solve(**kwargs)
+            self.truth_problem.compute_output()
         return self._compute_error_output(**kwargs)
 
     # Internal method for output error computation
@@ -673,7 +952,54 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         :param term: the forms of the class of the problem.
         :return: computed thetas.
         """
-        return self.truth_problem.compute_theta(term)
+        if not self.cache_thetas:
+            return self.truth_problem.compute_theta(term)
+        try:
+            return self._theta_cache[self.mu, term]
+        except KeyError:
+            theta = self.truth_problem.compute_theta(term)
+            self._theta_cache[self.mu, term] = theta
+            return theta
+
+    def _theta_cache_key(self, term):
+        return (self.mu, term)
+
+    def _compute_theta_batch(self, term, mus):
+        """
+        Return theta multiplicative terms of the affine expansion for all parameters in mus, as a
+        (len(mus) x Q) array. Internal method.
+        """
+        return self.truth_problem.compute_theta_batch(term, mus)
+
+    def _precompute_thetas(self, mus):
+        """
+        Evaluate theta multiplicative terms of the affine expansion for all parameters in mus as a batch,
+        and store them in the theta cache, if thetas are memoized. Internal method.
+        """
+        if not self.cache_thetas:
+            return
+        mu = self.mu
+        for term in self.terms:
+            if self.Q[term] == 0:  # optional term which has not been provided, e.g. the output
+                continue
+            thetas = self._compute_theta_batch(term, mus)
+            for (mu_i, theta_i) in zip(mus, thetas):
+                self.set_mu(mu_i)
+                self._theta_cache[self.mu, term] = tuple(float(theta_ij) for theta_ij in theta_i)
+        self.set_mu(mu)
+
+    def _stack_affine_expansion_storage(self, storage, *Q):
+        """
+        Stack the content of an online affine expansion storage in a single dense array, of shape (Q x ...) for
+        storages with one index, and (Q1 x Q2 x ...) for storages with two indices. Returns NotImplemented
+        if the storage does not contain an affine expansion. Internal method.
+        """
+        if not isinstance(storage, OnlineAffineExpansionStorage):
+            return NotImplemented
+        assert len(Q) in (1, 2)
+        stacked_storage = asarray(storage, dtype=float)  # stacked content is cached by the storage itself
+        assert stacked_storage.shape[:len(Q)] == Q
+        return stacked_storage
 
     # Assemble the reduced order affine expansion
     def assemble_operator(self, term, current_stage="online"):
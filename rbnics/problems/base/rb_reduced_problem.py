@@ -7,8 +7,10 @@
 import os
 from abc import ABCMeta, abstractmethod
 from numbers import Number
-from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, LinearSolver, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage
+from math import sqrt
+from numpy import array, asarray, concatenate, einsum
+from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, GramSchmidt, LinearSolver, transpose
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix
 from rbnics.utils.decorators import overload, PreserveClassName, RequiredBaseDecorators
 
 
@@ -36,6 +38,14 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self.ErrorEstimationOperatorExpansionStorage = OnlineAffineExpansionStorage
             self.error_estimation_operator = dict()  # from string to ErrorEstimationOperatorExpansionStorage
             self.error_estimation_terms = list()  # of tuple
+            # Switch to evaluate the residual norm as the norm of its coefficients with respect to an orthonormal
+            # basis of the Riesz representors, rather than through the quadratic form defined by the
+            # error estimation operators
+            self.compress_residual = False
+            self.riesz_compression = None  # OnlineAffineExpansionStorage of size 1, setup by init()
+            # Error estimation terms which are replaced by the compressed residual representation, and are thus
+            # not assembled when compress_residual is set. Empty for problems which do not support compression
+            self.compressed_error_estimation_terms = list()  # of tuple
 
             # $$ OFFLINE DATA STRUCTURES $$ #
             # Residual terms
@@ -43,6 +53,8 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._riesz_solve_inner_product = None  # setup by init()
             self._riesz_solve_homogeneous_dirichlet_bc = None  # setup by init()
             self._error_estimation_inner_product = None  # setup by init()
+            self._riesz_compression_basis = None  # orthonormal basis of the Riesz representors, setup by init()
+            self._riesz_compression_gram_schmidt = None  # setup by init()
             # I/O
             self.folder["error_estimation"] = os.path.join(self.folder_prefix, "error_estimation")
 
@@ -98,14 +110,32 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                         self._riesz_solve_inner_product & ~self._riesz_solve_homogeneous_dirichlet_bc)
                 else:
                     self._error_estimation_inner_product = self._riesz_solve_inner_product
+            # Initialize storage for the compressed residual representation
+            if self.compress_residual:
+                assert len(self.compressed_error_estimation_terms) > 0, (
+                    "Compressed residual representation is not available for this problem")
+                assert len(self.components) == 1, (
+                    "Compressed residual representation is not available for problems with several components")
+                if self.riesz_compression is None:  # init was not called already
+                    self.riesz_compression = OnlineAffineExpansionStorage(1)
+                    self._riesz_compression_basis = FunctionsList(self.truth_problem.V)
+                    self._riesz_compression_gram_schmidt = GramSchmidt(
+                        self.truth_problem.V, self._error_estimation_inner_product)
+                assert current_stage in ("online", "offline")
+                if current_stage == "online":
+                    self.compress_riesz_representation("online")
+                elif current_stage == "offline":
+                    pass  # Nothing else to be done
+                else:
+                    raise ValueError("Invalid stage in _init_error_estimation_operators().")
             # Initialize error estimation operators
-            for term in self.error_estimation_terms:
+            for term in self._get_assembled_error_estimation_terms():
                 if term not in self.error_estimation_operator:  # init was not called already
                     self.error_estimation_operator[term] = self.ErrorEstimationOperatorExpansionStorage(
                         self.Q[term[0]], self.Q[term[1]])
             assert current_stage in ("online", "offline")
             if current_stage == "online":
-                for term in self.error_estimation_terms:
+                for term in self._get_assembled_error_estimation_terms():
                     self.assemble_error_estimation_operators(term, "online")
             elif current_stage == "offline":
                 pass  # Nothing else to be done
@@ -127,6 +157,54 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             raise NotImplementedError("The method estimate_relative_error() is problem-specific"
                                       + " and needs to be overridden.")
 
+        def estimate_error_many(self, mus, N=None, **kwargs):
+            """
+            It returns an array of error bounds for all parameters in mus, evaluated as a batch if supported
+            by the problem, or one parameter at a time otherwise.
+            """
+            mu = self.mu
+            error_estimators = self._estimate_error_batch(mus, N, **kwargs)
+            if error_estimators is NotImplemented:
+                error_estimators = list()
+                for mu_i in mus:
+                    self.set_mu(mu_i)
+                    self.solve(N, **kwargs)
+                    error_estimators.append(self.estimate_error())
+                error_estimators = array(error_estimators, dtype=float)
+            self.set_mu(mu)
+            return error_estimators
+
+        def _estimate_error_batch(self, mus, N=None, **kwargs):
+            """
+            It returns an array of error bounds for all parameters in mus, by solving the reduced problems
+            as a batch, or NotImplemented if the batched evaluation is not available. Internal method.
+            """
+            return NotImplemented
+
+        def estimate_error_all_sizes(self, N=None, **kwargs):
+            """
+            It returns an array of error bounds at the current parameter for every dimension n = 1, ..., N of
+            the reduced problem, evaluated at once if supported by the problem, or one dimension at a time otherwise.
+            """
+            error_estimators = self._estimate_error_all_sizes(N, **kwargs)
+            if error_estimators is NotImplemented:
+                all_N = range(1, len(self.solve_all_sizes(N, **kwargs)) + 1)
+                _, kwargs = self._online_size_from_kwargs(N, **kwargs)
+                error_estimators = list()
+                for n in all_N:
+                    self.solve(n, **kwargs)  # reduced solution is read from the cache
+                    error_estimators.append(self.estimate_error())
+                error_estimators = array(error_estimators, dtype=float)
+            return error_estimators
+
+        def _estimate_error_all_sizes(self, N=None, **kwargs):
+            """
+            It returns an array of error bounds at the current parameter for every dimension of the reduced problem
+            up to N, by solving all reduced problems at once, or NotImplemented if this is not available.
+            Internal method.
+            """
+            return NotImplemented
+
         def estimate_error_output(self):
             """
             It returns an error bound for the current output.
@@ -158,17 +236,28 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                         # Compute the Riesz representation of terms that do not depend on the solution
                         self.compute_riesz_representation(term, current_stage)
                         # Compute the (term, term) Riesz representors product
-                        if (term, term) in self.error_estimation_terms:
+                        if (term, term) in self._get_assembled_error_estimation_terms():
                             self.assemble_error_estimation_operators((term, term), current_stage)
                 else:  # self.terms_order[term] > 1:
                     self.compute_riesz_representation(term, current_stage)
 
             # Update the (term1, term2) Riesz representors product with the new basis function
-            for term in self.error_estimation_terms:
+            for term in self._get_assembled_error_estimation_terms():
                 # the (1, 1) part does not depend on N, and was computed in the previous loop
                 if (self.terms_order[term[0]], self.terms_order[term[1]]) != (1, 1):
                     self.assemble_error_estimation_operators(term, current_stage)
 
+            # Update the compressed residual representation with the new Riesz representors
+            if self.compress_residual:
+                self.compress_riesz_representation(current_stage)
+
+        def _get_assembled_error_estimation_terms(self):
+            if self.compress_residual:
+                return [term for term in self.error_estimation_terms
+                        if term not in self.compressed_error_estimation_terms]
+            else:
+                return self.error_estimation_terms
+
         def compute_riesz_representation(self, term, current_stage="offline"):
             """
             It computes the Riesz representation of term.
@@ -201,6 +290,95 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             else:
                 raise ValueError("Invalid value for order of term " + term)
 
+        def compress_riesz_representation(self, current_stage="offline"):
+            """
+            It computes the coefficients of the Riesz representors with respect to an orthonormal basis of their span.
+            Representors are ordered as follows: first the ones of terms of order 1, and then the ones of terms
+            of order 2 associated to each basis function, so that representors associated to the first N basis
+            functions always come first.
+            """
+            assert current_stage in ("online", "offline")
+            if current_stage == "online":  # load from file
+                self.riesz_compression.load(self.folder["error_estimation"], "riesz_compression")
+                return self.riesz_compression
+            elif current_stage == "offline":
+                representors = self._get_ordered_riesz_representors()
+                basis = self._riesz_compression_basis
+                if len(basis) > 0:
+                    previous_compression = self.riesz_compression[0]
+                    (previous_rank, previous_length) = (previous_compression.M, previous_compression.N)
+                else:
+                    previous_compression = None
+                    (previous_rank, previous_length) = (0, 0)
+                # Orthonormalize new representors with respect to the current basis, discarding the ones
+                # which (up to round-off) already belong to its span
+                new_representors = FunctionsList(self.truth_problem.V)
+                for representor in representors[previous_length:]:
+                    new_representors.enrich(representor)
+                    representor_norm = sqrt(abs(
+                        transpose(representor) * self._error_estimation_inner_product * representor))
+                    new_basis_function = self._riesz_compression_gram_schmidt.apply(representor, basis)
+                    new_coefficient = (
+                        transpose(new_basis_function) * self._error_estimation_inner_product * representor)
+                    if new_coefficient > 1.e-12 * representor_norm:
+                        basis.enrich(new_basis_function)
+                # Previous representors have no component along the new basis functions, so that only
+                # the coefficients of the new representors need to be computed
+                compression = OnlineMatrix(len(basis), len(representors))
+                if previous_compression is not None:
+                    compression[:previous_rank, :previous_length] = previous_compression
+                if len(basis) > 0 and len(new_representors) > 0:
+                    compression[:, previous_length:] = (
+                        transpose(basis) * self._error_estimation_inner_product * new_representors)
+                self.riesz_compression[0] = compression
+                self.riesz_compression.save(self.folder["error_estimation"], "riesz_compression")
+                return self.riesz_compression
+            else:
+                raise ValueError("Invalid stage in compress_riesz_representation().")
+
+        def _get_ordered_riesz_representors(self):
+            representors = list()
+            for term in self.riesz_terms:
+                if self.terms_order[term] == 1:
+                    for q in range(self.Q[term]):
+                        assert len(self.riesz[term][q]) == 1
+                        representors.append(self.riesz[term][q][0])
+            lengths = set([len(self.riesz[term][q])
+                           for term in self.riesz_terms if self.terms_order[term] == 2 for q in range(self.Q[term])])
+            assert len(lengths) in (0, 1)
+            for n in range(lengths.pop() if len(lengths) > 0 else 0):
+                for term in self.riesz_terms:
+                    if self.terms_order[term] == 2:
+                        for q in range(self.Q[term]):
+                            representors.append(self.riesz[term][q][n])
+            return representors
+
+        def get_compressed_residual_norm_squared(self):
+            """
+            It returns the squared norm of the residual of the current solution, evaluated as the squared norm
+            of its coefficients with respect to an orthonormal basis of the Riesz representors.
+            """
+            thetas = {term: array(self.compute_theta(term), dtype=float).reshape(1, -1) for term in self.riesz_terms}
+            solution = asarray(self._solution, dtype=float).reshape(1, -1)
+            return self._get_compressed_residual_norm_squared_batch(thetas, solution)[0]
+
+        def _get_compressed_residual_norm_squared_batch(self, thetas, solutions):
+            # thetas is a dict from terms to (number of parameters x Q) arrays, and solutions is a
+            # (number of parameters x N) array
+            (m, N) = solutions.shape
+            coefficients = list()
+            for term in self.riesz_terms:
+                if self.terms_order[term] == 1:
+                    coefficients.append(thetas[term])
+            if any([self.terms_order[term] == 2 for term in self.riesz_terms]):
+                thetas_2 = concatenate([thetas[term] for term in self.riesz_terms if self.terms_order[term] == 2],
+                                       axis=1)
+                coefficients.append(einsum("mn,mq->mnq", solutions, thetas_2).reshape(m, -1))
+            coefficients = concatenate(coefficients, axis=1)
+            compression = asarray(self.riesz_compression[0])[:, :coefficients.shape[1]]
+            residuals = coefficients.dot(compression.T)
+            return einsum("mr,mr->m", residuals, residuals)
+
         class RieszSolver(object):
             def __init__(self, problem):
                 self.problem = problem
@@ -0,0 +1,172 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import json
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from queue import Empty, Queue
+from socketserver import ThreadingMixIn
+from threading import Thread
+from numpy import cumsum, split
+
+
+class ReducedProblemServer(object):
+    """
+    Serve online queries on a reduced problem, keeping its reduced operators resident in memory.
+    Queries may be submitted concurrently (e.g. from several threads, or through the HTTP interface
+    started by serve()): a dispatcher thread collects all pending queries of the same kind and
+    reduced dimension, and evaluates them as a single batch on the reduced problem.
+
+    :param reduced_problem: reduced problem, already initialized for the online stage.
+    :param N: default dimension of the reduced problem (if not provided, the reduced problem dimension is used).
+    """
+
+    def __init__(self, reduced_problem, N=None):
+        self.reduced_problem = reduced_problem
+        self.N = N
+        self._queries = Queue()
+        self._dispatcher = Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+        self._http_server = None
+        self._http_server_thread = None
+
+    def solve_many(self, mus, N=None):
+        """
+        Solve the reduced problem for all parameters in mus.
+
+        :return: reduced solutions, stored as a (len(mus) x N) array
+        """
+        return self.submit_solve_many(mus, N).result()
+
+    def estimate_error_many(self, mus, N=None):
+        """
+        Evaluate the error estimator for all parameters in mus.
+
+        :return: error estimators, stored as an array of length len(mus)
+        """
+        return self.submit_estimate_error_many(mus, N).result()
+
+    def submit_solve_many(self, mus, N=None):
+        """
+        Submit a query to solve the reduced problem for all parameters in mus, without waiting for its result.
+
+        :return: a future for the (len(mus) x N) array of reduced solutions
+        """
+        return self._submit("solve_many", mus, N)
+
+    def submit_estimate_error_many(self, mus, N=None):
+        """
+        Submit a query to evaluate the error estimator for all parameters in mus, without waiting for its result.
+
+        :return: a future for the array of error estimators
+        """
+        return self._submit("estimate_error_many", mus, N)
+
+    def _submit(self, method, mus, N):
+        mus = [tuple(float(mu_p) for mu_p in mu) for mu in mus]
+        if N is None:
+            N = self.N
+        future = Future()
+        self._queries.put((method, mus, N, future))
+        return future
+
+    def _dispatch(self):
+        while True:
+            query = self._queries.get()
+            if query is None:  # sent by shutdown()
+                break
+            # Collect all pending queries, grouped by kind and reduced dimension
+            pending_queries = dict()
+            while query is not None:
+                (method, mus, N, future) = query
+                pending_queries.setdefault((method, repr(N)), (method, N, list()))[2].append((mus, future))
+                try:
+                    query = self._queries.get_nowait()
+                except Empty:
+                    query = None
+                else:
+                    if query is None:  # sent by shutdown(): serve the current queries, then stop
+                        self._queries.put(None)
+            # Evaluate each group as a single batch, and split results among queries
+            for (method, N, queries) in pending_queries.values():
+                queries = [(mus, future) for (mus, future) in queries if future.set_running_or_notify_cancel()]
+                if len(queries) == 0:
+                    continue
+                all_mus = [mu for (mus, _) in queries for mu in mus]
+                try:
+                    results = getattr(self.reduced_problem, method)(all_mus, N)
+                except Exception as e:
+                    for (_, future) in queries:
+                        future.set_exception(e)
+                else:
+                    offsets = cumsum([len(mus) for (mus, _) in queries])[:-1]
+                    for ((_, future), result) in zip(queries, split(results, offsets)):
+                        future.set_result(result)
+
+    def serve(self, host="localhost", port=0):
+        """
+        Start a HTTP server in a background thread. Queries are sent as POST requests to the /solve_many
+        and /estimate_error_many paths, with a JSON body {"mus": [[...], ...], "N": ...} ("N" is optional),
+        and results are returned as a JSON body {"result": [...]}.
+
+        :return: host and port the server is listening on (the port is chosen by the system if 0 is provided)
+        """
+        assert self._http_server is None
+        self._http_server = _ThreadingHTTPServer((host, port), _RequestHandler)
+        self._http_server.reduced_problem_server = self
+        self._http_server_thread = Thread(target=self._http_server.serve_forever, daemon=True)
+        self._http_server_thread.start()
+        return self._http_server.server_address
+
+    def shutdown(self):
+        """
+        Stop the HTTP server (if any) and the dispatcher thread.
+        """
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server_thread.join()
+            self._http_server = None
+            self._http_server_thread = None
+        if self._dispatcher.is_alive():
+            self._queries.put(None)
+            self._dispatcher.join()
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server.reduced_problem_server
+        submit = {
+            "/solve_many": server.submit_solve_many,
+            "/estimate_error_many": server.submit_estimate_error_many
+        }
+        if self.path not in submit:
+            self.send_error(404)
+            return
+        try:
+            query = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+            future = submit[self.path](query["mus"], query.get("N"))
+        except (KeyError, TypeError, ValueError) as e:
+            self.send_error(400, str(e))
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        body = json.dumps({"result": result.tolist()}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # do not print a line for each query
@@ -4,8 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import hashlib
 from numbers import Number
-from rbnics.backends import (AffineExpansionStorage, assign, copy, Function, product, sum,
+from rbnics.backends import (AffineExpansionStorage, assign, content_hash, copy, Function, product, sum,
                              TimeDependentProblemWrapper, TimeSeries, TimeStepping)
 from rbnics.backends.abstract import TimeSeries as AbstractTimeSeries
 from rbnics.utils.cache import Cache, TimeSeriesCache
@@ -69,7 +70,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_solution_cache_key_generator,
                 import_=_solution_cache_import,
                 export=_solution_cache_export,
-                filename_generator=_solution_cache_filename_generator
+                filename_generator=_solution_cache_filename_generator,
+                folder=self.folder["cache"]
             )
 
             def _solution_dot_cache_key_generator(*args, **kwargs):
@@ -95,7 +97,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_solution_dot_cache_key_generator,
                 import_=_solution_dot_cache_import,
                 export=_solution_dot_cache_export,
-                filename_generator=_solution_dot_cache_filename_generator
+                filename_generator=_solution_dot_cache_filename_generator,
+                folder=self.folder["cache"]
             )
             del self._solution_cache
 
@@ -122,10 +125,33 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_output_cache_key_generator,
                 import_=_output_cache_import,
                 export=_output_cache_export,
-                filename_generator=_output_cache_filename_generator
+                filename_generator=_output_cache_filename_generator,
+                folder=self.folder["cache"]
             )
             del self._output_cache
 
+        def _definition_hashes(self):
+            hashes = ParametrizedDifferentialProblem_DerivedClass._definition_hashes(self)
+            if len(self.components) > 1:
+                initial_condition_terms = ["initial_condition_" + component for component in self.components]
+            else:
+                initial_condition_terms = ["initial_condition"]
+            for term in initial_condition_terms:
+                try:
+                    initial_conditions = self.assemble_operator(term)
+                except ValueError:  # there were no initial condition
+                    pass
+                else:
+                    hashes.append(term)
+                    hashes.extend(content_hash(ic) for ic in initial_conditions)
+            return hashes
+
+        def _cache_definition_hash(self):
+            hashes = [ParametrizedDifferentialProblem_DerivedClass._cache_definition_hash(self)]
+            # Time stepping parameters may be changed by the user after the first solve
+            hashes.append(str((self.t0, self.dt, self.T)))
+            return hashlib.sha1("".join(hashes).encode("utf-8")).hexdigest()
+
         # Set current time
         def set_time(self, t):
             assert isinstance(t, Number)
@@ -91,6 +91,12 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
         def set_time(self, t):
             self.t = t
 
+        def _theta_cache_key(self, term):
+            return (self.mu, self.t, term)
+
+        def _precompute_thetas(self, mus):
+            pass  # thetas are evaluated at each time step, as they may depend on time
+
         # Set initial time
         def set_initial_time(self, t0):
             assert isinstance(t0, Number)
@@ -264,6 +270,17 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             assign(self._solution_dot, self._solution_dot_over_time[-1])
             return self._solution_over_time
 
+        # Batched solves of the reduced problem, carried out on stacked dense arrays, are only available
+        # for steady problems
+        def _solve_many(self, mus, N, **kwargs):
+            return NotImplemented
+
+        def _solve_batch(self, N, *args, **kwargs):
+            return NotImplemented
+
+        def _solve_all_sizes(self, N, **kwargs):
+            return NotImplemented
+
         class ProblemSolver(
                 ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, TimeDependentProblemWrapper):
             def set_time(self, t):
@@ -307,7 +324,11 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
                     solver = OnlineLinearSolver(
                         inner_product_N, projected_initial_condition,
                         sum(product(all_initial_conditions_thetas, all_initial_conditions)))
-                    solver.set_parameters(problem._linear_solver_parameters)
+                    # The inner product matrix is parameter independent and symmetric
+                    solver_parameters = dict(problem._linear_solver_parameters)
+                    solver_parameters["parameter_independent"] = True
+                    solver_parameters["symmetric"] = True
+                    solver.set_parameters(solver_parameters)
                     solver.solve()
                     return projected_initial_condition
                 else:
@@ -406,6 +427,12 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
                 projected_snapshot_N_over_time.append(projected_snapshot_N)
             return projected_snapshot_N_over_time
 
+        def pin_truth_solution(self, **kwargs):
+            ParametrizedReducedDifferentialProblem_DerivedClass.pin_truth_solution(self, **kwargs)
+            # Errors are computed at each time step from the full order reconstruction of the reduced solution,
+            # since the truth solution at the current time is assigned only while computing them
+            self._pinned_truth_norms = None
+
         # Internal method for error computation
         def _compute_error(self, **kwargs):
             error_over_time = TimeSeries(self._solution_over_time)
@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import isclose
+from numpy import isclose, sqrt as array_sqrt
 from rbnics.problems.elliptic.elliptic_coercive_compliant_problem import EllipticCoerciveCompliantProblem
 from rbnics.problems.elliptic.elliptic_coercive_compliant_reduced_problem import EllipticCoerciveCompliantReducedProblem
 from rbnics.problems.elliptic.elliptic_coercive_rb_reduced_problem import EllipticCoerciveRBReducedProblem
@@ -26,6 +26,24 @@ class EllipticCoerciveCompliantRBReducedProblem(EllipticCoerciveCompliantRBReduc
         assert beta >= 0.
         return sqrt(abs(eps2) / beta)
 
+    # Return error bounds for all parameters in mus, evaluated as a batch
+    def _estimate_error_batch(self, mus, N=None, **kwargs):
+        residual_norms_squared_and_betas = self._get_residual_norm_squared_and_stability_factor_batch(
+            mus, N, **kwargs)
+        if residual_norms_squared_and_betas is NotImplemented:
+            return NotImplemented
+        (eps2, beta) = residual_norms_squared_and_betas
+        return array_sqrt(abs(eps2) / beta)
+
+    # Return error bounds at the current parameter for all dimensions of the reduced problem up to N
+    def _estimate_error_all_sizes(self, N=None, **kwargs):
+        residual_norms_squared_and_beta = self._get_residual_norm_squared_and_stability_factor_all_sizes(
+            N, **kwargs)
+        if residual_norms_squared_and_beta is NotImplemented:
+            return NotImplemented
+        (eps2, beta) = residual_norms_squared_and_beta
+        return array_sqrt(abs(eps2) / beta)
+
     # Return an error bound for the current compliant output
     def estimate_error_output(self):
         return self.estimate_error()**2
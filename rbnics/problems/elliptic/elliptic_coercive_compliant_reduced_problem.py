@@ -14,6 +14,13 @@ def EllipticCoerciveCompliantReducedProblem(EllipticCoerciveReducedProblem_Deriv
     # Base class containing the interface of a projection based ROM
     # for elliptic coercive compliant problems.
     class EllipticCoerciveCompliantReducedProblem_Class(EllipticCoerciveCompliantReducedProblem_Base):
+        # Initialize data structures required for the online phase
+        def init(self, current_stage="online"):
+            EllipticCoerciveCompliantReducedProblem_Base.init(self, current_stage)
+            # The reduced matrix is symmetric positive definite, hence the online linear solver may use a Cholesky
+            # factorization, unless its rows are replaced to impose non-homogeneous Dirichlet boundary conditions
+            self._linear_solver_parameters["symmetric"] = self._combined_and_homogenized_dirichlet_bc is None
+
         # Perform an online evaluation of the compliant output
         def _compute_output(self, N):
             self._output = transpose(self._solution) * sum(product(self.compute_theta("f"), self.operator["f"][:N]))
@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import isclose
+from numpy import all as array_all, array, einsum, isclose, sqrt as array_sqrt, tile
 from rbnics.backends import product, sum, transpose
 from rbnics.problems.base import LinearRBReducedProblem, ParametrizedReducedDifferentialProblem
 from rbnics.problems.elliptic.elliptic_problem import EllipticProblem
@@ -30,6 +30,9 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
         # Skip useless Riesz products
         self.riesz_terms = ["f", "a"]
         self.error_estimation_terms = [("f", "f"), ("a", "f"), ("a", "a")]
+        # The residual norm only involves the Riesz representors of "f" and "a", so that all error estimation
+        # operators can be replaced by the compressed residual representation
+        self.compressed_error_estimation_terms = list(self.error_estimation_terms)
 
     # Return an error bound for the current solution
     def estimate_error(self):
@@ -39,6 +42,95 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
         assert beta >= 0.
         return sqrt(abs(eps2)) / beta
 
+    # Return error bounds for all parameters in mus, evaluated as a batch
+    def _estimate_error_batch(self, mus, N=None, **kwargs):
+        residual_norms_squared_and_betas = self._get_residual_norm_squared_and_stability_factor_batch(
+            mus, N, **kwargs)
+        if residual_norms_squared_and_betas is NotImplemented:
+            return NotImplemented
+        (eps2, beta) = residual_norms_squared_and_betas
+        return array_sqrt(abs(eps2)) / beta
+
+    # Return the numerators and denominators of the error bound for all parameters in mus. The reduced solutions
+    # and residual norms are computed on stacked dense arrays, while thetas and stability factors are evaluated
+    # for each parameter
+    def _get_residual_norm_squared_and_stability_factor_batch(self, mus, N=None, **kwargs):
+        N, kwargs = self._online_size_from_kwargs(N, **kwargs)
+        N += self.N_bc
+        theta_a = self._compute_theta_batch("a", mus)
+        theta_f = self._compute_theta_batch("f", mus)
+        bcs = self._bc_eval_batch(mus, N)
+        solutions = self._solve_batch(N, theta_a, theta_f, bcs)
+        if solutions is NotImplemented:
+            return NotImplemented
+        eps2 = self._get_residual_norm_squared_batch(N, theta_a, theta_f, solutions)
+        if eps2 is NotImplemented:
+            return NotImplemented
+        beta = list()
+        for mu in mus:
+            self.set_mu(mu)
+            beta.append(self.truth_problem.get_stability_factor_lower_bound())
+        beta = array(beta, dtype=float)
+        assert array_all(beta >= 0.)
+        return (eps2, beta)
+
+    # Return error bounds at the current parameter for all dimensions of the reduced problem up to N, evaluated
+    # at once from the reduced solutions computed by solve_all_sizes()
+    def _estimate_error_all_sizes(self, N=None, **kwargs):
+        residual_norms_squared_and_beta = self._get_residual_norm_squared_and_stability_factor_all_sizes(
+            N, **kwargs)
+        if residual_norms_squared_and_beta is NotImplemented:
+            return NotImplemented
+        (eps2, beta) = residual_norms_squared_and_beta
+        return array_sqrt(abs(eps2)) / beta
+
+    # Return the numerators of the error bound for all dimensions of the reduced problem up to N, and the
+    # denominator (which does not depend on the dimension), at the current parameter. Reduced solutions of
+    # smaller dimension are padded with zeros, so that residual norms of all of them are computed on
+    # stacked dense arrays of the largest dimension
+    def _get_residual_norm_squared_and_stability_factor_all_sizes(self, N=None, **kwargs):
+        N, kwargs = self._online_size_from_kwargs(N, **kwargs)
+        if isinstance(N, dict) or N == 0:
+            return NotImplemented
+        N += self.N_bc
+        solutions = self._solve_all_sizes(N, **kwargs)
+        if solutions is NotImplemented:
+            return NotImplemented
+        theta_a = tile(array(self.compute_theta("a"), dtype=float), (solutions.shape[0], 1))
+        theta_f = tile(array(self.compute_theta("f"), dtype=float), (solutions.shape[0], 1))
+        eps2 = self._get_residual_norm_squared_batch(N, theta_a, theta_f, solutions)
+        if eps2 is NotImplemented:
+            return NotImplemented
+        beta = self.truth_problem.get_stability_factor_lower_bound()
+        assert beta >= 0.
+        return (eps2, beta)
+
+    # Return the numerator of the error bound for a (n_mu x N) array of reduced solutions, given the corresponding
+    # (n_mu x Q) arrays of thetas, or NotImplemented if the error estimation operators cannot be stacked
+    # in dense arrays
+    def _get_residual_norm_squared_batch(self, N, theta_a, theta_f, solutions):
+        if self.compress_residual:
+            eps2 = self._get_compressed_residual_norm_squared_batch({"a": theta_a, "f": theta_f}, solutions)
+        else:
+            Q_a = self.Q["a"]
+            Q_f = self.Q["f"]
+            error_estimation_operator_ff = self._stack_affine_expansion_storage(
+                self.error_estimation_operator["f", "f"], Q_f, Q_f)
+            error_estimation_operator_af = self._stack_affine_expansion_storage(
+                self.error_estimation_operator["a", "f"][:N], Q_a, Q_f)
+            error_estimation_operator_aa = self._stack_affine_expansion_storage(
+                self.error_estimation_operator["a", "a"][:N, :N], Q_a, Q_a)
+            if (error_estimation_operator_ff is NotImplemented or error_estimation_operator_af is NotImplemented
+                    or error_estimation_operator_aa is NotImplemented):
+                return NotImplemented
+            eps2 = (einsum("mf,mg,fg->m", theta_f, theta_f, error_estimation_operator_ff, optimize=True)
+                    + 2.0 * einsum("ma,mf,mi,afi->m", theta_a, theta_f, solutions, error_estimation_operator_af,
+                                   optimize=True)
+                    + einsum("ma,mb,mi,abij,mj->m", theta_a, theta_a, solutions, error_estimation_operator_aa,
+                             solutions, optimize=True))
+        assert array_all((eps2 >= 0.) | isclose(eps2, 0.))
+        return eps2
+
     # Return a relative error bound for the current solution
     def estimate_relative_error(self):
         return NotImplemented
@@ -53,6 +145,8 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
 
     # Return the numerator of the error bound for the current solution
     def get_residual_norm_squared(self):
+        if self.compress_residual:
+            return self.get_compressed_residual_norm_squared()
         N = self._solution.N
         theta_a = self.compute_theta("a")
         theta_f = self.compute_theta("f")
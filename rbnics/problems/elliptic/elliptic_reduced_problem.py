@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import array, einsum, newaxis, zeros
+from numpy.linalg import solve
 from rbnics.problems.base import LinearReducedProblem
 from rbnics.backends import product, sum, transpose
 
@@ -27,6 +29,54 @@ def EllipticReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 N = self.N
                 return sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
 
+        # Solve the reduced problem for all parameters in mus as a batch, unless the online solve has been
+        # customized by overriding _solve
+        def _solve_many(self, mus, N, **kwargs):
+            if self._is_solve_overridden("_solve_many"):
+                return NotImplemented
+            theta_a = self._compute_theta_batch("a", mus)
+            theta_f = self._compute_theta_batch("f", mus)
+            bcs = self._bc_eval_batch(mus, N)
+            return self._solve_batch(N, theta_a, theta_f, bcs)
+
+        # Solve the reduced problem for a batch of parameters at once, given the (n_mu x Q) arrays of thetas
+        # and (optionally) the list of boundary conditions values. Returns a (n_mu x N) array of reduced solutions,
+        # or NotImplemented if the reduced operators cannot be stacked in dense arrays or if the online solve has
+        # been customized by overriding _solve (in a class derived from the one providing _solve_many, which
+        # _solve_batch is the kernel of)
+        def _solve_batch(self, N, theta_a, theta_f, bcs=None):
+            if self._is_solve_overridden("_solve_many"):
+                return NotImplemented
+            if N == 0:  # trivial case
+                return zeros((theta_a.shape[0], 0))
+            A = self._stack_affine_expansion_storage(self.operator["a"][:N, :N], self.Q["a"])
+            F = self._stack_affine_expansion_storage(self.operator["f"][:N], self.Q["f"])
+            if A is NotImplemented or F is NotImplemented:
+                return NotImplemented
+            lhs = einsum("mq,qij->mij", theta_a, A)
+            rhs = einsum("mq,qi->mi", theta_f, F)
+            if bcs is not None:
+                self._apply_bcs_batch(lhs, rhs, N, bcs)
+            return solve(lhs, rhs[..., newaxis])[..., 0]
+
+        # Solve the reduced problem at the current parameter for all dimensions up to N at once, from the
+        # dense reduced system of dimension N. Returns a (N - N_bc x N) array of reduced solutions, padded
+        # with zeros, or NotImplemented if the reduced operators cannot be stacked in dense arrays or if the
+        # online solve has been customized by overriding _solve
+        def _solve_all_sizes(self, N, **kwargs):
+            if self._is_solve_overridden("_solve_all_sizes"):
+                return NotImplemented
+            A = self._stack_affine_expansion_storage(self.operator["a"][:N, :N], self.Q["a"])
+            F = self._stack_affine_expansion_storage(self.operator["f"][:N], self.Q["f"])
+            if A is NotImplemented or F is NotImplemented:
+                return NotImplemented
+            lhs = einsum("q,qij->ij", array(self.compute_theta("a"), dtype=float), A)
+            rhs = einsum("q,qi->i", array(self.compute_theta("f"), dtype=float), F)
+            bcs = self.ProblemSolver(self, N).bc_eval()
+            if bcs is not None:
+                self._apply_bcs_batch(lhs[newaxis], rhs[newaxis], N, [bcs])
+            return self._solve_leading_principal_subsystems(lhs, rhs, range(self.N_bc + 1, N + 1))
+
         # Perform an online evaluation of the output
         def _compute_output(self, N):
             self._output = transpose(self._solution) * sum(product(self.compute_theta("s"), self.operator["s"][:N]))
@@ -24,6 +24,8 @@ def AbstractParabolicRBReducedProblem(AbstractParabolicReducedProblem_DerivedCla
             # Skip useless Riesz products
             self.riesz_terms.append("m")
             self.error_estimation_terms.extend([("m", "f"), ("m", "a"), ("m", "m")])
+            # The compressed residual representation does not account for the time derivative
+            self.compressed_error_estimation_terms = list()
 
         # Return an error bound for the current solution
         def estimate_error(self):
@@ -48,6 +50,13 @@ def AbstractParabolicRBReducedProblem(AbstractParabolicReducedProblem_DerivedCla
         def estimate_relative_error(self):
             return NotImplemented
 
+        # Batched error bounds are not available for time dependent problems
+        def _estimate_error_batch(self, mus, N=None, **kwargs):
+            return NotImplemented
+
+        def _estimate_error_all_sizes(self, N=None, **kwargs):
+            return NotImplemented
+
         # Return an error bound for the current output
         def estimate_error_output(self):
             return NotImplemented
@@ -60,7 +60,8 @@ class StokesProblem(StokesProblem_Base):
             key_generator=_supremizer_cache_key_generator,
             import_=_supremizer_cache_import,
             export=_supremizer_cache_export,
-            filename_generator=_supremizer_cache_filename_generator
+            filename_generator=_supremizer_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     class ProblemSolver(StokesProblem_Base.ProblemSolver):
@@ -122,7 +123,9 @@ class StokesProblem(StokesProblem_Base):
         return self._cache_key_from_kwargs(**kwargs)
 
     def _supremizer_cache_file_from_kwargs(self, **kwargs):
-        return hashlib.sha1(str(self._supremizer_cache_key_from_kwargs(**kwargs)).encode("utf-8")).hexdigest()
+        return hashlib.sha1(
+            (self._cache_definition_hash() + str(self._supremizer_cache_key_from_kwargs(**kwargs))).encode(
+                "utf-8")).hexdigest()
 
     def export_supremizer(self, folder=None, filename=None, supremizer=None, component=None, suffix=None):
         if folder is None:
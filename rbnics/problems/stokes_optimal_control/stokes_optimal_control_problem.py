@@ -99,14 +99,16 @@ class StokesOptimalControlProblem(StokesOptimalControlProblem_Base):
                 key_generator=_supremizer_cache_key_generator,
                 import_=_supremizer_cache_import("s"),
                 export=_supremizer_cache_export("s"),
-                filename_generator=_supremizer_cache_filename_generator
+                filename_generator=_supremizer_cache_filename_generator,
+                folder=self.folder["cache"]
             ),
             "r": Cache(
                 "problems",
                 key_generator=_supremizer_cache_key_generator,
                 import_=_supremizer_cache_import("r"),
                 export=_supremizer_cache_export("r"),
-                filename_generator=_supremizer_cache_filename_generator
+                filename_generator=_supremizer_cache_filename_generator,
+                folder=self.folder["cache"]
             )
         }
 
@@ -203,7 +205,9 @@ class StokesOptimalControlProblem(StokesOptimalControlProblem_Base):
         return self._cache_key_from_kwargs(**kwargs)
 
     def _supremizer_cache_file_from_kwargs(self, **kwargs):
-        return hashlib.sha1(str(self._supremizer_cache_key_from_kwargs(**kwargs)).encode("utf-8")).hexdigest()
+        return hashlib.sha1(
+            (self._cache_definition_hash() + str(self._supremizer_cache_key_from_kwargs(**kwargs))).encode(
+                "utf-8")).hexdigest()
 
     # Perform a truth evaluation of the cost functional
     def _compute_output(self):
@@ -48,7 +48,8 @@ def AbstractCFDUnsteadyProblem(AbstractCFDUnsteadyProblem_Base):
 
         def _supremizer_cache_file_from_kwargs(self, **kwargs):
             return hashlib.sha1(
-                str(AbstractCFDUnsteadyProblem_Base._supremizer_cache_key_from_kwargs(self, **kwargs)).encode(
+                (self._cache_definition_hash()
+                 + str(AbstractCFDUnsteadyProblem_Base._supremizer_cache_key_from_kwargs(self, **kwargs))).encode(
                     "utf-8")).hexdigest()
 
         def export_supremizer(self, folder=None, filename=None, supremizer=None, component=None, suffix=None):
@@ -4,7 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import hashlib
 import inspect
+import os
 from rbnics.backends import assign
 from rbnics.reduction_methods.base.reduction_method import ReductionMethod
 from rbnics.utils.io import Folders
@@ -39,6 +41,10 @@ class DifferentialProblemReductionMethod(ReductionMethod):
         return ReductionMethod.initialize_testing_set(
             self, self.truth_problem.mu_range, ntest, enable_import, sampling, **kwargs)
 
+    # The reduced order model is identified by its dimension and by the content of the basis functions files
+    def _get_error_analysis_fingerprint(self):
+        return (self.reduced_problem.N, _hash_folder(self.reduced_problem.folder["basis"]))
+
     # Initialize data structures required for the offline phase
     def _init_offline(self):
         # Initialize the affine expansion in the truth problem
@@ -275,3 +281,16 @@ class DifferentialProblemReductionMethod(ReductionMethod):
             self.disable_export_output.unpatch()
             del self.disable_import_output
             del self.disable_export_output
+
+
+def _hash_folder(folder):
+    folder = str(folder)
+    hash_ = hashlib.sha1()
+    for (root, dirs, files) in os.walk(folder):
+        dirs.sort()
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            hash_.update(os.path.relpath(path, folder).encode("utf-8"))
+            with open(path, "rb") as f:
+                hash_.update(f.read())
+    return hash_.hexdigest()
@@ -5,12 +5,26 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from numbers import Number
+from mpi4py.MPI import COMM_WORLD
 from rbnics.backends import ProperOrthogonalDecomposition
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
 from rbnics.utils.io import ErrorAnalysisTable, OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer
 
 
+# Truth problem used by the workers of the process pool for snapshots computation. Workers are forked from
+# the parent process, so that each of them owns a copy of the truth problem
+_snapshots_pool_truth_problem = None
+
+
+def _snapshots_pool_solve(mu):
+    truth_problem = _snapshots_pool_truth_problem
+    truth_problem.set_mu(mu)
+    truth_problem.solve()  # will also store the solution in the disk cache, or load it if already available
+
+
 @RequiredBaseDecorators(None)
 def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
 
@@ -36,6 +50,10 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.folder["snapshots"] = os.path.join(self.folder_prefix, "snapshots")
             self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
             self.label = "POD-Galerkin"
+            # Number of processes used to compute snapshots (None to compute them in the current process only)
+            self.snapshots_pool_size = None
+            # Parameters of the POD algorithm (if empty, use the defaults of ProperOrthogonalDecomposition)
+            self.POD_parameters = dict()
 
             # Since we use a POD for each component, it makes sense to possibly have
             # different tolerances for each component.
@@ -84,6 +102,29 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
 
             self.tol = tol
 
+        def set_snapshots_pool_size(self, pool_size):
+            """
+            It sets the number of worker processes which compute truth snapshots over the training set.
+            Workers store snapshots in the disk cache of the truth problem, which are then read back
+            in training set order to update the snapshots matrix. Snapshots already available on disk
+            (e.g. from a previous interrupted run) are not computed again. The disk cache of problems
+            must be unlimited.
+
+            :param pool_size: number of worker processes, or None to compute snapshots in the current process only.
+            """
+            assert pool_size is None or pool_size > 0
+            self.snapshots_pool_size = pool_size
+
+        def set_POD_parameters(self, parameters):
+            """
+            It sets the parameters of the POD algorithm, e.g. to compute only the leading modes by
+            a randomized method, to update the correlation matrix as snapshots are stored, or to
+            incrementally update a truncated basis without storing all snapshots.
+
+            :param parameters: dictionary of parameters, see ProperOrthogonalDecomposition.
+            """
+            self.POD_parameters.update(parameters)
+
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
             output = DifferentialProblemReductionMethod_DerivedClass._init_offline(self)
@@ -113,6 +154,15 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             """
             need_to_do_offline_stage = self._init_offline()
             if need_to_do_offline_stage:
+                if len(self.POD_parameters) > 0:
+                    POD_parameters = dict(self.POD_parameters)
+                    if POD_parameters.get("method") == "incremental" and "rank" not in POD_parameters:
+                        POD_parameters["rank"] = self.Nmax  # retain at most Nmax modes while storing snapshots
+                    if isinstance(self.POD, dict):
+                        for POD in self.POD.values():
+                            POD.set_parameters(POD_parameters)
+                    else:
+                        self.POD.set_parameters(POD_parameters)
                 self._offline()
             self._finalize_offline()
             return self.reduced_problem
@@ -122,6 +172,12 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
 
+            if self.snapshots_pool_size is not None:
+                print(TextLine("compute snapshots in a pool of " + str(self.snapshots_pool_size) + " processes",
+                               fill="#"))
+                self._compute_snapshots_in_pool()
+                print("")
+
             for (mu_index, mu) in enumerate(self.training_set):
                 print(TextLine(str(mu_index), fill="#"))
 
@@ -148,6 +204,26 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
 
+        def _compute_snapshots_in_pool(self):
+            from rbnics.utils.config import config  # cannot import at global scope
+            assert "disk" in config.get("problems", "cache"), (
+                "Computing snapshots in a process pool requires the disk cache of problems")
+            assert config.get("problems", "disk cache limit") == "unlimited", (
+                "Computing snapshots in a process pool requires an unlimited disk cache of problems, "
+                "otherwise workers may remove snapshots before they are read back")
+            assert COMM_WORLD.size == 1, (
+                "Computing snapshots in a process pool is not supported in parallel MPI runs")
+            global _snapshots_pool_truth_problem
+            _snapshots_pool_truth_problem = self.truth_problem
+            try:
+                with ProcessPoolExecutor(
+                        max_workers=self.snapshots_pool_size, mp_context=multiprocessing.get_context("fork")
+                ) as executor:
+                    for _ in executor.map(_snapshots_pool_solve, self.training_set):
+                        pass  # only propagate exceptions raised by workers
+            finally:
+                _snapshots_pool_truth_problem = None
+
         def update_snapshots_matrix(self, snapshot):
             """
             It updates the snapshots matrix.
@@ -196,6 +272,8 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             self._finalize_error_analysis(**kwargs)
 
         def _error_analysis(self, N_generator=None, filename=None, **kwargs):
+            # The default generator spans all dimensions of the reduced problem, which can then be solved at once
+            solve_all_sizes = N_generator is None
             if N_generator is None:
                 def N_generator():
                     N = self.reduced_problem.N
@@ -243,10 +321,18 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column("error_output", group_name="output", operations=("mean", "max"))
             error_analysis_table.add_column("relative_error_output", group_name="output", operations=("mean", "max"))
 
-            for (mu_index, mu) in enumerate(self.testing_set):
+            # Evaluate thetas for all parameters in the testing set as a batch
+            self.reduced_problem._precompute_thetas(self.testing_set)
+
+            def error_analysis_row(mu_index, mu):
                 print(TextLine(str(mu_index), fill="#"))
 
                 self.reduced_problem.set_mu(mu)
+                # Compute the truth solution once, and reuse it for every n
+                self.reduced_problem.pin_truth_solution(**kwargs)
+                # Solve the reduced problem for all dimensions at once, storing reduced solutions in the cache
+                if solve_all_sizes:
+                    self.reduced_problem.solve_all_sizes(N_generator_max(), **kwargs)
 
                 for (n_int, n_arg) in N_generator_items():
                     self.reduced_problem.solve(n_arg, **kwargs)
@@ -270,6 +356,11 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     error_analysis_table["error_output", n_int, mu_index] = error_output
                     error_analysis_table["relative_error_output", n_int, mu_index] = relative_error_output
 
+            try:
+                self._error_analysis_rows(error_analysis_table, error_analysis_row, filename)
+            finally:
+                self.reduced_problem.unpin_truth_solution()
+
             # Print
             print("")
             print(error_analysis_table)
@@ -336,6 +427,12 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             truth_timer = Timer("parallel")
             reduced_timer = Timer("serial")
 
+            # Evaluate thetas for all parameters in the testing set as a batch, and split the elapsed time
+            # among all reduced solves
+            reduced_timer.start()
+            self.reduced_problem._precompute_thetas(self.testing_set)
+            elapsed_reduced_thetas = reduced_timer.stop() / len(self.testing_set)
+
             for (mu_index, mu) in enumerate(self.testing_set):
                 print(TextLine(str(mu_index), fill="#"))
 
@@ -352,7 +449,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                 for (n_int, n_arg) in N_generator_items():
                     reduced_timer.start()
                     solution = self.reduced_problem.solve(n_arg, **kwargs)
-                    elapsed_reduced_solve = reduced_timer.stop()
+                    elapsed_reduced_solve = reduced_timer.stop() + elapsed_reduced_thetas
 
                     reduced_timer.start()
                     output = self.reduced_problem.compute_output()
@@ -42,8 +42,21 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
+            # Number of training parameters for which the error estimator is evaluated at once during the greedy
+            # (None to evaluate the error estimator one parameter at a time)
+            self.greedy_batch_size = None
             self.label = "RB"
 
+        def set_greedy_batch_size(self, batch_size):
+            """
+            It sets the number of parameters in the training set for which reduced problems are solved and
+            error estimators are evaluated as a batch during the greedy algorithm.
+
+            :param batch_size: size of each batch, or None to disable batched evaluation.
+            """
+            assert batch_size is None or batch_size > 0
+            self.greedy_batch_size = batch_size
+
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
             output = DifferentialProblemReductionMethod_DerivedClass._init_offline(self)
@@ -177,12 +190,28 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
                 return error_estimator
 
+            def solve_and_estimate_error_batch(mus):
+                error_estimators = list()
+                for b in range(0, len(mus), self.greedy_batch_size):
+                    mus_b = mus[b:b + self.greedy_batch_size]
+                    error_estimators_b = self.reduced_problem._estimate_error_batch(mus_b)
+                    if error_estimators_b is NotImplemented:
+                        error_estimators_b = [solve_and_estimate_error(mu) for mu in mus_b]
+                    else:
+                        for (mu, error_estimator) in zip(mus_b, error_estimators_b):
+                            logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
+                    error_estimators.extend(error_estimators_b)
+                return error_estimators
+
             if self.reduced_problem.N == 0:
                 print("find initial mu")
             else:
                 print("find next mu")
 
-            return self.training_set.max(solve_and_estimate_error)
+            if self.greedy_batch_size is None:
+                return self.training_set.max(solve_and_estimate_error)
+            else:
+                return self.training_set.max(solve_and_estimate_error_batch, vectorized=True)
 
         def error_analysis(self, N_generator=None, filename=None, **kwargs):
             """
@@ -196,6 +225,8 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self._finalize_error_analysis(**kwargs)
 
         def _error_analysis(self, N_generator=None, filename=None, **kwargs):
+            # The default generator spans all dimensions of the reduced problem, which can then be solved at once
+            solve_all_sizes = N_generator is None
             if N_generator is None:
                 def N_generator():
                     N = self.reduced_problem.N
@@ -309,10 +340,18 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column(
                 "relative_effectivity_output", group_name="output_relative_error", operations=("min", "mean", "max"))
 
-            for (mu_index, mu) in enumerate(self.testing_set):
+            # Evaluate thetas for all parameters in the testing set as a batch
+            self.reduced_problem._precompute_thetas(self.testing_set)
+
+            def error_analysis_row(mu_index, mu):
                 print(TextLine(str(mu_index), fill="#"))
 
                 self.reduced_problem.set_mu(mu)
+                # Compute the truth solution once, and reuse it for every n
+                self.reduced_problem.pin_truth_solution(**kwargs)
+                # Solve the reduced problem for all dimensions at once, storing reduced solutions in the cache
+                if solve_all_sizes:
+                    self.reduced_problem.solve_all_sizes(N_generator_max(), **kwargs)
 
                 for (n_int, n_arg) in N_generator_items():
                     self.reduced_problem.solve(n_arg, **kwargs)
@@ -389,6 +428,11 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                             "relative_error_estimator_output", n_int, mu_index] / error_analysis_table[
                                 "relative_error_output", n_int, mu_index]
 
+            try:
+                self._error_analysis_rows(error_analysis_table, error_analysis_row, filename)
+            finally:
+                self.reduced_problem.unpin_truth_solution()
+
             # Print
             print("")
             print(error_analysis_table)
@@ -475,6 +519,12 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             truth_timer = Timer("parallel")
             reduced_timer = Timer("serial")
 
+            # Evaluate thetas for all parameters in the testing set as a batch, and split the elapsed time
+            # among all reduced solves
+            reduced_timer.start()
+            self.reduced_problem._precompute_thetas(self.testing_set)
+            elapsed_reduced_thetas = reduced_timer.stop() / len(self.testing_set)
+
             for (mu_index, mu) in enumerate(self.testing_set):
                 print(TextLine(str(mu_index), fill="#"))
 
@@ -491,7 +541,7 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 for (n_int, n_arg) in N_generator_items():
                     reduced_timer.start()
                     solution = self.reduced_problem.solve(n_arg, **kwargs)
-                    elapsed_reduced_solve = reduced_timer.stop()
+                    elapsed_reduced_solve = reduced_timer.stop() + elapsed_reduced_thetas
 
                     truth_timer.start()
                     self.reduced_problem.compute_error(**kwargs)
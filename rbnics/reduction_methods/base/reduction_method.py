@@ -5,9 +5,25 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+import shutil
+import multiprocessing
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from mpi4py.MPI import COMM_WORLD
 from rbnics.sampling import ParameterSpaceSubset
-from rbnics.utils.io import Folders
+from rbnics.utils.io import Folders, PickleIO
+from rbnics.utils.mpi import parallel_io
+
+
+# Data used by the workers of the process pool for error analysis. Workers are forked from the parent process,
+# so that each of them owns a copy of the reduction method and of the error analysis table
+_error_analysis_pool_data = None
+
+
+def _error_analysis_pool_row(mu_index):
+    (error_analysis_table, error_analysis_row, testing_set) = _error_analysis_pool_data
+    error_analysis_row(mu_index, testing_set[mu_index])
+    return error_analysis_table.get_row(mu_index)
 
 
 # Implementation of a class containing an offline/online decomposition of ROM for parametrized problems
@@ -34,6 +50,11 @@ class ReductionMethod(object, metaclass=ABCMeta):
         self.folder["testing_set"] = os.path.join(self.folder_prefix, "testing_set")
         self.folder["error_analysis"] = os.path.join(self.folder_prefix, "error_analysis")
         self.folder["speedup_analysis"] = os.path.join(self.folder_prefix, "speedup_analysis")
+        # Number of processes used to carry out the error analysis (None to use the current process only)
+        self.error_analysis_pool_size = None
+        # Store completed rows of the error analysis table to disk, so that an interrupted error analysis
+        # can be resumed
+        self.error_analysis_checkpoints = False
 
     # OFFLINE: set maximum reduced space dimension (stopping criterion)
     def set_Nmax(self, Nmax, **kwargs):
@@ -100,10 +121,89 @@ class ReductionMethod(object, metaclass=ABCMeta):
     def error_analysis(self, N_generator=None, filename=None, **kwargs):
         raise NotImplementedError("Please implement the error analysis of the reduced order model.")
 
+    # ERROR ANALYSIS: set the number of worker processes which carry out the error analysis over the testing set
+    # (None to carry it out in the current process only)
+    def set_error_analysis_pool_size(self, pool_size):
+        assert pool_size is None or pool_size > 0
+        self.error_analysis_pool_size = pool_size
+
+    # ERROR ANALYSIS: enable storing completed rows of the error analysis table to disk. A later error analysis
+    # with the same filename, testing set, N range and reduced order model will resume from them. Rows are removed
+    # from disk once the error analysis is completed
+    def set_error_analysis_checkpoints(self, checkpoints):
+        self.error_analysis_checkpoints = checkpoints
+
+    # Data identifying the current reduced order model, stored alongside error analysis checkpoints in order to
+    # discard checkpoints computed with a different reduced order model
+    def _get_error_analysis_fingerprint(self):
+        return None
+
     # Initialize data structures required for the error analysis phase
     def _init_error_analysis(self, **kwargs):
         pass
 
+    # Call error_analysis_row(mu_index, mu), which is expected to fill in the rows of error_analysis_table
+    # associated to mu_index, for all parameters in the testing set. Rows are possibly computed by a pool of
+    # processes, stored to disk as soon as they are completed and restored from disk, if available
+    def _error_analysis_rows(self, error_analysis_table, error_analysis_row, filename):
+        if self.error_analysis_checkpoints:
+            checkpoints_folder = Folders.Folder(os.path.join(
+                str(self.folder["error_analysis"]), ("error_analysis" if filename is None else filename)
+                + "_checkpoints"))
+            checkpoints_folder.create()
+            fingerprint = {"N range": (error_analysis_table.get_Nmin(), error_analysis_table.get_Nmax()),
+                           "reduced order model": self._get_error_analysis_fingerprint()}
+        else:
+            checkpoints_folder = None
+            fingerprint = None
+
+        # Restore completed rows, and collect the remaining ones
+        mu_indices = list()
+        for (mu_index, mu) in enumerate(self.testing_set):
+            checkpoint = None
+            if checkpoints_folder is not None and PickleIO.exists_file(checkpoints_folder, "row_" + str(mu_index)):
+                checkpoint = PickleIO.load_file(checkpoints_folder, "row_" + str(mu_index))
+                if (checkpoint["mu"] != tuple(mu) or checkpoint.get("fingerprint") != fingerprint
+                        or not error_analysis_table.has_row_shape(checkpoint["row"])):
+                    checkpoint = None
+            if checkpoint is not None:
+                error_analysis_table.set_row(mu_index, checkpoint["row"])
+            else:
+                mu_indices.append(mu_index)
+
+        def store_row(mu_index, row):
+            if checkpoints_folder is not None:
+                PickleIO.save_file({"mu": tuple(self.testing_set[mu_index]), "fingerprint": fingerprint, "row": row},
+                                   checkpoints_folder, "row_" + str(mu_index))
+
+        # Compute the remaining rows
+        if self.error_analysis_pool_size is None:
+            for mu_index in mu_indices:
+                error_analysis_row(mu_index, self.testing_set[mu_index])
+                if checkpoints_folder is not None:
+                    store_row(mu_index, error_analysis_table.get_row(mu_index))
+        else:
+            assert COMM_WORLD.size == 1, (
+                "Carrying out the error analysis in a process pool is not supported in parallel MPI runs")
+            global _error_analysis_pool_data
+            _error_analysis_pool_data = (error_analysis_table, error_analysis_row, self.testing_set)
+            try:
+                with ProcessPoolExecutor(
+                        max_workers=self.error_analysis_pool_size, mp_context=multiprocessing.get_context("fork")
+                ) as executor:
+                    futures = {executor.submit(_error_analysis_pool_row, mu_index): mu_index
+                               for mu_index in mu_indices}
+                    for future in as_completed(futures):
+                        row = future.result()
+                        error_analysis_table.set_row(futures[future], row)
+                        store_row(futures[future], row)
+            finally:
+                _error_analysis_pool_data = None
+
+        # All rows are now available in the error analysis table, hence checkpoints can be removed
+        if checkpoints_folder is not None:
+            parallel_io(lambda: shutil.rmtree(str(checkpoints_folder)))
+
     # Finalize data structures required after the error analysis phase
     def _finalize_error_analysis(self, **kwargs):
         pass
@@ -9,8 +9,14 @@ from rbnics.sampling.distributions.discrete_distribution import DiscreteDistribu
 from rbnics.sampling.distributions.distribution import Distribution
 from rbnics.sampling.distributions.draw_from import DrawFrom
 from rbnics.sampling.distributions.equispaced_distribution import EquispacedDistribution
+from rbnics.sampling.distributions.halton_distribution import HaltonDistribution
+from rbnics.sampling.distributions.latin_hypercube_distribution import LatinHypercubeDistribution
 from rbnics.sampling.distributions.log_equispaced_distribution import LogEquispacedDistribution
+from rbnics.sampling.distributions.log_scaled_distribution import LogScaledDistribution
 from rbnics.sampling.distributions.log_uniform_distribution import LogUniformDistribution
+from rbnics.sampling.distributions.maximin_distribution import MaximinDistribution
+from rbnics.sampling.distributions.quasi_monte_carlo_distribution import QuasiMonteCarloDistribution
+from rbnics.sampling.distributions.sobol_distribution import SobolDistribution
 from rbnics.sampling.distributions.uniform_distribution import UniformDistribution
 
 __all__ = [
@@ -19,7 +25,13 @@ __all__ = [
     "Distribution",
     "DrawFrom",
     "EquispacedDistribution",
+    "HaltonDistribution",
+    "LatinHypercubeDistribution",
     "LogEquispacedDistribution",
+    "LogScaledDistribution",
     "LogUniformDistribution",
+    "MaximinDistribution",
+    "QuasiMonteCarloDistribution",
+    "SobolDistribution",
     "UniformDistribution"
 ]
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray, empty
 from rbnics.sampling.distributions.distribution import Distribution
 from rbnics.sampling.distributions.equispaced_distribution import EquispacedDistribution
 
@@ -40,14 +41,11 @@ class CompositeDistribution(Distribution):
             if not isinstance(distribution, EquispacedDistribution):
                 components = self.distribution_to_components[distribution]
                 components_to_sub_set[tuple(components)] = distribution.sample(sub_box, n)
-        # Prepare a list that will store the set [mu_1, ... mu_n] ...
-        set_as_list = [[None] * len(box) for _ in range(n)]
+        # Prepare an array that will store the set [mu_1, ... mu_n], one parameter for each row
+        set_ = empty((n, len(box)))
         for (components, sub_set) in components_to_sub_set.items():
             assert len(sub_set) == n
-            for (index, sub_mu) in enumerate(sub_set):
-                assert len(components) == len(sub_mu)
-                for (p, sub_mu_p) in zip(components, sub_mu):
-                    set_as_list[index][p] = sub_mu_p
-        # ... and convert each mu to a tuple
-        set_ = [tuple(mu) for mu in set_as_list]
+            # distributions may return either an array or a list of tuples
+            sub_set = asarray(sub_set, dtype=float).reshape(n, len(components))
+            set_[:, components] = sub_set
         return set_
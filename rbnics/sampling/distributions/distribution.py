@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from abc import ABCMeta, abstractmethod
+from numpy import random
 
 
 class Distribution(object, metaclass=ABCMeta):
@@ -29,3 +30,11 @@ class Distribution(object, metaclass=ABCMeta):
 
     def __ne__(self, other):
         return not(self == other)
+
+
+def random_generator(seed):
+    # If no seed is provided, draw one from the global numpy random state, so that calls to numpy.random.seed
+    # still make sampling reproducible
+    if seed is None:
+        seed = random.randint(2**31 - 1)
+    return random.default_rng(seed)
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray
 from rbnics.sampling.distributions.distribution import Distribution
 
 
@@ -14,10 +15,11 @@ class DrawFrom(Distribution):
         self.kwargs = kwargs
 
     def sample(self, box, n):
-        set_ = list()  # of tuples
-        for i in range(n):
-            mu = list()  # of numbers
-            for box_p in box:
-                mu.append(box_p[0] + self.generator(*self.args, **self.kwargs) * (box_p[1] - box_p[0]))
-            set_.append(tuple(mu))
-        return set_
+        box = asarray(box, dtype=float).reshape(len(box), 2)
+        try:
+            # numpy random functions (and methods of numpy.random.Generator) draw all samples at once
+            samples_in_unit_box = asarray(self.generator(*self.args, size=(n, len(box)), **self.kwargs), dtype=float)
+        except TypeError:  # generator does not accept a size argument
+            samples_in_unit_box = asarray(
+                [[self.generator(*self.args, **self.kwargs) for _ in box] for _ in range(n)], dtype=float)
+        return box[:, 0] + samples_in_unit_box.reshape(n, len(box)) * (box[:, 1] - box[:, 0])
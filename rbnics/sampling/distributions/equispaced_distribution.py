@@ -5,8 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import ceil
-from numpy import linspace
-import itertools
+from numpy import linspace, meshgrid, stack
 from rbnics.sampling.distributions.distribution import Distribution
 
 
@@ -15,9 +14,6 @@ class EquispacedDistribution(Distribution):
         n_P_root = int(ceil(n**(1. / len(box))))
         grid = list()  # of linspaces
         for box_p in box:
-            grid.append(linspace(box_p[0], box_p[1], num=n_P_root).tolist())
-        set_itertools = itertools.product(*grid)
-        set_ = list()  # of tuples
-        for mu in set_itertools:
-            set_.append(mu)
-        return set_
+            grid.append(linspace(box_p[0], box_p[1], num=n_P_root))
+        # Tensor product of the grids, with the last component running fastest
+        return stack([grid_p.ravel() for grid_p in meshgrid(*grid, indexing="ij")], axis=1)
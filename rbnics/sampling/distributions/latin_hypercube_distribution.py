@@ -0,0 +1,14 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from scipy.stats import qmc
+from rbnics.sampling.distributions.quasi_monte_carlo_distribution import QuasiMonteCarloDistribution
+
+
+class LatinHypercubeDistribution(QuasiMonteCarloDistribution):
+    def _engine(self, d, generator):
+        # If scramble is False, points are placed at the center of their cells
+        return qmc.LatinHypercube(d, scramble=self.scramble, seed=generator)
@@ -0,0 +1,18 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import exp, log
+from rbnics.sampling.distributions.distribution import Distribution
+
+
+class LogScaledDistribution(Distribution):
+    def __init__(self, distribution):
+        self.distribution = distribution
+
+    def sample(self, box, n):
+        log_box = [(log(box_p[0]), log(box_p[1])) for box_p in box]
+        log_set = self.distribution.sample(log_box, n)
+        return exp(log_set)
@@ -0,0 +1,34 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import argmax, asarray, empty, full, inf, minimum
+from rbnics.sampling.distributions.distribution import Distribution
+
+
+class MaximinDistribution(Distribution):
+    def __init__(self, distribution, oversampling=10):
+        self.distribution = distribution
+        self.oversampling = oversampling
+
+    def sample(self, box, n):
+        # Draw oversampling * n candidates, and then select n of them in a greedy fashion, each time adding
+        # the candidate which is farthest from the ones already selected. Distances are computed after mapping
+        # the box to the unit hypercube, so that all components are equally weighted.
+        candidates = asarray(self.distribution.sample(box, self.oversampling * n), dtype=float)
+        n = min(n, len(candidates))
+        if n == 0:
+            return candidates
+        box = asarray(box, dtype=float).reshape(len(box), 2)
+        width = box[:, 1] - box[:, 0]
+        width[width == 0.] = 1.  # degenerate components are the same for all candidates, and do not affect distances
+        scaled_candidates = (candidates - box[:, 0]) / width
+        selected = empty(n, dtype=int)
+        distances = full(len(candidates), inf)
+        selected[0] = argmax(((scaled_candidates - scaled_candidates.mean(axis=0))**2).sum(axis=1))
+        for i in range(1, n):
+            distances = minimum(distances, ((scaled_candidates - scaled_candidates[selected[i - 1]])**2).sum(axis=1))
+            selected[i] = argmax(distances)
+        return candidates[selected]
@@ -0,0 +1,29 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import warnings
+from abc import abstractmethod
+from numpy import asarray
+from rbnics.sampling.distributions.distribution import Distribution, random_generator
+
+
+class QuasiMonteCarloDistribution(Distribution):
+    def __init__(self, seed=None, scramble=True):
+        self.seed = seed
+        self.scramble = scramble
+
+    def sample(self, box, n):
+        box = asarray(box, dtype=float).reshape(len(box), 2)
+        engine = self._engine(len(box), random_generator(self.seed))
+        with warnings.catch_warnings():
+            # Sobol' sequences warn if n is not a power of 2: the first n points of the sequence are used anyway
+            warnings.simplefilter("ignore", UserWarning)
+            samples_in_unit_box = engine.random(n)
+        return box[:, 0] + samples_in_unit_box * (box[:, 1] - box[:, 0])
+
+    @abstractmethod
+    def _engine(self, d, generator):
+        raise NotImplementedError("The method _engine is distribution-specific and needs to be overridden.")
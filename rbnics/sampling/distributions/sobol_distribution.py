@@ -0,0 +1,13 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from scipy.stats import qmc
+from rbnics.sampling.distributions.quasi_monte_carlo_distribution import QuasiMonteCarloDistribution
+
+
+class SobolDistribution(QuasiMonteCarloDistribution):
+    def _engine(self, d, generator):
+        return qmc.Sobol(d, scramble=self.scramble, seed=generator)
@@ -4,16 +4,15 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import random
-from rbnics.sampling.distributions.distribution import Distribution
+from numpy import asarray
+from rbnics.sampling.distributions.distribution import Distribution, random_generator
 
 
 class UniformDistribution(Distribution):
+    def __init__(self, seed=None):
+        self.seed = seed
+
     def sample(self, box, n):
-        set_ = list()  # of tuples
-        for i in range(n):
-            mu = list()  # of numbers
-            for box_p in box:
-                mu.append(random.uniform(box_p[0], box_p[1]))
-            set_.append(tuple(mu))
-        return set_
+        generator = random_generator(self.seed)
+        box = asarray(box, dtype=float).reshape(len(box), 2)
+        return generator.uniform(box[:, 0], box[:, 1], size=(n, len(box)))
@@ -4,14 +4,14 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import operator  # to find closest parameters
-from math import sqrt
 from mpi4py.MPI import COMM_WORLD
+from numbers import Number
 from numpy import zeros as array
-from numpy import argmax
+from numpy import argmax, asarray, atleast_1d, atleast_2d, concatenate, empty, log, ndarray
+from scipy.spatial import cKDTree as KDTree
 from rbnics.sampling.distributions import CompositeDistribution, UniformDistribution
 from rbnics.utils.decorators import overload
-from rbnics.utils.io import ExportableList
+from rbnics.utils.io import ExportableList, NumpyIO
 from rbnics.utils.mpi import parallel_io as parallel_generate, parallel_max
 
 
@@ -20,18 +20,128 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         ExportableList.__init__(self, "text")
         self.mpi_comm = COMM_WORLD
         self.distributed_max = True
+        # Scaling of each parameter component before computing distances, either "linear" or "log"
+        # (None means "linear" for all components)
+        self.distance_scaling = None
+        self._index = None  # spatial index for closest parameters queries, built by closest()
+        # Parameters are stored as rows of a (number of parameters x number of components) array, and
+        # converted to tuples on access. Storage falls back to a list when elements are not tuples of numbers
+        # (e.g. parameters enlarged with time), in which case self._array is None
+        self._array = empty((0, 0))
+        self._list = None
+
+    def _copy_attributes_to(self, output):
+        output.distributed_max = self.distributed_max
+        output.distance_scaling = self.distance_scaling
+        return output
+
+    def _set_content(self, content):
+        if isinstance(content, ndarray):
+            assert content.ndim == 2
+            self._array = asarray(content, dtype=float)
+            self._list = None
+        elif len(content) == 0:
+            self._array = empty((0, 0))
+            self._list = None
+        elif (isinstance(content[0], tuple)
+              and all([_is_tuple_of_numbers(mu, len(content[0])) for mu in content])):
+            self._array = asarray(content, dtype=float).reshape(len(content), len(content[0]))
+            self._list = None
+        else:
+            self._array = None
+            self._list = list(content)
+        self._index = None
+
+    def _as_list(self):
+        if self._array is not None:
+            self._list = [tuple(mu) for mu in self._array.tolist()]
+            self._array = None
+        return self._list
 
     @overload
     def __getitem__(self, key: int):
-        return self._list[key]
+        if self._array is not None:
+            return tuple(self._array[key].tolist())
+        else:
+            return self._list[key]
 
     @overload
     def __getitem__(self, key: slice):
-        output = ParameterSpaceSubset()
-        output.distributed_max = self.distributed_max
-        output._list = self._list[key]
+        output = self._copy_attributes_to(ParameterSpaceSubset())
+        if self._array is not None:
+            output._set_content(self._array[key].copy())
+        else:
+            output._set_content(self._list[key])
         return output
 
+    def __setitem__(self, key, item):
+        if self._array is not None and _is_tuple_of_numbers(item, self._array.shape[1]):
+            self._array[key] = item
+        else:
+            self._as_list()[key] = item
+        self._index = None
+
+    def __iter__(self):
+        if self._array is not None:
+            return iter([tuple(mu) for mu in self._array.tolist()])
+        else:
+            return iter(self._list)
+
+    def __len__(self):
+        if self._array is not None:
+            return len(self._array)
+        else:
+            return len(self._list)
+
+    def __str__(self):
+        return str(list(self))
+
+    def append(self, element):
+        self.extend([element])
+
+    def extend(self, other_list):
+        if isinstance(other_list, ParameterSpaceSubset) and other_list._array is not None:
+            other_list = other_list._array.copy()
+        else:
+            other_list = list(other_list)
+        if len(self) == 0:
+            self._set_content(other_list)
+        elif (self._array is not None
+              and (isinstance(other_list, ndarray)
+                   or all([_is_tuple_of_numbers(mu, self._array.shape[1]) for mu in other_list]))):
+            other_array = asarray(other_list, dtype=float).reshape(len(other_list), self._array.shape[1])
+            self._array = concatenate((self._array, other_array))
+        else:
+            if isinstance(other_list, ndarray):
+                other_list = [tuple(mu) for mu in other_list.tolist()]
+            self._as_list().extend(other_list)
+        self._index = None
+
+    def save(self, directory, filename):
+        if self._array is not None:
+            # Sets of numbers are also saved in binary format, which is faster to load back
+            NumpyIO.save_file(self._array, directory, filename)
+            self._FileIO.save_file([tuple(mu) for mu in self._array.tolist()], directory, filename)
+        else:
+            self._FileIO.save_file(self._list, directory, filename)
+
+    def load(self, directory, filename):
+        if len(self) > 0:  # avoid loading multiple times
+            return False
+        if NumpyIO.exists_file(directory, filename):
+            self._set_content(NumpyIO.load_file(directory, filename))
+            return True
+        elif self._FileIO.exists_file(directory, filename):  # sets saved as text, or not made of numbers
+            self._set_content(self._FileIO.load_file(directory, filename))
+            return True
+        else:
+            raise OSError
+
+    def set_distance_scaling(self, distance_scaling):
+        assert distance_scaling is None or all([scaling in ("linear", "log") for scaling in distance_scaling])
+        self.distance_scaling = distance_scaling
+        self._index = None
+
     # Method for generation of parameter space subsets
     def generate(self, box, n, sampling=None):
         if len(box) > 0:
@@ -44,25 +154,34 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
             def run_sampling():
                 return sampling.sample(box, n)
 
-            self._list = parallel_generate(run_sampling, self.mpi_comm)
+            samples = asarray(parallel_generate(run_sampling, self.mpi_comm), dtype=float)
+            self._set_content(samples.reshape(len(samples), len(box)))  # also for an empty list of samples
         else:
-            for i in range(n):
-                self._list.append(tuple())
+            self._set_content(empty((n, 0)))
 
-    def max(self, generator, postprocessor=None):
+    # Maximum of generator over the parameters in this set, and index of the maximizer. If vectorized is True,
+    # generator is called only once (per process) on the list of all local parameters, and should return
+    # the corresponding values as a list or array
+    def max(self, generator, postprocessor=None, vectorized=False):
         if postprocessor is None:
             def postprocessor(value):
                 return value
         if self.distributed_max:
-            local_list_indices = list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size))
+            local_list_indices = list(range(self.mpi_comm.rank, len(self), self.mpi_comm.size))
             # start from index rank and take steps of length equal to size
         else:
-            local_list_indices = list(range(len(self._list)))
+            local_list_indices = list(range(len(self)))
         values = array(len(local_list_indices))
         values_with_postprocessing = array(len(local_list_indices))
-        for i in range(len(local_list_indices)):
-            values[i] = generator(self._list[local_list_indices[i]])
-            values_with_postprocessing[i] = postprocessor(values[i])
+        if vectorized:
+            if len(local_list_indices) > 0:
+                values[:] = generator([self[i] for i in local_list_indices])
+            for i in range(len(local_list_indices)):
+                values_with_postprocessing[i] = postprocessor(values[i])
+        else:
+            for i in range(len(local_list_indices)):
+                values[i] = generator(self[local_list_indices[i]])
+                values_with_postprocessing[i] = postprocessor(values[i])
         if self.distributed_max:
             local_i_max = argmax(values_with_postprocessing)
             local_value_max = values[local_i_max]
@@ -81,9 +200,15 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         self.distributed_max = False
 
     def diff(self, other_set):
-        output = ParameterSpaceSubset()
-        output.distributed_max = self.distributed_max
-        output._list = [mu for mu in self._list if mu not in other_set]
+        output = self._copy_attributes_to(ParameterSpaceSubset())
+        try:
+            other_set = set(other_set)  # parameters are tuples, so membership can be checked by hashing
+        except TypeError:  # parameters are not hashable (e.g. enlarged with time)
+            other_set = list(other_set)
+        if self._array is not None:
+            output._set_content(self._array[[mu not in other_set for mu in self]].copy())
+        else:
+            output._set_content([mu for mu in self._list if mu not in other_set])
         return output
 
     # M parameters in this set closest to mu
@@ -94,17 +219,48 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         if M == len(self):
             return self
 
-        output = ParameterSpaceSubset()
-        output.distributed_max = self.distributed_max
-
         # Trivial case 2:
         if M == 0:
-            return output
-
-        parameters_and_distances = list()
-        for xi_i in self:
-            distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
-            parameters_and_distances.append((xi_i, distance))
-        parameters_and_distances.sort(key=operator.itemgetter(1))
-        output._list = [xi_i for (xi_i, _) in parameters_and_distances[:M]]
-        return output
+            return self._copy_attributes_to(ParameterSpaceSubset())
+
+        return self.closest_many(M, [mu])[0]
+
+    # M parameters in this set closest to each parameter in mus, computed with a single query to the spatial index
+    def closest_many(self, M, mus):
+        assert M <= len(self)
+        closest_indices = self._closest_indices(M, mus)
+        outputs = list()
+        for closest_indices_mu in closest_indices:
+            output = self._copy_attributes_to(ParameterSpaceSubset())
+            if self._array is not None:
+                output._set_content(self._array[closest_indices_mu])
+            else:
+                output._set_content([self._list[i] for i in closest_indices_mu])
+            outputs.append(output)
+        return outputs
+
+    def _closest_indices(self, M, mus):
+        if M == 0:
+            return [list() for _ in mus]
+        if len(self[0]) == 0:  # all (empty) parameters are at the same distance
+            return [list(range(M)) for _ in mus]
+        if self._index is None:
+            self._index = KDTree(self._scale(self._array if self._array is not None else self._list))
+        (_, closest_indices) = self._index.query(self._scale(mus), k=M)
+        # query() drops the last dimension when M == 1
+        return [atleast_1d(closest_indices_mu).tolist() for closest_indices_mu in closest_indices]
+
+    def _scale(self, mus):
+        mus = atleast_2d(asarray(mus, dtype=float))
+        if self.distance_scaling is not None:
+            assert len(self.distance_scaling) == mus.shape[1]
+            mus = mus.copy()
+            for (p, scaling) in enumerate(self.distance_scaling):
+                if scaling == "log":
+                    mus[:, p] = log(mus[:, p])
+        return mus
+
+
+def _is_tuple_of_numbers(mu, length=None):
+    return (isinstance(mu, tuple) and all([isinstance(mu_p, Number) for mu_p in mu])
+            and (length is None or len(mu) == length))
@@ -59,7 +59,8 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
             key_generator=_eigenvalue_cache_key_generator,
             import_=_eigenvalue_cache_import,
             export=_eigenvalue_cache_export,
-            filename_generator=_eigenvalue_cache_filename_generator
+            filename_generator=_eigenvalue_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _eigenvector_cache_key_generator(*args, **kwargs):
@@ -80,7 +81,8 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
             key_generator=_eigenvector_cache_key_generator,
             import_=_eigenvector_cache_import,
             export=_eigenvector_cache_export,
-            filename_generator=_eigenvector_cache_filename_generator
+            filename_generator=_eigenvector_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     def init(self):
@@ -162,7 +164,7 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
             return (self.expansion_index, self.spectrum)
 
     def _cache_file(self, cache_key):
-        return hashlib.sha1(str(cache_key).encode("utf-8")).hexdigest()
+        return hashlib.sha1((self.truth_problem._cache_definition_hash() + str(cache_key)).encode("utf-8")).hexdigest()
 
     def export_eigenvalue(self, folder=None, filename=None):
         if folder is None:
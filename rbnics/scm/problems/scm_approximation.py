@@ -6,6 +6,9 @@
 
 import os
 import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from numpy import array
 from rbnics.backends import export, import_, LinearProgramSolver
 from rbnics.backends.common.linear_program_solver import Error as LinearProgramSolverError, Matrix, Vector
 from rbnics.problems.base import ParametrizedProblem
@@ -36,6 +39,9 @@ class SCMApproximation(ParametrizedProblem):
         # greedy_selected_parameters_complement: dict, over N, of list storing the complement of parameters
         # selected during the training phase
         self.greedy_selected_parameters_complement = dict()
+        # greedy_selected_parameters_prefix: dict, over N, of list storing the first N parameters selected
+        # during the training phase, so that their spatial index for closest parameters queries is preserved
+        self.greedy_selected_parameters_prefix = dict()
         # upper_bound_vectors: list of Q-dimensional vectors storing the infimizing elements at the greedily
         # selected parameters
         self.upper_bound_vectors = UpperBoundsList()
@@ -44,6 +50,9 @@ class SCMApproximation(ParametrizedProblem):
         # Storage for online computations
         self._stability_factor_lower_bound = 0.
         self._stability_factor_upper_bound = 0.
+        # Storage of quantities which are shared by the linear programs of different parameters
+        self._stability_factor_thetas = dict()  # from parameter to theta of the stability factor lhs matrix
+        self._selected_stability_factors = dict()  # from selected parameter to its (exact) stability factor
 
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "reduced_cache")
@@ -73,7 +82,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_lower_bound_cache_import,
             export=_stability_factor_lower_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _stability_factor_upper_bound_cache_import(filename):
@@ -88,7 +98,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_upper_bound_cache_import,
             export=_stability_factor_upper_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         # Stability factor eigen problem
@@ -103,6 +114,10 @@ class SCMApproximation(ParametrizedProblem):
         self.truth_problem.init()
         # Init exact stability factor computations
         self.stability_factor_calculator.init()
+        # Clear storage shared by linear programs, since selected parameters may change
+        self.greedy_selected_parameters_prefix.clear()
+        self._stability_factor_thetas.clear()
+        self._selected_stability_factors.clear()
         # Read/Initialize reduced order data structures
         if current_stage == "online":
             self.bounding_box_min.load(self.folder["reduced_operators"], "bounding_box_min")
@@ -159,40 +174,25 @@ class SCMApproximation(ParametrizedProblem):
         constraints_vector = Vector(M_e + M_p + 1)
 
         # 2a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters
-        mu_bak = self.mu
         closest_selected_parameters = self._closest_selected_parameters(M_e, N, self.mu)
         for (j, omega) in enumerate(closest_selected_parameters):
-            # Overwrite parameter values
-            self.set_mu(omega)
-
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
-
             # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[j, q] = current_theta[q]
+            constraints_matrix[j, :] = self._compute_stability_factor_theta(omega)
 
-            # Assemble the RHS of the constraint: note that computations for this call may be already cached
-            (constraints_vector[j], _) = self.evaluate_stability_factor()
-        self.set_mu(mu_bak)
+            # Assemble the RHS of the constraint
+            constraints_vector[j] = self._evaluate_selected_stability_factor(omega)
 
         # 2b. Add constraints: also constrain the closest point in the complement of selected parameters,
         #                      with RHS depending on previously computed lower bounds
         mu_bak = self.mu
         closest_selected_parameters_complement = self._closest_unselected_parameters(M_p, N, self.mu)
         for (j, nu) in enumerate(closest_selected_parameters_complement):
-            # Overwrite parameter values
-            self.set_mu(nu)
-
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
-
             # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[M_e + j, q] = current_theta[q]
+            constraints_matrix[M_e + j, :] = self._compute_stability_factor_theta(nu)
 
             # Assemble the RHS of the constraint: note that computations for this call may be already cached
             if N > 1:
+                self.set_mu(nu)
                 constraints_vector[M_e + j] = self.get_stability_factor_lower_bound(N - 1)
             else:
                 constraints_vector[M_e + j] = 0.
@@ -200,19 +200,17 @@ class SCMApproximation(ParametrizedProblem):
 
         # 2c. Add constraints: also constrain the stability factor for mu to be positive
         # Compute theta
-        current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        current_theta = self._compute_stability_factor_theta(self.mu)
 
         # Assemble the LHS of the constraint
-        for q in range(Q):
-            constraints_matrix[M_e + M_p, q] = current_theta[q]
+        constraints_matrix[M_e + M_p, :] = current_theta
 
         # Assemble the RHS of the constraint
         constraints_vector[M_e + M_p] = 0.
 
         # 3. Add cost function coefficients
         cost = Vector(Q)
-        for q in range(Q):
-            cost[q] = current_theta[q]
+        cost[:] = current_theta
 
         # 4. Solve the linear programming problem
         linear_program = LinearProgramSolver(cost, constraints_matrix, constraints_vector, bounds)
@@ -226,6 +224,56 @@ class SCMApproximation(ParametrizedProblem):
 
         self._stability_factor_lower_bound = stability_factor_lower_bound
 
+    def _compute_stability_factor_theta(self, mu):
+        if mu not in self._stability_factor_thetas:
+            mu_bak = self.mu
+            self.set_mu(mu)
+            self._stability_factor_thetas[mu] = array(
+                self.truth_problem.compute_theta("stability_factor_left_hand_matrix"), dtype=float)
+            self.set_mu(mu_bak)
+        return self._stability_factor_thetas[mu]
+
+    def _evaluate_selected_stability_factor(self, mu):
+        # Stability factors at the selected parameters are required by every linear program, and are thus
+        # kept in memory rather than being read again from the (disk) cache of the eigenvalue problem
+        if mu not in self._selected_stability_factors:
+            mu_bak = self.mu
+            self.set_mu(mu)
+            (self._selected_stability_factors[mu], _) = self.evaluate_stability_factor()
+            self.set_mu(mu_bak)
+        return self._selected_stability_factors[mu]
+
+    # Get a lower bound for the stability factor for all parameters in mus. If a pool size is provided,
+    # linear programs are solved by a pool of (forked) processes, which store their results in the cache
+    def get_stability_factor_lower_bounds(self, mus, N=None, pool_size=None):
+        if N is None:
+            N = self.N
+        mus = list(mus)
+        mu_bak = self.mu
+        if pool_size is not None and len(mus) > 1:
+            assert self.training_set.mpi_comm.size == 1, (
+                "Computing SCM lower bounds in a process pool is not supported in parallel MPI runs")
+            # Make sure that all data shared by the linear programs is computed once by the parent process
+            for omega in self.greedy_selected_parameters[:N]:
+                self._evaluate_selected_stability_factor(omega)
+            global _scm_approximation_for_pool
+            _scm_approximation_for_pool = self
+            try:
+                with ProcessPoolExecutor(
+                        max_workers=min(pool_size, len(mus)), mp_context=multiprocessing.get_context("fork")
+                ) as executor:
+                    stability_factor_lower_bounds = list(executor.map(
+                        _get_stability_factor_lower_bound_in_pool, [(mu, N) for mu in mus]))
+            finally:
+                _scm_approximation_for_pool = None
+        else:
+            stability_factor_lower_bounds = list()
+            for mu in mus:
+                self.set_mu(mu)
+                stability_factor_lower_bounds.append(self.get_stability_factor_lower_bound(N))
+        self.set_mu(mu_bak)
+        return array(stability_factor_lower_bounds, dtype=float)
+
     # Get an upper bound for the stability factor
     def get_stability_factor_upper_bound(self, N=None):
         if N is None:
@@ -262,10 +310,13 @@ class SCMApproximation(ParametrizedProblem):
         return (self.mu, N)
 
     def _cache_file(self, N):
-        return hashlib.sha1(str(self._cache_key(N)).encode("utf-8")).hexdigest()
+        return hashlib.sha1(
+            (self.truth_problem._cache_definition_hash() + str(self._cache_key(N))).encode("utf-8")).hexdigest()
 
     def _closest_selected_parameters(self, M, N, mu):
-        return self.greedy_selected_parameters[:N].closest(M, mu)
+        if N not in self.greedy_selected_parameters_prefix:
+            self.greedy_selected_parameters_prefix[N] = self.greedy_selected_parameters[:N]
+        return self.greedy_selected_parameters_prefix[N].closest(M, mu)
 
     def _closest_unselected_parameters(self, M, N, mu):
         if N not in self.greedy_selected_parameters_complement:
@@ -305,3 +356,13 @@ class SCMApproximation(ParametrizedProblem):
         import_(stability_factor_upper_bound_storage, folder, filename + "_upper_bound")
         assert len(stability_factor_upper_bound_storage) == 1
         self._stability_factor_upper_bound = stability_factor_upper_bound_storage[0]
+
+
+# Auxiliary storage and function for the evaluation of lower bounds by a pool of forked processes
+_scm_approximation_for_pool = None
+
+
+def _get_stability_factor_lower_bound_in_pool(mu_and_N):
+    (mu, N) = mu_and_N
+    _scm_approximation_for_pool.set_mu(mu)
+    return _scm_approximation_for_pool.get_stability_factor_lower_bound(N)
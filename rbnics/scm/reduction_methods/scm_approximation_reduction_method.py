@@ -29,6 +29,13 @@ class SCMApproximationReductionMethod(ReductionMethod):
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
         self.greedy_selected_parameters = SCM_approximation.greedy_selected_parameters
         self.greedy_error_estimators = GreedyErrorEstimatorsList()
+        self.lower_bounds_pool_size = None
+
+    # OFFLINE: set the number of worker processes which solve the linear programs for the stability factor
+    # lower bounds over the training set, or None to solve them in the current process only
+    def set_lower_bounds_pool_size(self, pool_size):
+        assert pool_size is None or pool_size > 0
+        self.lower_bounds_pool_size = pool_size
 
     # OFFLINE: set the elements in the training set.
     def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
@@ -174,25 +181,31 @@ class SCMApproximationReductionMethod(ReductionMethod):
 
     # Choose the next parameter in the offline stage in a greedy fashion
     def greedy(self):
-        def solve_and_estimate_error(mu):
-            self.SCM_approximation.set_mu(mu)
+        def solve_and_estimate_error(mus):
+            # Lower bounds are evaluated for all parameters at once, possibly by a pool of processes
+            stability_factor_lower_bounds = self.SCM_approximation.get_stability_factor_lower_bounds(
+                mus, pool_size=self.lower_bounds_pool_size)
+
+            error_estimators = list()
+            for (mu, stability_factor_lower_bound) in zip(mus, stability_factor_lower_bounds):
+                self.SCM_approximation.set_mu(mu)
 
-            stability_factor_lower_bound = self.SCM_approximation.get_stability_factor_lower_bound()
-            stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound()
-            ratio = stability_factor_lower_bound / stability_factor_upper_bound
+                stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound()
+                ratio = stability_factor_lower_bound / stability_factor_upper_bound
 
-            if ratio < 0. and not isclose(ratio, 0.):  # if ratio << 0
-                print("SCM warning at mu = " + str(mu)
-                      + ": stability factor lower bound = " + str(stability_factor_lower_bound) + " < 0")
-            if ratio > 1. and not isclose(ratio, 1.):  # if ratio >> 1
-                print("SCM warning at mu = " + str(mu)
-                      + ": stability factor lower bound = " + str(stability_factor_lower_bound)
-                      + " > stability factor upper bound = " + str(stability_factor_upper_bound))
+                if ratio < 0. and not isclose(ratio, 0.):  # if ratio << 0
+                    print("SCM warning at mu = " + str(mu)
+                          + ": stability factor lower bound = " + str(stability_factor_lower_bound) + " < 0")
+                if ratio > 1. and not isclose(ratio, 1.):  # if ratio >> 1
+                    print("SCM warning at mu = " + str(mu)
+                          + ": stability factor lower bound = " + str(stability_factor_lower_bound)
+                          + " > stability factor upper bound = " + str(stability_factor_upper_bound))
 
-            error_estimator = 1. - ratio
-            return error_estimator
+                error_estimators.append(1. - ratio)
+            return error_estimators
 
-        (error_estimator_max, error_estimator_argmax) = self.training_set.max(solve_and_estimate_error)
+        (error_estimator_max, error_estimator_argmax) = self.training_set.max(solve_and_estimate_error,
+                                                                              vectorized=True)
         self.SCM_approximation.set_mu(self.training_set[error_estimator_argmax])
         self.greedy_error_estimators.append(error_estimator_max)
         self.greedy_error_estimators.save(self.folder["post_processing"], "error_estimator_max")
@@ -230,7 +243,7 @@ class SCMApproximationReductionMethod(ReductionMethod):
         error_analysis_table.set_Nmax(N_generator_max())
         error_analysis_table.add_column("normalized_error", group_name="scm", operations=("min", "mean", "max"))
 
-        for (mu_index, mu) in enumerate(self.testing_set):
+        def error_analysis_row(mu_index, mu):
             print(TextLine("SCM " + str(mu_index), fill="~"))
 
             self.SCM_approximation.set_mu(mu)
@@ -260,6 +273,8 @@ class SCMApproximationReductionMethod(ReductionMethod):
                 error_analysis_table["normalized_error", n, mu_index] = (
                     exact_stability_factor - stability_factor_lower_bound) / stability_factor_upper_bound
 
+        self._error_analysis_rows(error_analysis_table, error_analysis_row, filename)
+
         # Print
         print("")
         print(error_analysis_table)
@@ -4,17 +4,31 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import glob
+import os
+import re
+import shutil
+import sys
+from collections import OrderedDict
 from collections.abc import MutableMapping
 from functools import wraps
 from logging import DEBUG, getLogger
-from pylru import lrucache
+from weakref import WeakKeyDictionary, WeakSet
+from numpy import dtype
+from rbnics.utils.mpi import parallel_io
 
 logger = getLogger("rbnics/utils/cache/cache.py")
 
 
 class Cache(object):
-    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None):
+    # Storage for class methods
+    _instances = WeakSet()
+
+    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None,
+                 folder=None):
         self._config_section = config_section
+        self._statistics = {"hits": 0, "misses": 0, "disk hits": 0}
+        self._disk_storage = None
         if self._config_section is None:
             self._storage = dict()
             self._key_generator = None
@@ -22,28 +36,23 @@ class Cache(object):
             self._export = None
             self._filename_generator = None
         else:
+            self._instances.add(self)
             from rbnics.utils.config import config  # cannot import at global scope
             cache_options = config.get(self._config_section, "cache")
             assert isinstance(cache_options, set)
             if "RAM" in cache_options:
-                cache_size = config.get(self._config_section, "RAM cache limit")
-                assert isinstance(cache_size, str)
-                if cache_size == "unlimited":
-                    self._storage = dict()
-                else:
-                    assert cache_size.isdigit()
-                    cache_size = int(cache_size)
-                    assert cache_size > 0
-                    self._storage = lrucache(cache_size)
+                (entries_limit, bytes_limit) = _parse_cache_limit(config.get(self._config_section, "RAM cache limit"))
+                self._storage = LRUStorage(entries_limit, bytes_limit)
                 assert key_generator is not None
                 self._key_generator = key_generator
             else:
                 self._storage = DisabledStorage()
                 self._key_generator = key_generator
             if "disk" in cache_options:
-                cache_size = config.get(self._config_section, "disk cache limit")
-                assert isinstance(cache_size, str)
-                assert cache_size == "unlimited"
+                (entries_limit, bytes_limit) = _parse_cache_limit(config.get(self._config_section, "disk cache limit"))
+                if entries_limit is not None or bytes_limit is not None:
+                    assert folder is not None
+                    self._disk_storage = DiskLRUStorage.get(folder, entries_limit, bytes_limit)
                 assert import_ is not None
                 self._import = import_
                 assert export is not None
@@ -85,26 +94,33 @@ class Cache(object):
             if self._filename_generator is not None:
                 storage_filename = self._filename_generator(*args, **kwargs)
                 try:
-                    self._storage[storage_key] = self._import(storage_filename)
+                    storage_value = self._import(storage_filename)
                 except OSError:
                     logger.log(DEBUG, "Could not load key " + str(storage_key)
                                + " (corresponding to args = " + str(args)
                                + " and kwargs = " + str(kwargs) + ") from cache or disk")
+                    self._statistics["misses"] += 1
                     raise key_error
                 else:
                     logger.log(DEBUG, "Loaded key " + str(storage_key)
                                + " (corresponding to args = " + str(args)
                                + " and kwargs = " + str(kwargs) + ") from disk")
-                    return self._storage[storage_key]
+                    self._statistics["disk hits"] += 1
+                    if self._disk_storage is not None:
+                        self._disk_storage.touch(storage_filename)
+                    self._storage[storage_key] = storage_value
+                    return storage_value
             else:
                 logger.log(DEBUG, "Could not load key " + str(storage_key)
                            + " (corresponding to args = " + str(args)
                            + " and kwargs = " + str(kwargs) + ") from cache")
+                self._statistics["misses"] += 1
                 raise key_error
         else:
             logger.log(DEBUG, "Loaded key " + str(storage_key)
                        + " (corresponding to args = " + str(args)
                        + " and kwargs = " + str(kwargs) + ") from cache")
+            self._statistics["hits"] += 1
             return storage_value
 
     def __setitem__(self, key, value):
@@ -116,6 +132,8 @@ class Cache(object):
         if self._filename_generator is not None:
             storage_filename = self._filename_generator(*args, **kwargs)
             self._export(storage_filename)
+            if self._disk_storage is not None:
+                self._disk_storage.touch(storage_filename)
 
     def __delitem__(self, key):
         """
@@ -124,6 +142,63 @@ class Cache(object):
         (_, _, storage_key) = self._compute_storage_key(key)
         del self._storage[storage_key]
 
+    def statistics(self):
+        """
+        Returns hits, misses and evictions counters, as well as the current size in bytes of RAM and disk cache.
+        """
+        statistics = dict(self._statistics)
+        statistics["evictions"] = getattr(self._storage, "evictions", 0)
+        statistics["RAM bytes"] = getattr(self._storage, "bytes", 0)
+        if self._disk_storage is not None:
+            statistics["disk evictions"] = self._disk_storage.evictions
+            statistics["disk bytes"] = self._disk_storage.bytes
+        else:
+            statistics["disk evictions"] = 0
+            statistics["disk bytes"] = 0
+        return statistics
+
+    @classmethod
+    def snapshot_statistics(cls):
+        """
+        Returns the current value of hits, misses and evictions counters of all caches, to be later passed
+        to get_statistics in order to only account for cache accesses which happened after the snapshot.
+        """
+        snapshot = WeakKeyDictionary()  # from cache or disk storage to its counters
+        for instance in cls._instances:
+            snapshot[instance] = instance.statistics()
+            if instance._disk_storage is not None:
+                snapshot[instance._disk_storage] = instance._disk_storage.evictions
+        return snapshot
+
+    @classmethod
+    def get_statistics(cls, snapshot=None):
+        """
+        Returns the statistics of all caches associated to a config section, summed over each config section.
+        If a snapshot is provided, hits, misses and evictions counters are computed since the snapshot was taken.
+        """
+        if snapshot is None:
+            snapshot = dict()
+        statistics = OrderedDict()
+        disk_storages = dict()  # from config section to set of disk storages, which may be shared between caches
+        for instance in cls._instances:
+            instance_statistics = instance.statistics()
+            if instance in snapshot:
+                for counter in ("hits", "misses", "disk hits", "evictions"):
+                    instance_statistics[counter] -= snapshot[instance][counter]
+            if instance._config_section not in statistics:
+                statistics[instance._config_section] = instance_statistics
+                disk_storages[instance._config_section] = set()
+            else:
+                for counter in ("hits", "misses", "disk hits", "evictions", "RAM bytes"):
+                    statistics[instance._config_section][counter] += instance_statistics[counter]
+            if instance._disk_storage is not None:
+                disk_storages[instance._config_section].add(instance._disk_storage)
+        for (config_section, config_section_disk_storages) in disk_storages.items():
+            statistics[config_section]["disk evictions"] = sum(
+                d.evictions - snapshot.get(d, 0) for d in config_section_disk_storages)
+            statistics[config_section]["disk bytes"] = sum(d.bytes for d in config_section_disk_storages)
+        return OrderedDict(sorted(statistics.items()))
+
     def _compute_storage_key(self, key):
         from rbnics.utils.io import OnlineSizeDict  # cannot import at global scope
         if isinstance(key, tuple):
@@ -187,6 +262,165 @@ def cache(fun):
     return wrapper
 
 
+class LRUStorage(MutableMapping):
+    """
+    Least recently used storage, bounded by the number of entries and/or by their overall size in bytes.
+    """
+
+    def __init__(self, entries_limit=None, bytes_limit=None):
+        self._storage = OrderedDict()
+        self._sizes = dict()
+        self._entries_limit = entries_limit
+        self._bytes_limit = bytes_limit
+        self.bytes = 0
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        value = self._storage[key]
+        self._storage.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._storage:
+            self.bytes -= self._sizes[key]
+        self._storage[key] = value
+        self._storage.move_to_end(key)
+        self._sizes[key] = _get_size(value)
+        self.bytes += self._sizes[key]
+        # Evict least recently used entries, but never the one which has just been stored
+        while len(self._storage) > 1 and (
+            (self._entries_limit is not None and len(self._storage) > self._entries_limit)
+                or (self._bytes_limit is not None and self.bytes > self._bytes_limit)):
+            (evicted_key, _) = self._storage.popitem(last=False)
+            self.bytes -= self._sizes.pop(evicted_key)
+            self.evictions += 1
+
+    def __delitem__(self, key):
+        del self._storage[key]
+        self.bytes -= self._sizes.pop(key)
+
+    def __contains__(self, key):
+        return key in self._storage
+
+    def __iter__(self):
+        return iter(self._storage)
+
+    def __len__(self):
+        return len(self._storage)
+
+    def clear(self):
+        self._storage.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+
+class DiskLRUStorage(object):
+    """
+    Keeps track of files written to (or read from) disk cache, deleting the least recently used ones
+    when the number of entries and/or their overall size in bytes exceeds the limit. All files sharing the same
+    filename prefix are considered as a single entry, and caches sharing the same folder and the same limits
+    share the same storage. Files which have been written by previous runs are not accounted for until they
+    are accessed.
+    """
+
+    # Storage for class methods
+    _storages = dict()  # from folder and limits to DiskLRUStorage
+
+    @classmethod
+    def get(cls, folder, entries_limit=None, bytes_limit=None):
+        key = (str(folder), entries_limit, bytes_limit)
+        if key not in cls._storages:
+            cls._storages[key] = cls(*key)
+        return cls._storages[key]
+
+    def __init__(self, folder, entries_limit=None, bytes_limit=None):
+        self._folder = folder
+        self._sizes = OrderedDict()
+        self._entries_limit = entries_limit
+        self._bytes_limit = bytes_limit
+        self.bytes = 0
+        self.evictions = 0
+
+    def touch(self, filename):
+        if filename in self._sizes:
+            self.bytes -= self._sizes[filename]
+        self._sizes[filename] = parallel_io(lambda: sum(_get_disk_size(f) for f in self._files(filename)))
+        self._sizes.move_to_end(filename)
+        self.bytes += self._sizes[filename]
+        # Evict least recently used files, but never the one which has just been accessed
+        while len(self._sizes) > 1 and (
+            (self._entries_limit is not None and len(self._sizes) > self._entries_limit)
+                or (self._bytes_limit is not None and self.bytes > self._bytes_limit)):
+            (evicted_filename, evicted_size) = self._sizes.popitem(last=False)
+            parallel_io(lambda: [_remove_from_disk(f) for f in self._files(evicted_filename)])
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def _files(self, filename):
+        # Export may write several files (e.g., one per component, or data and metadata files) with the same prefix
+        return glob.glob(os.path.join(glob.escape(str(self._folder)), glob.escape(filename) + "*"))
+
+
+def _parse_cache_limit(cache_limit):
+    """
+    Parse a cache limit, which can be either "unlimited", an integer number of entries,
+    or a size in bytes with a unit (e.g. "500MB" or "2 GB").
+    """
+    assert isinstance(cache_limit, str)
+    if cache_limit == "unlimited":
+        return (None, None)
+    elif cache_limit.isdigit():
+        entries_limit = int(cache_limit)
+        assert entries_limit > 0
+        return (entries_limit, None)
+    else:
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?B)\s*", cache_limit.upper())
+        assert match is not None, "Invalid cache limit " + cache_limit
+        bytes_limit = int(float(match.group(1)) * _bytes_units[match.group(2)])
+        assert bytes_limit > 0
+        return (None, bytes_limit)
+
+
+_bytes_units = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def _get_size(value):
+    """
+    Estimate the size in bytes of a cached value.
+    """
+    if hasattr(value, "nbytes"):  # numpy arrays
+        return value.nbytes
+    elif hasattr(value, "content"):  # online backend objects
+        return _get_size(value.content)
+    elif hasattr(value, "vector") and callable(value.vector):  # functions
+        return _get_size(value.vector())
+    elif hasattr(value, "local_size") and callable(value.local_size):  # distributed vectors
+        return value.local_size() * dtype(float).itemsize
+    elif hasattr(value, "nnz") and callable(value.nnz):  # distributed sparse matrices
+        return value.nnz() * (dtype(float).itemsize + dtype("int32").itemsize)
+    elif isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_get_size(v) for v in value)
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_get_size(v) for v in value.values())
+    else:
+        return sys.getsizeof(value)
+
+
+def _get_disk_size(path):
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(root, f)) for (root, _, files) in os.walk(path) for f in files)
+    else:
+        return os.path.getsize(path)
+
+
+def _remove_from_disk(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
 class DisabledStorage(MutableMapping):
     def __getitem__(self, key):
         raise KeyError
@@ -25,19 +25,29 @@ class Config(object):
             "disk cache limit": "unlimited",
             "RAM cache limit": "1"
         },
+        "factorizations": {
+            "cache": {"RAM"},
+            "RAM cache limit": "100"
+        },
         "problems": {
             "cache": {"disk", "RAM"},
+            "cache folder": "",
             "disk cache limit": "unlimited",
             "RAM cache limit": "1"
         },
         "reduced problems": {
             "cache": {"RAM"},
+            "packed operators": True,
             "RAM cache limit": "unlimited"
         },
         "SCM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
             "RAM cache limit": "1"
+        },
+        "thetas": {
+            "cache": {"RAM"},
+            "RAM cache limit": "10000"
         }
     }
 
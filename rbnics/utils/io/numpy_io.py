@@ -23,10 +23,10 @@ class NumpyIO(object):
 
     # Load a variable from file
     @staticmethod
-    def load_file(directory, filename):
+    def load_file(directory, filename, mmap_mode=None):
         if not filename.endswith(".npy"):
             filename = filename + ".npy"
-        return numpy.load(os.path.join(str(directory), filename), allow_pickle=True)
+        return numpy.load(os.path.join(str(directory), filename), mmap_mode=mmap_mode, allow_pickle=True)
 
     # Check if the file exists
     @staticmethod
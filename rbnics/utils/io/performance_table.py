@@ -28,13 +28,22 @@ class PerformanceTable(object):
         self._len_testing_set = len(testing_set)
         self._Nmin = 1
         self._Nmax = 0
+        # Cache statistics are only reported for cache accesses which happen after the table has been created
+        from rbnics.utils.cache import Cache  # cannot import at global scope
+        self._cache_statistics_snapshot = Cache.snapshot_statistics()
 
     def set_Nmin(self, Nmin):
         self._Nmin = Nmin
 
+    def get_Nmin(self):
+        return self._Nmin
+
     def set_Nmax(self, Nmax):
         self._Nmax = Nmax
 
+    def get_Nmax(self):
+        return self._Nmax
+
     def add_column(self, column_name, group_name, operations):
         assert self._Nmax > 0
         assert self._Nmax >= self._Nmin
@@ -107,6 +116,34 @@ class PerformanceTable(object):
             else:
                 self._columns[column_name][N - self._Nmin, mu_index] = self._preprocessor_setitem[column_name](value)
 
+    # Content of all columns for the parameter mu_index of the testing set, as a dict from column name to
+    # a tuple (values for each N, column implemented status, row implemented status for each N)
+    def get_row(self, mu_index):
+        return {column_name: (
+            self._columns[column_name][:, mu_index].copy(),
+            self._columns_not_implemented[column_name],
+            dict(self._rows_not_implemented[column_name])
+        ) for column_name in self._columns}
+
+    # Store the content of all columns for the parameter mu_index of the testing set, as returned by get_row
+    def set_row(self, mu_index, row):
+        assert row.keys() == self._columns.keys()
+        for (column_name, (values, column_not_implemented, rows_not_implemented)) in row.items():
+            assert values.shape == (self._Nmax - self._Nmin + 1, )
+            self._columns[column_name][:, mu_index] = values
+            if column_not_implemented is False or self._columns_not_implemented[column_name] is None:
+                self._columns_not_implemented[column_name] = column_not_implemented
+            for (n, row_not_implemented) in rows_not_implemented.items():
+                if self._rows_not_implemented[column_name][n] is None:
+                    self._rows_not_implemented[column_name][n] = row_not_implemented
+                else:
+                    assert row_not_implemented in (None, self._rows_not_implemented[column_name][n])
+
+    # Check if the content returned by get_row was obtained from a table with the same columns and N range
+    def has_row_shape(self, row):
+        return row.keys() == self._columns.keys() and all(
+            values.shape == (self._Nmax - self._Nmin + 1, ) for (values, _, _) in row.values())
+
     def _process(self):
         groups_content = collections.OrderedDict()
         for group in self._group_names_sorted:
@@ -202,6 +239,14 @@ class PerformanceTable(object):
                         current_line.append(table_content[t][n - self._Nmin])
                     output += formatter.format(*current_line, **column_size) + "\n"
             output += "\n"
+        # Print cache statistics
+        cache_statistics = self._process_cache_statistics()
+        if len(cache_statistics) > 1:
+            column_size = [max(len(str(row[c])) for row in cache_statistics) for c in range(len(cache_statistics[0]))]
+            formatter = "\t".join("{" + str(c) + ":<" + str(size) + "}" for (c, size) in enumerate(column_size))
+            for row in cache_statistics:
+                output += formatter.format(*row) + "\n"
+            output += "\n"
         return output[:-2]  # remove the last two newlines
 
     def save(self, directory, filename):
@@ -223,6 +268,22 @@ class PerformanceTable(object):
                     current_file.append([table_content[t][n - self._Nmin] for t in table_index])
             # Save
             CSVIO.save_file(current_file, full_directory, group)
+        # Save cache statistics
+        cache_statistics = self._process_cache_statistics()
+        if len(cache_statistics) > 1:
+            CSVIO.save_file(cache_statistics, full_directory, "cache")
+
+    def _process_cache_statistics(self):
+        if "cache" in self._suppressed_groups:
+            return list()
+        from rbnics.utils.cache import Cache  # cannot import at global scope
+        counters = ("hits", "disk hits", "misses", "evictions", "disk evictions", "RAM bytes", "disk bytes")
+        cache_statistics = list()
+        cache_statistics.append(["cache"] + list(counters))
+        for (config_section, statistics) in Cache.get_statistics(self._cache_statistics_snapshot).items():
+            if statistics["hits"] + statistics["disk hits"] + statistics["misses"] > 0:
+                cache_statistics.append([config_section] + [statistics[counter] for counter in counters])
+        return cache_statistics
 
     def load(self, directory, filename):
         raise RuntimeError("PerformanceTable.load has not been implemented yet")
@@ -100,8 +100,8 @@ setup(name="RBniCS",
           "cvxopt>=1.2.0",
           "mpi4py",
           "multipledispatch>=0.5.0",
-          "pylru",
           "pytest-runner",
+          "scipy>=1.10",
           "sympy>=1.0",
           "toposort"
       ],
@@ -11,6 +11,7 @@ from dolfin import assemble, dx, grad, FunctionSpace, inner, TestFunction, Trial
 from rbnics.backends import BasisFunctionsMatrix
 from rbnics.backends import transpose as factory_transpose
 from rbnics.backends.dolfin import transpose as dolfin_transpose
+from rbnics.backends.dolfin.wrapping.basis_functions_matrix_mul import _projections
 from rbnics.backends.online.numpy import Matrix as NumpyMatrix
 from test_utils import RandomDolfinFunction
 
@@ -71,3 +72,39 @@ def test_dolfin_Z_T_dot_A_Z(Th, N, test_type, benchmark):
         global transpose
         transpose = all_transpose[test_type]
         benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
+
+
+class IncrementalData(Data):
+    def __init__(self, Th, N, N_new):
+        Data.__init__(self, Th, N)
+        self.N_new = N_new
+        # Use a non symmetric matrix, so that new rows of the projection (computed with A^T) differ from new columns
+        u = TrialFunction(self.V)
+        v = TestFunction(self.V)
+        self.a = lambda k: k * inner(grad(u), grad(v)) * dx + k * u.dx(0) * v * dx
+
+    def generate_random(self):
+        (Z, A) = Data.generate_random(self)
+        # Project on the first N - N_new basis functions, so that the projection on all of them
+        # only requires the computation of the new rows and columns
+        Z_incremental = BasisFunctionsMatrix(self.V)
+        Z_incremental.init("u")
+        for n in range(self.N - self.N_new):
+            Z_incremental.enrich(Z[n])
+        transpose(Z_incremental) * A * Z_incremental
+        assert Z_incremental in _projections
+        for n in range(self.N - self.N_new, self.N):
+            Z_incremental.enrich(Z[n])
+        return (Z_incremental, A)
+
+
+@pytest.mark.parametrize("Th", [2**i for i in range(3, 7)])
+@pytest.mark.parametrize("N", [10 + 4 * j for j in range(1, 4)])
+@pytest.mark.parametrize("test_type", list(all_transpose.keys()))
+def test_dolfin_Z_T_dot_A_Z_incremental(Th, N, test_type, benchmark):
+    data = IncrementalData(Th, N, 1)
+    print("Th = " + str(Th) + ", Nh = " + str(data.V.dim()) + ", N = " + str(N))
+    print("Testing", test_type, "backend")
+    global transpose
+    transpose = all_transpose[test_type]
+    benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
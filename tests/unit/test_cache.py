@@ -0,0 +1,115 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import zeros
+from rbnics.utils.cache import Cache
+from rbnics.utils.cache.cache import _parse_cache_limit, DiskLRUStorage, LRUStorage
+
+
+# Test parsing of RAM and disk cache limits
+@pytest.mark.parametrize("cache_limit, expected", [
+    ("unlimited", (None, None)),
+    ("1", (1, None)),
+    ("100", (100, None)),
+    ("500B", (None, 500)),
+    ("2KB", (None, 2 * 1024)),
+    ("1.5MB", (None, int(1.5 * 1024**2))),
+    ("2 GB", (None, 2 * 1024**3)),
+    ("1tb", (None, 1024**4))
+])
+def test_parse_cache_limit(cache_limit, expected):
+    assert _parse_cache_limit(cache_limit) == expected
+
+
+@pytest.mark.parametrize("cache_limit", ["0", "0MB", "-1", "10 apples", "MB"])
+def test_parse_cache_limit_invalid(cache_limit):
+    with pytest.raises(AssertionError):
+        _parse_cache_limit(cache_limit)
+
+
+# Test eviction of least recently used entries when the number of entries is bounded
+def test_lru_storage_entries_limit():
+    storage = LRUStorage(entries_limit=2)
+    storage["a"] = 1
+    storage["b"] = 2
+    storage["a"]  # "b" is now the least recently used entry
+    storage["c"] = 3
+    assert list(storage) == ["a", "c"]
+    assert storage.evictions == 1
+    with pytest.raises(KeyError):
+        storage["b"]
+
+
+# Test eviction of least recently used entries when their overall size is bounded
+def test_lru_storage_bytes_limit():
+    storage = LRUStorage(bytes_limit=3 * zeros(10).nbytes)
+    for key in range(3):
+        storage[key] = zeros(10)
+    assert len(storage) == 3
+    assert storage.bytes == 3 * zeros(10).nbytes
+    storage[3] = zeros(10)
+    assert list(storage) == [1, 2, 3]
+    assert storage.evictions == 1
+    # The most recent entry is kept, even if it exceeds the limit on its own
+    storage[4] = zeros(40)
+    assert list(storage) == [4]
+    assert storage.bytes == zeros(40).nbytes
+    assert storage.evictions == 4
+    # Overwriting and deleting entries update the overall size
+    storage[4] = zeros(20)
+    assert storage.bytes == zeros(20).nbytes
+    del storage[4]
+    assert storage.bytes == 0
+
+
+# Test eviction of files from disk, where files with the same prefix are a single entry
+def test_disk_lru_storage(tempdir):
+    storage = DiskLRUStorage.get(tempdir, entries_limit=2)
+    assert DiskLRUStorage.get(tempdir, entries_limit=2) is storage
+    assert DiskLRUStorage.get(tempdir, entries_limit=3) is not storage
+    for filename in ("a", "b", "c"):
+        for extension in (".dat", ".xdmf"):
+            with open(os.path.join(tempdir, filename + extension), "w") as f:
+                f.write(filename)
+        storage.touch(filename)
+    assert sorted(os.listdir(tempdir)) == ["b.dat", "b.xdmf", "c.dat", "c.xdmf"]
+    assert storage.evictions == 1
+    assert storage.bytes == 4
+
+
+# Test that cache statistics can be restricted to the accesses after a snapshot
+def test_cache_statistics_snapshot(tempdir):
+    def filename_generator(key):
+        return "entry_" + str(key)
+
+    def import_(filename):
+        with open(os.path.join(tempdir, filename), "r") as f:
+            return int(f.read())
+
+    def export(filename):
+        with open(os.path.join(tempdir, filename), "w") as f:
+            f.write(filename[len("entry_"):])
+
+    cache = Cache("problems", key_generator=lambda key: key, import_=import_, export=export,
+                  filename_generator=filename_generator, folder=tempdir)
+    cache[1] = 1
+    assert cache[1] == 1
+    with pytest.raises(KeyError):
+        cache[2]
+    assert cache.statistics()["hits"] == 1
+    assert cache.statistics()["misses"] == 1
+    snapshot = Cache.snapshot_statistics()
+    assert cache[1] == 1
+    cache.clear()
+    assert cache[1] == 1
+    statistics = Cache.get_statistics(snapshot)["problems"]
+    assert statistics["hits"] == 1
+    assert statistics["disk hits"] == 1
+    assert statistics["misses"] == 0
+    assert cache.statistics()["hits"] == 2
+    assert cache.statistics()["disk hits"] == 1
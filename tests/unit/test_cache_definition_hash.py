@@ -0,0 +1,53 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from dolfin import Constant, DirichletBC
+from rbnics import ReducedBasis
+from thermal_block import generate_thermal_block_reduction_method, ThermalBlock
+
+
+# Thermal block problem with the temperature on the top side directly given by the second parameter,
+# so that the boundary conditions returned by assemble_operator depend on the current parameter
+class ThermalBlockParametrizedBoundaryConditions(ThermalBlock):
+
+    def compute_theta(self, term):
+        if term == "dirichlet_bc":
+            return (1.,)
+        else:
+            return ThermalBlock.compute_theta(self, term)
+
+    def assemble_operator(self, term):
+        if term == "dirichlet_bc":
+            return ([DirichletBC(self.V, Constant(self.mu[1]), self.boundaries, 3)],)
+        else:
+            return ThermalBlock.assemble_operator(self, term)
+
+
+def _generate_truth_problem(name, mu):
+    reduction_method = generate_thermal_block_reduction_method(
+        name, ReducedBasis, Problem=ThermalBlockParametrizedBoundaryConditions)
+    truth_problem = reduction_method.truth_problem
+    truth_problem.set_mu(mu)
+    return truth_problem
+
+
+# The definition hash is computed once by init, and does not depend on the parameter at which init is called
+def test_cache_definition_hash(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    truth_problem_1 = _generate_truth_problem("ThermalBlockDefinitionHash1", (1., 0.7))
+    truth_problem_2 = _generate_truth_problem("ThermalBlockDefinitionHash2", (5., 1.5))
+    truth_problem_1.init()
+    truth_problem_2.init()
+    definition_hash = truth_problem_1._cache_definition_hash()
+    assert truth_problem_2._cache_definition_hash() == definition_hash
+    # The parameter at which init was called has been restored
+    assert truth_problem_1.mu == (1., 0.7)
+    assert truth_problem_2.mu == (5., 1.5)
+    # Neither changing the parameter nor calling init again change the hash
+    truth_problem_1.set_mu((2., 2.))
+    assert truth_problem_1._cache_definition_hash() == definition_hash
+    truth_problem_1.init()
+    assert truth_problem_1._cache_definition_hash() == definition_hash
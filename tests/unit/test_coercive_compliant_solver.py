@@ -0,0 +1,56 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, asarray, tensordot
+from numpy.linalg import solve
+import rbnics.backends.online.numpy.linear_solver
+from rbnics import EllipticCoerciveCompliantProblem, ReducedBasis
+from thermal_block import generate_thermal_block_reduced_problem, online_mus, ThermalBlock
+
+
+# Compliant thermal block problem, since the source term is applied on the bottom side
+class ThermalBlockCompliant(ThermalBlock, EllipticCoerciveCompliantProblem):
+
+    def __init__(self, V, **kwargs):
+        ThermalBlock.__init__(self, V, **kwargs)
+        # ThermalBlockBase calls the initialization of EllipticCoerciveProblem: remove the output as
+        # EllipticCoerciveCompliantProblem does
+        self.terms.remove("s")
+        del self.terms_order["s"]
+
+
+# The reduced matrix of a coercive compliant problem is factorized by Cholesky, unless non homogeneous
+# Dirichlet boundary conditions are imposed on the reduced system
+@pytest.mark.parametrize("lifting", [False, True])
+def test_coercive_compliant_solver(tempdir, monkeypatch, lifting):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem(
+        "ThermalBlockCompliant" + ("Lifting" if lifting else ""), ReducedBasis, lifting, Problem=ThermalBlockCompliant)
+    assert reduced_problem._linear_solver_parameters["symmetric"] is not lifting
+
+    # Count Cholesky factorizations, disabling the check on the symmetry of the reduced matrix so that
+    # only the symmetric parameter of the linear solver is tested
+    cho_factor = rbnics.backends.online.numpy.linear_solver.cho_factor
+    cho_factor_calls = list()
+
+    def counting_cho_factor(*args, **kwargs):
+        cho_factor_calls.append(None)
+        return cho_factor(*args, **kwargs)
+
+    monkeypatch.setattr(rbnics.backends.online.numpy.linear_solver, "cho_factor", counting_cho_factor)
+    monkeypatch.setattr(rbnics.backends.online.numpy.linear_solver, "array_equal", lambda a, b: False)
+
+    N = reduced_problem.N
+    A = asarray(reduced_problem.operator["a"][:N, :N], dtype=float)
+    F = asarray(reduced_problem.operator["f"][:N], dtype=float)
+    for mu in online_mus:
+        reduced_problem.set_mu(mu)
+        solution = asarray(reduced_problem.solve().vector(), dtype=float)
+        if not lifting:
+            assert allclose(solution, solve(tensordot(reduced_problem.compute_theta("a"), A, 1), F[0]))
+            assert allclose(reduced_problem.compute_output(), solution.dot(F[0]))
+    assert len(cho_factor_calls) == (0 if lifting else len(online_mus))
@@ -0,0 +1,67 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, array
+from rbnics import CustomizeReducedProblemFor, EllipticCoerciveProblem, ReducedBasis
+from rbnics.sampling.distributions import EquispacedDistribution
+from thermal_block import generate_thermal_block_reduction_method, online_mus, ThermalBlock
+
+
+# Same problem, with residual norms evaluated through the compressed residual representation. Reduced problems
+# can only be customized for abstract problems, hence the customization is attached to an abstract base class
+class ThermalBlockCompressedResidualBase(EllipticCoerciveProblem):
+    pass
+
+
+@CustomizeReducedProblemFor(ThermalBlockCompressedResidualBase)
+def CustomizeReducedThermalBlockCompressedResidual(ReducedThermalBlock_Base):
+    class ReducedThermalBlockCompressedResidual(ReducedThermalBlock_Base):
+        def __init__(self, truth_problem, **kwargs):
+            ReducedThermalBlock_Base.__init__(self, truth_problem, **kwargs)
+            self.compress_residual = True
+
+    return ReducedThermalBlockCompressedResidual
+
+
+class ThermalBlockCompressedResidual(ThermalBlock, ThermalBlockCompressedResidualBase):
+    pass
+
+
+# Residual norms evaluated through the compressed residual representation, compared to the ones evaluated
+# through the quadratic form defined by the error estimation operators
+@pytest.mark.parametrize("lifting", (False, True))
+def test_compress_residual(tempdir, monkeypatch, lifting):
+    monkeypatch.chdir(tempdir)
+    greedy_selected_parameters = list()
+    reduced_problems = list()
+    for (name, Problem) in (("ThermalBlockResidual", ThermalBlock),
+                            ("ThermalBlockCompressedResidual", ThermalBlockCompressedResidual)):
+        reduction_method = generate_thermal_block_reduction_method(name, ReducedBasis, lifting, Problem=Problem)
+        reduction_method.initialize_training_set(25, sampling=EquispacedDistribution())
+        reduced_problems.append(reduction_method.offline())
+        greedy_selected_parameters.append(array(list(reduction_method.greedy_selected_parameters)))
+    (reduced_problem, compressed_reduced_problem) = reduced_problems
+    assert not reduced_problem.compress_residual
+    assert compressed_reduced_problem.compress_residual
+    # Error estimation operators replaced by the compressed representation are not assembled
+    assert len(compressed_reduced_problem.error_estimation_operator) == 0
+    # Error estimators agree up to round-off, hence the greedy selects the same parameters
+    assert greedy_selected_parameters[0].shape == greedy_selected_parameters[1].shape
+    assert allclose(greedy_selected_parameters[0], greedy_selected_parameters[1])
+    N = reduced_problem.N
+    for mu in online_mus:
+        residual_norms_squared = list()
+        for problem in reduced_problems:
+            problem.set_mu(mu)
+            residual_norms_squared.append(list())
+            for n in range(1, N + 1):
+                problem.solve(n)
+                residual_norms_squared[-1].append(problem.get_residual_norm_squared())
+        assert allclose(residual_norms_squared[0], residual_norms_squared[1],
+                        rtol=1e-6, atol=1e-10 * residual_norms_squared[0][0])
+        assert allclose(reduced_problem.estimate_error_many([mu]), compressed_reduced_problem.estimate_error_many([mu]),
+                        rtol=1e-6)
@@ -0,0 +1,54 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from rbnics import ReducedBasis
+from rbnics.sampling.distributions import EquispacedDistribution
+from thermal_block import generate_thermal_block_reduction_method
+
+
+# Error analysis interrupted and then resumed from the checkpoints of the completed rows, which are discarded
+# if the reduced basis has changed in the meantime
+@pytest.mark.parametrize("change_basis", (False, True))
+def test_error_analysis_checkpoints(tempdir, monkeypatch, change_basis):
+    monkeypatch.chdir(tempdir)
+    reduction_method = generate_thermal_block_reduction_method("ThermalBlockCheckpoints", ReducedBasis)
+    reduction_method.initialize_training_set(25, sampling=EquispacedDistribution())
+    reduced_problem = reduction_method.offline()
+    reduction_method.initialize_testing_set(6, sampling=EquispacedDistribution())
+    reduction_method.set_error_analysis_checkpoints(True)
+    checkpoints_folder = os.path.join(str(reduction_method.folder["error_analysis"]), "error_analysis_checkpoints")
+
+    # Keep track of the parameters for which a row is computed, possibly interrupting the error analysis
+    pin_truth_solution = reduced_problem.pin_truth_solution
+    computed_mus = list()
+    interrupt_after = [3]
+
+    def tracked_pin_truth_solution(**kwargs):
+        if len(computed_mus) == interrupt_after[0]:
+            raise RuntimeError("Error analysis interrupted")
+        computed_mus.append(tuple(reduced_problem.mu))
+        return pin_truth_solution(**kwargs)
+
+    monkeypatch.setattr(reduced_problem, "pin_truth_solution", tracked_pin_truth_solution)
+    with pytest.raises(RuntimeError):
+        reduction_method.error_analysis()
+    assert reduced_problem._pinned_truth_solve is None
+    assert len([f for f in os.listdir(checkpoints_folder) if f.startswith("row_")]) == 3
+
+    # Resume
+    if change_basis:
+        with open(os.path.join(str(reduced_problem.folder["basis"]), "changed"), "w") as f:
+            f.write("changed")
+    computed_mus.clear()
+    interrupt_after[0] = None
+    reduction_method.error_analysis()
+    if change_basis:
+        assert computed_mus == [tuple(mu) for mu in reduction_method.testing_set]
+    else:
+        assert computed_mus == [tuple(mu) for mu in reduction_method.testing_set][3:]
+    assert not os.path.exists(checkpoints_folder)
@@ -0,0 +1,65 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose, asarray, random, shares_memory
+from dolfin import Function, FunctionSpace, UnitSquareMesh
+from rbnics.backends import BasisFunctionsMatrix, FunctionsList
+from rbnics.backends.online import OnlineMatrix, OnlineVector
+from rbnics.backends.dolfin.wrapping.functions_list_mul import functions_to_local_array
+
+
+def _random_function(V):
+    f = Function(V)
+    f.vector().set_local(random.rand(f.vector().get_local().size))
+    f.vector().apply("insert")
+    return f
+
+
+def _random_online_vector(N):
+    v = OnlineVector(N)
+    v[:] = random.rand(N)
+    return v
+
+
+# Linear combination computed with a loop over the functions
+def _linear_combination(functions, coefficients):
+    coefficients = asarray(coefficients, dtype=float).reshape(-1)
+    output = coefficients[0] * functions[0].vector().get_local()
+    for (coefficient, fun) in zip(coefficients[1:], functions[1:]):
+        output += coefficient * fun.vector().get_local()
+    return output
+
+
+# Reconstruction from reduced coefficients, while the basis is enriched as during a greedy algorithm
+def test_basis_functions_matrix_mul_online_vector():
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    Z = BasisFunctionsMatrix(V)
+    Z.init("u")
+    for N in range(1, 9):
+        Z.enrich(_random_function(V))
+        for n in range(1, N + 1):
+            uN = _random_online_vector(n)
+            assert allclose((Z[:n] * uN).vector().get_local(), _linear_combination(Z[:n], uN))
+        # Slices of the basis share the local values of the basis functions, rather than storing a copy each
+        local_array_N = functions_to_local_array(list(Z[:N]))
+        assert shares_memory(functions_to_local_array(list(Z[:1])), local_array_N)
+
+
+# Linear combinations of the snapshots, as during a POD
+def test_functions_list_mul_online_matrix():
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    snapshots = FunctionsList(V)
+    for _ in range(100):
+        snapshots.enrich(_random_function(V))
+    coefficients_array = random.rand(100, 3)
+    coefficients = OnlineMatrix(100, 3)
+    coefficients[:, :] = coefficients_array
+    output = snapshots * coefficients
+    assert len(output) == 3
+    for j in range(3):
+        assert allclose(output[j].vector().get_local(), _linear_combination(snapshots, coefficients_array[:, j]))
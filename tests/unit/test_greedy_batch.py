@@ -0,0 +1,44 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, array
+from rbnics import ReducedBasis
+from rbnics.sampling.distributions import EquispacedDistribution
+from thermal_block import (generate_thermal_block_reduced_problem, generate_thermal_block_reduction_method,
+                           online_mus)
+
+
+# Batched greedy, compared to the greedy which solves one parameter at a time
+@pytest.mark.parametrize("lifting", (False, True))
+def test_greedy_batch(tempdir, monkeypatch, lifting):
+    monkeypatch.chdir(tempdir)
+    greedy_selected_parameters = list()
+    for greedy_batch_size in (None, 7):
+        reduction_method = generate_thermal_block_reduction_method(
+            "ThermalBlockGreedyBatch" + str(greedy_batch_size), ReducedBasis, lifting)
+        if greedy_batch_size is not None:
+            reduction_method.set_greedy_batch_size(greedy_batch_size)
+        reduction_method.initialize_training_set(25, sampling=EquispacedDistribution())
+        reduction_method.offline()
+        greedy_selected_parameters.append(array(list(reduction_method.greedy_selected_parameters)))
+    assert greedy_selected_parameters[0].shape == greedy_selected_parameters[1].shape
+    assert allclose(greedy_selected_parameters[0], greedy_selected_parameters[1])
+
+
+# Batched error estimators for each reduced dimension, which the batched greedy evaluates on the training set,
+# compared to the ones evaluated one parameter at a time
+@pytest.mark.parametrize("lifting", (False, True))
+def test_estimate_error_batch(tempdir, monkeypatch, lifting):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem("ThermalBlockEstimateErrorBatch", ReducedBasis, lifting)
+    for n in range(1, reduced_problem.N + 1):
+        error_estimators = reduced_problem._estimate_error_batch(online_mus, n)
+        assert error_estimators.shape == (len(online_mus), )
+        for (mu, error_estimator) in zip(online_mus, error_estimators):
+            reduced_problem.set_mu(mu)
+            reduced_problem.solve(n)
+            assert allclose(error_estimator, reduced_problem.estimate_error())
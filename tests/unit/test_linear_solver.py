@@ -4,8 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import dot, isclose
-from numpy.linalg import norm as monitor_norm
+from numpy import allclose, array, dot, isclose
+from numpy.linalg import LinAlgError, norm as monitor_norm, solve
+import pytest
 import matplotlib
 import matplotlib.pyplot as plt
 from dolfin import (assemble, DirichletBC, DOLFIN_EPS, dx, Expression, FunctionSpace, grad, inner, IntervalMesh, pi,
@@ -178,3 +179,60 @@ def test_linear_solver():
         error_dense = _test_linear_solver_dense(V, a, f, X, exact_solution)
         assert isclose(error_dense, error_sparse_tensor_callbacks)
         assert isclose(error_dense, error_sparse_form_callbacks)
+
+
+# ~~~ Dense factorizations ~~~ #
+def _solve_dense(A_array, F_array, parameters=None):
+    from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+    A = Matrix(*A_array.shape)
+    A[:, :] = A_array
+    F = Vector(*F_array.shape)
+    F[:] = F_array
+    solution = Function(*F_array.shape)
+    solver = LinearSolver(A, solution, F)
+    if parameters is not None:
+        solver.set_parameters(parameters)
+    solver.solve()
+    return array(solution.vector())
+
+
+def test_linear_solver_dense_nearly_symmetric():
+    # Close to its transpose within the default tolerances of allclose, but not symmetric:
+    # a Cholesky factorization would only read one triangle and return a wrong solution
+    A_array = array([[2.e-6, 1.e-9], [0., 1.e-6]])
+    F_array = array([1., 1.])
+    assert allclose(_solve_dense(A_array, F_array), solve(A_array, F_array), rtol=1.e-12, atol=0.)
+
+
+def test_linear_solver_dense_symmetric():
+    A_array = array([[4., 1., 0.], [1., 3., 1.], [0., 1., 2.]])
+    F_array = array([1., 2., 3.])
+    assert allclose(_solve_dense(A_array, F_array), solve(A_array, F_array))
+    assert allclose(_solve_dense(A_array, F_array, {"symmetric": True}), solve(A_array, F_array))
+
+
+def test_linear_solver_dense_singular():
+    A_array = array([[1., 2.], [2., 4.]])
+    F_array = array([1., 1.])
+    with pytest.raises(LinAlgError):
+        _solve_dense(A_array, F_array)
+
+
+def test_linear_solver_dense_factorization_cache():
+    from rbnics.backends.online.numpy import LinearSolver
+
+    def cache_length():
+        if LinearSolver._factorization_cache is None:
+            return 0
+        else:
+            return len(LinearSolver._factorization_cache)
+
+    A_array = array([[5., 1.], [2., 6.]])
+    initial_cache_length = cache_length()
+    # Parameter dependent operators are not stored in the cache
+    _solve_dense(A_array, array([1., 2.]))
+    assert cache_length() == initial_cache_length
+    # Parameter independent operators are factorized once
+    for F_array in (array([1., 2.]), array([3., 4.])):
+        assert allclose(_solve_dense(A_array, F_array, {"parameter_independent": True}), solve(A_array, F_array))
+        assert cache_length() == initial_cache_length + 1
@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import dot, isclose
+import pytest
+from numpy import allclose, array, dot, isclose
 from numpy.linalg import norm as monitor_norm
 import matplotlib
 import matplotlib.pyplot as plt
@@ -117,7 +118,7 @@ def _test_nonlinear_solver_sparse(callback_type):
 
 
 # ~~~ Dense case ~~~ #
-def _test_nonlinear_solver_dense(V, u, r, j, X, sparse_initial_guess, exact_solution):
+def _test_nonlinear_solver_dense(V, u, r, j, X, sparse_initial_guess, exact_solution, solver_parameters=None):
     from rbnics.backends.online.numpy import Function, NonlinearSolver, Matrix, Vector
 
     # Define boundary condition
@@ -191,6 +192,8 @@ def _test_nonlinear_solver_dense(V, u, r, j, X, sparse_initial_guess, exact_solu
         "maximum_iterations": 20,
         "report": True
     })
+    if solver_parameters is not None:
+        solver.set_parameters(solver_parameters)
     solver.solve()
 
     # Compute the error
@@ -203,7 +206,7 @@ def _test_nonlinear_solver_dense(V, u, r, j, X, sparse_initial_guess, exact_solu
     error_norm = dot(error.vector(), dot(X.array(), error.vector()))
     print("Dense error:", error_norm)
     assert isclose(error_norm, 0., atol=1.e-5)
-    return error_norm
+    return (error_norm, array(solution.vector(), dtype=float))
 
 
 # ~~~ Test function ~~~ #
@@ -213,6 +216,27 @@ def test_nonlinear_solver():
     (error_sparse_form_callbacks, _, _, _, _, _, _, _) = _test_nonlinear_solver_sparse("form callbacks")
     assert isclose(error_sparse_tensor_callbacks, error_sparse_form_callbacks)
     if V.mesh().mpi_comm().size == 1:  # dense solver is not partitioned
-        error_dense = _test_nonlinear_solver_dense(V, u, r, j, X, sparse_initial_guess, exact_solution)
+        (error_dense, _) = _test_nonlinear_solver_dense(V, u, r, j, X, sparse_initial_guess, exact_solution)
         assert isclose(error_dense, error_sparse_tensor_callbacks)
         assert isclose(error_dense, error_sparse_form_callbacks)
+
+
+# ~~~ Test function for jacobian reuse in the dense case ~~~ #
+@pytest.mark.parametrize("jacobian_update", ["modified newton", "broyden"])
+def test_nonlinear_solver_jacobian_reuse(jacobian_update):
+    (_, V, u, r, j, X, sparse_initial_guess, exact_solution) = _test_nonlinear_solver_sparse("tensor callbacks")
+    if V.mesh().mpi_comm().size == 1:  # dense solver is not partitioned
+        solver_parameters = {
+            "absolute_tolerance": 1.e-10,
+            "maximum_iterations": 50
+        }
+        (error_newton, solution_newton) = _test_nonlinear_solver_dense(
+            V, u, r, j, X, sparse_initial_guess, exact_solution, solver_parameters)
+        solver_parameters.update({
+            "jacobian_update": jacobian_update,
+            "maximum_jacobian_reuses": 3
+        })
+        (error_reuse, solution_reuse) = _test_nonlinear_solver_dense(
+            V, u, r, j, X, sparse_initial_guess, exact_solution, solver_parameters)
+        assert isclose(error_reuse, error_newton)
+        assert allclose(solution_reuse, solution_newton, atol=1.e-8)
@@ -0,0 +1,94 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import allclose, asarray, einsum, eye, load
+from numpy.random import default_rng
+from rbnics.backends import product, sum
+from rbnics.backends.online import (OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver, OnlineMatrix,
+                                    OnlineVector)
+
+"""
+Save and load of online affine expansion storages, which are loaded as read-only views of a memory mapped array
+"""
+
+
+def _generate_storages(N, Q):
+    random_generator = default_rng(0)
+    A = OnlineAffineExpansionStorage(Q)
+    F = OnlineAffineExpansionStorage(Q)
+    A_content = random_generator.standard_normal((Q, N, N)) + N * eye(N)
+    F_content = random_generator.standard_normal((Q, N))
+    for q in range(Q):
+        A_q = OnlineMatrix(N, N)
+        A_q[:, :] = A_content[q]
+        A[q] = A_q
+        F_q = OnlineVector(N)
+        F_q[:] = F_content[q]
+        F[q] = F_q
+    S = OnlineAffineExpansionStorage(Q, Q)
+    for p in range(Q):
+        for q in range(Q):
+            S[p, q] = float(F_content[p].dot(F_content[q]))
+    return (A, F, S, A_content, F_content)
+
+
+@pytest.mark.parametrize("Q", [1, 3])
+def test_online_affine_expansion_storage_save_load(tempdir, Q):
+    N = 6
+    (A, F, S, A_content, F_content) = _generate_storages(N, Q)
+    A.save(tempdir, "A")
+    F.save(tempdir, "F")
+    S.save(tempdir, "S")
+    # Items are saved in a single array
+    assert allclose(load(os.path.join(tempdir, "A", "content.npy")), A_content)
+    assert allclose(load(os.path.join(tempdir, "F", "content.npy")), F_content)
+
+    # Load back
+    A_loaded = OnlineAffineExpansionStorage(Q)
+    F_loaded = OnlineAffineExpansionStorage(Q)
+    S_loaded = OnlineAffineExpansionStorage(Q, Q)
+    assert A_loaded.load(tempdir, "A")
+    assert F_loaded.load(tempdir, "F")
+    assert S_loaded.load(tempdir, "S")
+    for q in range(Q):
+        assert allclose(asarray(A_loaded[q]), A_content[q])
+        assert allclose(asarray(F_loaded[q]), F_content[q])
+        for p in range(Q):
+            assert isinstance(S_loaded[p, q], float)
+            assert S_loaded[p, q] == S[p, q]
+
+    # Loaded items, and their contiguous slices, are read-only
+    for q in range(Q):
+        assert not A_loaded[q].content.flags.writeable
+        assert not F_loaded[q].content.flags.writeable
+        with pytest.raises(ValueError):
+            A_loaded[q][0, 0] = 0.
+        with pytest.raises(ValueError):
+            F_loaded[q][0] = 0.
+    A_loaded_N = A_loaded[:N - 1, :N - 1]
+    F_loaded_N = F_loaded[:N - 1]
+    for q in range(Q):
+        assert not A_loaded_N[q].content.flags.writeable
+        assert not F_loaded_N[q].content.flags.writeable
+
+    # Assembly of the (writable) online system, and solution with a Dirichlet boundary condition which replaces
+    # rows of the assembled matrix, leave loaded items unchanged
+    theta = tuple(float(q + 1) for q in range(Q))
+    lhs = sum(product(theta, A_loaded_N))
+    rhs = sum(product(theta, F_loaded_N))
+    assert allclose(asarray(lhs), einsum("q,qij->ij", theta, A_content[:, :N - 1, :N - 1]))
+    assert allclose(asarray(rhs), einsum("q,qi->i", theta, F_content[:, :N - 1]))
+    solution = OnlineFunction(N - 1)
+    solver = OnlineLinearSolver(lhs, solution, rhs, (2., ))
+    solver.solve()
+    assert allclose(asarray(solution.vector())[0], 2.)
+    for q in range(Q):
+        assert allclose(asarray(A_loaded[q]), A_content[q])
+        assert allclose(asarray(F_loaded[q]), F_content[q])
+    assert allclose(load(os.path.join(tempdir, "A", "content.npy")), A_content)
+    assert allclose(load(os.path.join(tempdir, "F", "content.npy")), F_content)
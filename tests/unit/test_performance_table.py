@@ -0,0 +1,54 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.io import ErrorAnalysisTable
+
+
+def _generate_table(testing_set, Nmin=1, Nmax=3):
+    table = ErrorAnalysisTable(testing_set)
+    table.set_Nmin(Nmin)
+    table.set_Nmax(Nmax)
+    table.add_column("error", group_name="solution_error", operations=("mean", "max"))
+    table.add_column("error_output", group_name="output_error", operations=("mean", "max"))
+    return table
+
+
+# Test that rows copied by get_row and set_row reproduce the original table, including not implemented entries
+def test_performance_table_get_set_row():
+    testing_set = [(1., ), (2., ), (3., ), (4., )]
+    table = _generate_table(testing_set)
+    for mu_index in range(len(testing_set)):
+        for n in range(1, 4):
+            table["error", n, mu_index] = 10.**(- n) * (mu_index + 1)
+            table["error_output", n, mu_index] = NotImplemented
+    table_copy = _generate_table(testing_set)
+    for mu_index in reversed(range(len(testing_set))):
+        row = table.get_row(mu_index)
+        assert table_copy.has_row_shape(row)
+        table_copy.set_row(mu_index, row)
+    for mu_index in range(len(testing_set)):
+        for n in range(1, 4):
+            assert table_copy["error", n, mu_index] == table["error", n, mu_index]
+        (_, column_not_implemented, rows_not_implemented) = table_copy.get_row(mu_index)["error_output"]
+        assert column_not_implemented is True
+        assert all(rows_not_implemented.values())
+    assert str(table_copy) == str(table)
+
+
+# Test that rows of tables with different columns or N range are detected
+def test_performance_table_has_row_shape():
+    testing_set = [(1., ), (2., )]
+    table = _generate_table(testing_set)
+    for mu_index in range(len(testing_set)):
+        for n in range(1, 4):
+            table["error", n, mu_index] = 1.
+            table["error_output", n, mu_index] = 1.
+    row = table.get_row(0)
+    assert not _generate_table(testing_set, Nmax=4).has_row_shape(row)
+    other_columns_table = ErrorAnalysisTable(testing_set)
+    other_columns_table.set_Nmax(3)
+    other_columns_table.add_column("error", group_name="solution_error", operations=("mean", "max"))
+    assert not other_columns_table.has_row_shape(row)
@@ -0,0 +1,96 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import itertools
+import pytest
+from numpy import allclose, isclose
+from dolfin import assemble, dx, Expression, FunctionSpace, interpolate, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics.backends.dolfin import ProperOrthogonalDecomposition
+
+"""
+Comparison of the POD computed by the randomized range finder, the streaming correlation matrix and the
+incremental singular value decomposition to the one computed by the eigensolver, on snapshots of a smooth
+parametrized function
+"""
+
+
+def _generate_space_and_inner_product():
+    mesh = UnitSquareMesh(10, 10)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return (V, assemble(u * v * dx))
+
+
+def _generate_snapshots(V):
+    snapshot = Expression("1./(1. + a*x[0]*x[0] + b*x[1]*x[1])", a=0., b=0., degree=2)
+    snapshots = list()
+    for (a, b) in itertools.product([0.5, 1., 2., 4.], repeat=2):
+        snapshot.a = a
+        snapshot.b = b
+        snapshots.append(interpolate(snapshot, V))
+    return snapshots
+
+
+def _apply_proper_orthogonal_decomposition(V, inner_product, snapshots, Nmax, parameters=None):
+    POD = ProperOrthogonalDecomposition(V, inner_product)
+    if parameters is not None:
+        POD.set_parameters(parameters)
+    for snapshot in snapshots:
+        POD.store_snapshot(snapshot)
+    return POD.apply(Nmax, 0.)
+
+
+def _inner(inner_product, b1, b2):
+    return b1.vector().inner(inner_product * b2.vector())
+
+
+def _assert_same_proper_orthogonal_decomposition(inner_product, expected, computed, rtol, atol):
+    (expected_eigenvalues, _, expected_basis_functions, expected_N) = expected
+    (eigenvalues, _, basis_functions, N) = computed
+    assert N == expected_N
+    assert len(basis_functions) == N
+    assert allclose(eigenvalues, expected_eigenvalues, rtol=rtol, atol=atol * expected_eigenvalues[0])
+    for (expected_b, b) in zip(expected_basis_functions, basis_functions):
+        # basis functions are unique up to their sign
+        assert isclose(abs(_inner(inner_product, expected_b, b)), 1., atol=atol)
+
+
+# Randomized, streaming and incremental POD
+@pytest.mark.parametrize("parameters", [
+    {"method": "randomized", "seed": 0},
+    {"method": "eigensolver", "correlation": "streaming"},
+    {"method": "randomized", "correlation": "streaming", "seed": 0},
+    {"method": "incremental"}
+])
+def test_proper_orthogonal_decomposition(parameters):
+    (V, inner_product) = _generate_space_and_inner_product()
+    snapshots = _generate_snapshots(V)
+    Nmax = 4
+    expected = _apply_proper_orthogonal_decomposition(V, inner_product, snapshots, Nmax)
+    assert expected[3] == Nmax
+    computed = _apply_proper_orthogonal_decomposition(V, inner_product, snapshots, Nmax, parameters)
+    _assert_same_proper_orthogonal_decomposition(inner_product, expected, computed, 1.e-8, 1.e-6)
+
+
+# Randomized and incremental POD with no snapshots, and incremental POD with zero snapshots
+@pytest.mark.parametrize("method, zero_snapshots", [
+    ("randomized", False),
+    ("incremental", False),
+    ("incremental", True)
+])
+def test_proper_orthogonal_decomposition_no_eigenvalues(method, zero_snapshots):
+    (V, inner_product) = _generate_space_and_inner_product()
+    if zero_snapshots:
+        snapshots = [interpolate(Expression("0.", degree=0), V) for _ in range(3)]
+    else:
+        snapshots = list()
+    (eigenvalues, eigenvectors, basis_functions, N) = _apply_proper_orthogonal_decomposition(
+        V, inner_product, snapshots, 4, {"method": method})
+    assert N == 0
+    assert len(eigenvalues) == 0
+    assert len(eigenvectors) == 0
+    assert len(basis_functions) == 0
@@ -0,0 +1,52 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import json
+import pytest
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from numpy import allclose, array
+from rbnics import ReducedBasis
+from rbnics.problems.base import ReducedProblemServer
+from thermal_block import generate_thermal_block_reduced_problem, online_mus
+
+
+# Reduced problem server, queried both directly and through its HTTP interface
+def test_reduced_problem_server(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem("ThermalBlockServer", ReducedBasis)
+    expected_solutions = reduced_problem.solve_many(online_mus)
+    expected_error_estimators = reduced_problem.estimate_error_many(online_mus)
+    server = ReducedProblemServer(reduced_problem)
+    try:
+        # Concurrent queries, which may be evaluated by the server as a single batch
+        solve_futures = [server.submit_solve_many([mu]) for mu in online_mus]
+        error_estimator_futures = [server.submit_estimate_error_many([mu]) for mu in online_mus]
+        for (future, expected_solution) in zip(solve_futures, expected_solutions):
+            assert allclose(future.result()[0], expected_solution)
+        for (future, expected_error_estimator) in zip(error_estimator_futures, expected_error_estimators):
+            assert allclose(future.result()[0], expected_error_estimator)
+
+        # HTTP round trip
+        (host, port) = server.serve()
+
+        def post(path, query):
+            request = Request("http://" + host + ":" + str(port) + path, data=json.dumps(query).encode("utf-8"),
+                              headers={"Content-Type": "application/json"})
+            with urlopen(request) as response:
+                return array(json.loads(response.read().decode("utf-8"))["result"])
+
+        query = {"mus": [list(mu) for mu in online_mus]}
+        assert allclose(post("/solve_many", query), expected_solutions)
+        assert allclose(post("/estimate_error_many", query), expected_error_estimators)
+        with pytest.raises(HTTPError) as invalid_path:
+            post("/solve", query)
+        assert invalid_path.value.code == 404
+        with pytest.raises(HTTPError) as invalid_query:
+            post("/solve_many", {})
+        assert invalid_query.value.code == 400
+    finally:
+        server.shutdown()
@@ -4,14 +4,17 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from math import log
+import os
+from math import log, sin
 from numpy import linspace, random
 import scipy.stats as stats
 import matplotlib
 import matplotlib.pyplot as plt
 from distutils.version import LooseVersion
 from rbnics.sampling import ParameterSpaceSubset
-from rbnics.sampling.distributions import DrawFrom, EquispacedDistribution, LogUniformDistribution, UniformDistribution
+from rbnics.sampling.distributions import (DrawFrom, EquispacedDistribution, LatinHypercubeDistribution,
+                                           LogScaledDistribution, LogUniformDistribution, MaximinDistribution,
+                                           SobolDistribution, UniformDistribution)
 
 # Common data
 box = [(2., 5.), (10., 1000.)]
@@ -186,3 +189,116 @@ def test_sampling_composite_log_uniform_and_beta():
     plot(0, box, parameter_space_subset, bins, stats_loguniform, loc=box[0][min], scale=box[0][max] - box[0][min])
     plot(1, box, parameter_space_subset, bins, stats.beta, a=2, b=5, loc=box[1][min], scale=box[1][max] - box[1][min])
     plt.show()
+
+
+# Sobol generator
+def test_sampling_sobol():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, n, sampling=SobolDistribution(seed=1))
+    plot(0, box, parameter_space_subset, bins, stats.uniform, loc=box[0][min], scale=box[0][max] - box[0][min])
+    plot(1, box, parameter_space_subset, bins, stats.uniform, loc=box[1][min], scale=box[1][max] - box[1][min])
+    plt.show()
+
+
+# Composite Sobol and log scaled maximin Latin hypercube generator
+def test_sampling_composite_sobol_and_log_maximin_latin_hypercube():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, n, sampling=(
+        SobolDistribution(), LogScaledDistribution(MaximinDistribution(LatinHypercubeDistribution(), 2))))
+    plot(0, box, parameter_space_subset, bins, stats.uniform, loc=box[0][min], scale=box[0][max] - box[0][min])
+    plot(1, box, parameter_space_subset, bins, stats_loguniform, loc=box[1][min], scale=box[1][max] - box[1][min])
+    plt.show()
+
+
+# Maximin generator on a box with a degenerate component
+def test_sampling_maximin_degenerate_box():
+    degenerate_box = [(2., 5.), (3., 3.)]
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(degenerate_box, 100, sampling=MaximinDistribution(UniformDistribution(seed=1)))
+    assert len(parameter_space_subset) == 100
+    assert len(set(parameter_space_subset)) == 100
+    for mu in parameter_space_subset:
+        assert degenerate_box[0][0] <= mu[0] <= degenerate_box[0][1]
+        assert mu[1] == 3.
+
+
+# Closest parameters, compared to a linear scan over the set
+def test_sampling_closest():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 100)
+    parameter_space_subset.set_distance_scaling(("linear", "log"))
+    mus = [(3., 20.), (4.5, 500.)]
+    for (mu, closest_mu) in zip(mus, parameter_space_subset.closest_many(5, mus)):
+        distances = [(xi[0] - mu[0])**2 + (log(xi[1]) - log(mu[1]))**2 for xi in parameter_space_subset]
+        expected = [xi for (_, xi) in sorted(zip(distances, parameter_space_subset))[:5]]
+        assert list(closest_mu) == expected
+        assert list(parameter_space_subset.closest(5, mu)) == expected
+
+
+# Uniform generator with an explicit seed
+def test_sampling_uniform_seed():
+    parameter_space_subset_1 = ParameterSpaceSubset()
+    parameter_space_subset_1.generate(box, n, sampling=UniformDistribution(seed=1))
+    parameter_space_subset_2 = ParameterSpaceSubset()
+    parameter_space_subset_2.generate(box, n, sampling=UniformDistribution(seed=1))
+    assert list(parameter_space_subset_1) == list(parameter_space_subset_2)
+
+
+# Vectorized maximum, compared to the maximum computed one parameter at a time
+def test_sampling_max_vectorized():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 100)
+
+    def generator(mu):
+        return sin(mu[0]) * log(mu[1])
+
+    def vectorized_generator(mus):
+        return [generator(mu) for mu in mus]
+
+    (value_max, index_max) = parameter_space_subset.max(generator)
+    (vectorized_value_max, vectorized_index_max) = parameter_space_subset.max(vectorized_generator, vectorized=True)
+    assert vectorized_index_max == index_max
+    assert vectorized_value_max == value_max
+
+
+# Test generation of an empty set, also when the distribution returns an empty list
+def test_sampling_empty():
+    class EmptyListDistribution(UniformDistribution):
+        def sample(self, box, n):
+            if n == 0:
+                return []
+            else:
+                return UniformDistribution.sample(self, box, n)
+
+    for sampling in (UniformDistribution(), EmptyListDistribution()):
+        parameter_space_subset = ParameterSpaceSubset()
+        parameter_space_subset.generate(box, 0, sampling)
+        assert len(parameter_space_subset) == 0
+        parameter_space_subset.generate(box, 10, sampling)
+        assert len(parameter_space_subset) == 10
+
+
+# Test composite generators with a user defined distribution, which returns a list of tuples
+def test_sampling_composite_list_of_tuples():
+    class ListOfTuplesDistribution(UniformDistribution):
+        def sample(self, box, n):
+            return [tuple(mu) for mu in UniformDistribution.sample(self, box, n)]
+
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 100, sampling=(ListOfTuplesDistribution(), UniformDistribution()))
+    assert len(parameter_space_subset) == 100
+    for mu in parameter_space_subset:
+        for (p, mu_p) in enumerate(mu):
+            assert box[p][min] <= mu_p <= box[p][max]
+
+
+# Test that sets of numbers are saved both in binary and text format, and loaded back
+def test_sampling_save_load(tempdir):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 100)
+    parameter_space_subset.save(tempdir, "parameter_space_subset")
+    assert os.path.isfile(os.path.join(tempdir, "parameter_space_subset.npy"))
+    assert os.path.isfile(os.path.join(tempdir, "parameter_space_subset.txt"))
+    loaded_parameter_space_subset = ParameterSpaceSubset()
+    loaded_parameter_space_subset.load(tempdir, "parameter_space_subset")
+    assert list(loaded_parameter_space_subset) == list(parameter_space_subset)
@@ -0,0 +1,38 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose, array
+from rbnics import ReducedBasis
+from rbnics.sampling.distributions import EquispacedDistribution
+from thermal_block import generate_thermal_block_reduction_method, ThermalBlockSCM
+
+
+def _generate_reduction_method(name):
+    reduction_method = generate_thermal_block_reduction_method(
+        name, ReducedBasis, Nmax=2, Problem=ThermalBlockSCM, mu_range=[(0.1, 10.)])
+    reduction_method.set_Nmax(2, SCM=4)
+    reduction_method.set_tolerance(0., SCM=0.)
+    return reduction_method
+
+
+# SCM greedy and lower bounds with linear programs solved by a process pool, compared to serial ones
+def test_lower_bounds_pool(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    greedy_selected_parameters = list()
+    stability_factor_lower_bounds = list()
+    testing_set = [(0.2, ), (1.5, ), (4., ), (9., )]
+    for lower_bounds_pool_size in (None, 2):
+        reduction_method = _generate_reduction_method("ThermalBlockSCMPool" + str(lower_bounds_pool_size))
+        reduction_method.SCM_reduction.set_lower_bounds_pool_size(lower_bounds_pool_size)
+        reduction_method.initialize_training_set(4, SCM=20, sampling=EquispacedDistribution())
+        reduction_method.offline()
+        SCM_approximation = reduction_method.SCM_reduction.SCM_approximation
+        greedy_selected_parameters.append(array(list(SCM_approximation.greedy_selected_parameters)))
+        stability_factor_lower_bounds.append(SCM_approximation.get_stability_factor_lower_bounds(
+            testing_set, pool_size=lower_bounds_pool_size))
+    assert greedy_selected_parameters[0].shape == greedy_selected_parameters[1].shape
+    assert allclose(greedy_selected_parameters[0], greedy_selected_parameters[1])
+    assert allclose(stability_factor_lower_bounds[0], stability_factor_lower_bounds[1])
@@ -0,0 +1,47 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose
+from rbnics import PODGalerkin
+from rbnics.sampling.distributions import EquispacedDistribution
+from thermal_block import generate_thermal_block_reduction_method
+
+
+def _offline(name, snapshots_pool_size, lifting):
+    reduction_method = generate_thermal_block_reduction_method(name, PODGalerkin, lifting)
+    reduction_method.initialize_training_set(9, sampling=EquispacedDistribution())
+    reduction_method.set_snapshots_pool_size(snapshots_pool_size)
+    # Count truth solves in the current process, since workers of the pool own a copy of the truth problem
+    truth_problem = reduction_method.truth_problem
+    truth_solve = truth_problem._solve
+    truth_solves = list()
+
+    def counting_truth_solve(**kwargs):
+        truth_solves.append(truth_problem.mu)
+        return truth_solve(**kwargs)
+
+    truth_problem._solve = counting_truth_solve
+    reduction_method.offline()
+    return (reduction_method, truth_solves)
+
+
+# Snapshots computed by a process pool are the same as the ones computed in the current process
+def test_snapshots_pool(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    for lifting in (False, True):
+        suffix = "Lifting" if lifting else ""
+        (serial_reduction_method, serial_truth_solves) = _offline("ThermalBlockSnapshotsSerial" + suffix, None, lifting)
+        (pool_reduction_method, pool_truth_solves) = _offline("ThermalBlockSnapshotsPool" + suffix, 2, lifting)
+        # Snapshots were read back from the disk cache, rather than being computed again
+        assert len(serial_truth_solves) >= len(serial_reduction_method.training_set)
+        assert len(pool_truth_solves) == len(serial_truth_solves) - len(serial_reduction_method.training_set)
+        # Snapshots are stored in training set order
+        serial_snapshots = serial_reduction_method.POD.snapshots_matrix
+        pool_snapshots = pool_reduction_method.POD.snapshots_matrix
+        assert len(pool_snapshots) == len(serial_snapshots)
+        for (serial_snapshot, pool_snapshot) in zip(serial_snapshots, pool_snapshots):
+            assert allclose(pool_snapshot.vector().get_local(), serial_snapshot.vector().get_local())
+        assert allclose(list(pool_reduction_method.POD.eigenvalues), list(serial_reduction_method.POD.eigenvalues))
@@ -0,0 +1,51 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, asarray
+from rbnics import ReducedBasis
+from thermal_block import generate_thermal_block_reduced_problem, online_mus, ThermalBlockCustomSolve
+
+
+# Solves and error estimators for all reduced dimensions at once, compared to one dimension at a time
+@pytest.mark.parametrize("lifting", (False, True))
+def test_solve_all_sizes(tempdir, monkeypatch, lifting):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem("ThermalBlockSolveAllSizes", ReducedBasis, lifting)
+    N = reduced_problem.N
+    N_bc = reduced_problem.N_bc
+    assert N_bc == (1 if lifting else 0)
+    for mu in online_mus:
+        reduced_problem.set_mu(mu)
+        solutions = reduced_problem.solve_all_sizes()
+        error_estimators = reduced_problem.estimate_error_all_sizes()
+        assert len(solutions) == N
+        assert len(error_estimators) == N
+        # Clear the cache filled by solve_all_sizes, so that reduced problems are actually solved again
+        reduced_problem._solution_cache.clear()
+        for (n, solution, error_estimator) in zip(range(1, N + 1), solutions, error_estimators):
+            expected_solution = reduced_problem.solve(n)
+            assert solution.N == n + N_bc
+            assert allclose(asarray(solution.vector(), dtype=float), asarray(expected_solution.vector(), dtype=float))
+            assert allclose(error_estimator, reduced_problem.estimate_error())
+
+
+# Reduced problems which customize the online solve by overriding _solve are solved one dimension at a time,
+# so that solve_all_sizes returns the customized solutions
+def test_solve_all_sizes_custom_solve(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem(
+        "ThermalBlockSolveAllSizesCustomSolve", ReducedBasis, Problem=ThermalBlockCustomSolve)
+    N = reduced_problem.N
+    assert reduced_problem._solve_all_sizes(N) is NotImplemented
+    for mu in online_mus:
+        reduced_problem.set_mu(mu)
+        solutions = reduced_problem.solve_all_sizes()
+        assert len(solutions) == N
+        reduced_problem._solution_cache.clear()
+        for (n, solution) in zip(range(1, N + 1), solutions):
+            expected_solution = reduced_problem.solve(n)
+            assert allclose(asarray(solution.vector(), dtype=float), asarray(expected_solution.vector(), dtype=float))
@@ -0,0 +1,49 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, asarray
+from rbnics import ReducedBasis
+from rbnics.problems.nonlinear_elliptic import NonlinearEllipticPODGalerkinReducedProblem
+from rbnics.problems.parabolic import ParabolicCoercivePODGalerkinReducedProblem
+from thermal_block import generate_thermal_block_reduced_problem, online_mus, ThermalBlockCustomSolve
+
+
+# Batched solves and error estimators, compared to one solve at a time
+@pytest.mark.parametrize("lifting", (False, True))
+def test_solve_many(tempdir, monkeypatch, lifting):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem("ThermalBlockSolveMany", ReducedBasis, lifting)
+    solutions = reduced_problem.solve_many(online_mus)
+    error_estimators = reduced_problem.estimate_error_many(online_mus)
+    assert solutions.shape == (len(online_mus), reduced_problem.N + reduced_problem.N_bc)
+    assert error_estimators.shape == (len(online_mus), )
+    for (mu, solution, error_estimator) in zip(online_mus, solutions, error_estimators):
+        reduced_problem.set_mu(mu)
+        assert allclose(solution, asarray(reduced_problem.solve().vector(), dtype=float).reshape(-1))
+        assert allclose(error_estimator, reduced_problem.estimate_error())
+
+
+# Reduced problems which customize the online solve by overriding _solve are solved one parameter at a time,
+# so that solve_many returns the customized solutions
+def test_solve_many_custom_solve(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem(
+        "ThermalBlockSolveManyCustomSolve", ReducedBasis, Problem=ThermalBlockCustomSolve)
+    assert reduced_problem._solve_many(online_mus, reduced_problem.N) is NotImplemented
+    solutions = reduced_problem.solve_many(online_mus)
+    error_estimators = reduced_problem.estimate_error_many(online_mus)
+    reduced_problem._solution_cache.clear()
+    for (mu, solution, error_estimator) in zip(online_mus, solutions, error_estimators):
+        reduced_problem.set_mu(mu)
+        assert allclose(solution, asarray(reduced_problem.solve().vector(), dtype=float).reshape(-1))
+        assert allclose(error_estimator, reduced_problem.estimate_error())
+
+
+# Batched solves carried out on stacked dense arrays only hold for linear steady problems
+def test_solve_many_not_available():
+    for ReducedProblem in (NonlinearEllipticPODGalerkinReducedProblem, ParabolicCoercivePODGalerkinReducedProblem):
+        assert ReducedProblem._solve_many(None, online_mus, 2) is NotImplemented
@@ -0,0 +1,80 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, asarray, tensordot
+from numpy.linalg import solve
+from rbnics import CustomizeReducedProblemFor, EllipticCoerciveProblem, ReducedBasis
+from thermal_block import generate_thermal_block_reduced_problem, online_mus, ThermalBlock, ThermalBlockCustomSolve
+
+
+# Same problem, with thetas memoized in the reduced problem. Reduced problems can only be customized for
+# abstract problems, hence the customization is attached to an abstract base class
+class ThermalBlockCacheThetasBase(EllipticCoerciveProblem):
+    pass
+
+
+@CustomizeReducedProblemFor(ThermalBlockCacheThetasBase)
+def CustomizeReducedThermalBlockCacheThetas(ReducedThermalBlock_Base):
+    class ReducedThermalBlockCacheThetas(ReducedThermalBlock_Base):
+        def __init__(self, truth_problem, **kwargs):
+            ReducedThermalBlock_Base.__init__(self, truth_problem, **kwargs)
+            self.cache_thetas = True
+
+    return ReducedThermalBlockCacheThetas
+
+
+class ThermalBlockCacheThetas(ThermalBlock, ThermalBlockCacheThetasBase):
+    pass
+
+
+# Thetas which depend on a state of the truth problem other than the parameter, changed while solving the
+# reduced problem, are not memoized by default
+def test_theta_cache_state_dependent(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem(
+        "ThermalBlockThetaCacheStateDependent", ReducedBasis, Problem=ThermalBlockCustomSolve)
+    assert not reduced_problem.cache_thetas
+    reduced_problem._precompute_thetas(online_mus)
+    assert len(reduced_problem._theta_cache) == 0
+    N = reduced_problem.N
+    A = asarray(reduced_problem.operator["a"][:N, :N], dtype=float)
+    F = asarray(reduced_problem.operator["f"][:N], dtype=float)
+    for mu in online_mus:
+        reduced_problem.set_mu(mu)
+        # The customized solve doubles the source term
+        expected_solution = solve(tensordot(reduced_problem.compute_theta("a"), A, 1), 2. * F[0])
+        assert allclose(asarray(reduced_problem.solve().vector(), dtype=float), expected_solution)
+        assert reduced_problem.compute_theta("f") == (1., )
+        reduced_problem.truth_problem.source_scaling = 3.
+        assert reduced_problem.compute_theta("f") == (3., )
+        reduced_problem.truth_problem.source_scaling = 1.
+    assert len(reduced_problem._theta_cache) == 0
+
+
+# Thetas memoized on request, and evaluated as a batch for all parameters
+def test_theta_cache_enabled(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    reduced_problem = generate_thermal_block_reduced_problem(
+        "ThermalBlockThetaCacheEnabled", ReducedBasis, Problem=ThermalBlockCacheThetas)
+    assert reduced_problem.cache_thetas
+    reduced_problem._theta_cache.clear()
+    reduced_problem._precompute_thetas(online_mus)
+    assert len(reduced_problem._theta_cache) == 2 * len(online_mus)  # "a" and "f", but not the missing output
+    hits = reduced_problem._theta_cache.statistics()["hits"]
+    for mu in online_mus:
+        reduced_problem.set_mu(mu)
+        assert reduced_problem.compute_theta("a") == reduced_problem.truth_problem.compute_theta("a")
+        assert reduced_problem.compute_theta("f") == reduced_problem.truth_problem.compute_theta("f")
+    assert reduced_problem._theta_cache.statistics()["hits"] == hits + 2 * len(online_mus)
+
+    # Errors raised while evaluating thetas are not swallowed
+    def compute_theta_batch(term, mus):
+        raise ValueError("Invalid term for compute_theta().")
+
+    monkeypatch.setattr(reduced_problem.truth_problem, "compute_theta_batch", compute_theta_batch)
+    with pytest.raises(ValueError):
+        reduced_problem._precompute_thetas(online_mus)
@@ -0,0 +1,168 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from dolfin import (CompiledSubDomain, Constant, DirichletBC, FunctionSpace, grad, inner, Measure, MeshFunction,
+                    TestFunction, TrialFunction, UnitSquareMesh)
+from rbnics import CustomizeReducedProblemFor, EllipticCoerciveProblem, ExactParametrizedFunctions, SCM
+from rbnics.backends.dolfin.wrapping import (assemble_operator_for_stability_factor,
+                                             compute_theta_for_stability_factor,
+                                             generate_function_space_for_stability_factor)
+from rbnics.sampling.distributions import EquispacedDistribution
+
+"""
+Thermal block problem on the unit square, with the diffusivity of the left half as first parameter, shared by
+the tests of reduced problems and reduction methods.
+If lifting is enabled, the second parameter is the (non homogeneous) value of the temperature on the top side,
+so that the reduced basis also contains a lifting function (N_bc = 1).
+"""
+
+
+class ThermalBlockBase(EllipticCoerciveProblem):
+
+    def __init__(self, V, **kwargs):
+        self._name = kwargs["name"]
+        self._lifting = kwargs.get("lifting", False)
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+
+    def name(self):
+        return self._name
+
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            return (mu[0], 1.)
+        elif term == "f":
+            return (1.,)
+        elif term == "dirichlet_bc" and self._lifting:
+            return (mu[1],)
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    def assemble_operator(self, term):
+        v = self.v
+        dx = self.dx
+        if term == "a":
+            u = self.u
+            return (inner(grad(u), grad(v)) * dx(1), inner(grad(u), grad(v)) * dx(2))
+        elif term == "f":
+            ds = self.ds
+            return (v * ds(1),)
+        elif term == "dirichlet_bc":
+            if self._lifting:
+                return ([DirichletBC(self.V, Constant(1.0), self.boundaries, 3)],)
+            else:
+                return ([DirichletBC(self.V, Constant(0.0), self.boundaries, 3)],)
+        elif term == "inner_product":
+            u = self.u
+            return (inner(grad(u), grad(v)) * dx,)
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+
+
+# Thermal block problem with an exact stability factor
+@ExactParametrizedFunctions()
+class ThermalBlock(ThermalBlockBase):
+
+    def get_stability_factor_lower_bound(self):
+        return min(self.compute_theta("a"))
+
+
+# Thermal block problem with the stability factor approximated by SCM
+@SCM()
+class ThermalBlockSCM(ThermalBlockBase):
+
+    @generate_function_space_for_stability_factor
+    def __init__(self, V, **kwargs):
+        ThermalBlockBase.__init__(self, V, **kwargs)
+        self._eigen_solver_parameters.update({
+            "bounding_box_minimum": {
+                "problem_type": "gen_hermitian", "spectral_transform": "shift-and-invert",
+                "spectral_shift": 1.e-5, "linear_solver": "mumps"
+            },
+            "bounding_box_maximum": {
+                "problem_type": "gen_hermitian", "spectral_transform": "shift-and-invert",
+                "spectral_shift": 1.e5, "linear_solver": "mumps"
+            },
+            "stability_factor": {
+                "problem_type": "gen_hermitian", "spectral_transform": "shift-and-invert",
+                "spectral_shift": 1.e-5, "linear_solver": "mumps"
+            }
+        })
+
+    @compute_theta_for_stability_factor
+    def compute_theta(self, term):
+        return ThermalBlockBase.compute_theta(self, term)
+
+    @assemble_operator_for_stability_factor
+    def assemble_operator(self, term):
+        return ThermalBlockBase.assemble_operator(self, term)
+
+
+# Thermal block problem with a reduced problem which customizes the online solve by overriding _solve, as e.g.
+# online stabilization does: while solving the reduced problem, the source term is scaled by a factor which
+# is stored in the truth problem, rather than being a parameter. Reduced problems can only be customized for
+# abstract problems, hence the customization is attached to an abstract base class
+class ThermalBlockCustomSolveBase(EllipticCoerciveProblem):
+    pass
+
+
+@CustomizeReducedProblemFor(ThermalBlockCustomSolveBase)
+def CustomizeReducedThermalBlockCustomSolve(ReducedThermalBlock_Base):
+    class ReducedThermalBlockCustomSolve(ReducedThermalBlock_Base):
+        def _solve(self, N, **kwargs):
+            self.truth_problem.source_scaling = 2.
+            try:
+                ReducedThermalBlock_Base._solve(self, N, **kwargs)
+            finally:
+                self.truth_problem.source_scaling = 1.
+
+    return ReducedThermalBlockCustomSolve
+
+
+class ThermalBlockCustomSolve(ThermalBlock, ThermalBlockCustomSolveBase):
+
+    def __init__(self, V, **kwargs):
+        ThermalBlock.__init__(self, V, **kwargs)
+        self.source_scaling = 1.
+
+    def compute_theta(self, term):
+        if term == "f":
+            return (self.source_scaling,)
+        else:
+            return ThermalBlock.compute_theta(self, term)
+
+
+def generate_thermal_block_reduction_method(name, ReductionMethod, lifting=False, Nmax=4, Problem=ThermalBlock,
+                                            mu_range=None):
+    mesh = UnitSquareMesh(8, 8)
+    subdomains = MeshFunction("size_t", mesh, mesh.topology().dim(), 2)
+    CompiledSubDomain("x[0] <= 0.5 + DOLFIN_EPS").mark(subdomains, 1)
+    boundaries = MeshFunction("size_t", mesh, mesh.topology().dim() - 1, 0)
+    CompiledSubDomain("on_boundary && near(x[1], 0.)").mark(boundaries, 1)
+    CompiledSubDomain("on_boundary && near(x[1], 1.)").mark(boundaries, 3)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = Problem(V, subdomains=subdomains, boundaries=boundaries, name=name, lifting=lifting)
+    if mu_range is None:
+        mu_range = [(0.1, 10.), (0.5, 2.)]
+    problem.set_mu_range(mu_range)
+    reduction_method = ReductionMethod(problem)
+    reduction_method.set_Nmax(Nmax)
+    return reduction_method
+
+
+def generate_thermal_block_reduced_problem(name, ReductionMethod, lifting=False, Nmax=4, Problem=ThermalBlock):
+    reduction_method = generate_thermal_block_reduction_method(name, ReductionMethod, lifting, Nmax, Problem)
+    reduction_method.initialize_training_set(25, sampling=EquispacedDistribution())
+    return reduction_method.offline()
+
+
+# Parameters for online queries
+online_mus = [(0.5, 0.7), (2., 1.5), (8., 1.), (0.1, 2.)]